@@ -33,6 +33,89 @@ gym.register(
     disable_env_checker=True,
 )
 
+gym.register(
+    id="Isaac-Desktop-Organizer-Franka-IK-Rel-Fused-v0",
+    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": "desktop_organizer.envs.rl_env_cfg:FrankaDesktopOrganizerIKRelFusedEnvCfg",
+        "rsl_rl_cfg_entry_point": "desktop_organizer.config.ppo_cfg:DesktopOrganizerPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
+
+gym.register(
+    id="Isaac-Desktop-Organizer-Franka-IK-Rel-LeanObs-v0",
+    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": "desktop_organizer.envs.rl_env_cfg:FrankaDesktopOrganizerIKRelLeanObsEnvCfg",
+        "rsl_rl_cfg_entry_point": "desktop_organizer.config.ppo_cfg:DesktopOrganizerPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
+
+gym.register(
+    id="Isaac-Desktop-Organizer-Franka-IK-Rel-LeanObs-Play-v0",
+    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": "desktop_organizer.envs.rl_env_cfg:FrankaDesktopOrganizerIKRelLeanObsEnvCfg_PLAY",
+        "rsl_rl_cfg_entry_point": "desktop_organizer.config.ppo_cfg:DesktopOrganizerPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
+
+gym.register(
+    id="Isaac-Desktop-Organizer-Franka-IK-Rel-BCObs-v0",
+    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": "desktop_organizer.envs.rl_env_cfg:FrankaDesktopOrganizerIKRelBCObsEnvCfg",
+    },
+    disable_env_checker=True,
+)
+
+gym.register(
+    id="Isaac-Desktop-Organizer-Franka-IK-Rel-PrivilegedCritic-v0",
+    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": "desktop_organizer.envs.rl_env_cfg:FrankaDesktopOrganizerIKRelPrivilegedCriticEnvCfg",
+        "rsl_rl_cfg_entry_point": "desktop_organizer.config.ppo_cfg:DesktopOrganizerPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
+
+gym.register(
+    id="Isaac-Desktop-Organizer-Franka-IK-Rel-PrivilegedCritic-Play-v0",
+    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": (
+            "desktop_organizer.envs.rl_env_cfg:FrankaDesktopOrganizerIKRelPrivilegedCriticEnvCfg_PLAY"
+        ),
+        "rsl_rl_cfg_entry_point": "desktop_organizer.config.ppo_cfg:DesktopOrganizerPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
+
+gym.register(
+    id="Isaac-Desktop-Organizer-Franka-MultiObject-IK-Rel-v0",
+    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": "desktop_organizer.envs.multi_object_env_cfg:FrankaDesktopOrganizerMultiObjectIKRelEnvCfg",
+        "rsl_rl_cfg_entry_point": "desktop_organizer.config.ppo_cfg:DesktopOrganizerPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
+
+gym.register(
+    id="Isaac-Desktop-Organizer-Franka-MultiObject-IK-Rel-Play-v0",
+    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": (
+            "desktop_organizer.envs.multi_object_env_cfg:FrankaDesktopOrganizerMultiObjectIKRelEnvCfg_PLAY"
+        ),
+        "rsl_rl_cfg_entry_point": "desktop_organizer.config.ppo_cfg:DesktopOrganizerPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
+
 # ========== Mimic Environment Registration ==========
 
 gym.register(
@@ -4,6 +4,17 @@ from .rl_env_cfg import (
     DesktopOrganizerRLEnvCfg,
     FrankaDesktopOrganizerIKRelEnvCfg,
     FrankaDesktopOrganizerIKRelEnvCfg_PLAY,
+    FrankaDesktopOrganizerIKRelFusedEnvCfg,
+    FrankaDesktopOrganizerIKRelLeanObsEnvCfg,
+    FrankaDesktopOrganizerIKRelLeanObsEnvCfg_PLAY,
+    FrankaDesktopOrganizerIKRelBCObsEnvCfg,
+    FrankaDesktopOrganizerIKRelPrivilegedCriticEnvCfg,
+    FrankaDesktopOrganizerIKRelPrivilegedCriticEnvCfg_PLAY,
+    OBSERVATION_PROFILES,
+)
+from .multi_object_env_cfg import (
+    FrankaDesktopOrganizerMultiObjectIKRelEnvCfg,
+    FrankaDesktopOrganizerMultiObjectIKRelEnvCfg_PLAY,
 )
 from .mimic_env import FrankaDesktopOrganizerIKRelMimicEnv
 from .mimic_env_cfg import FrankaDesktopOrganizerIKRelMimicEnvCfg
@@ -12,6 +23,15 @@ __all__ = [
     "DesktopOrganizerRLEnvCfg",
     "FrankaDesktopOrganizerIKRelEnvCfg",
     "FrankaDesktopOrganizerIKRelEnvCfg_PLAY",
+    "FrankaDesktopOrganizerIKRelFusedEnvCfg",
+    "FrankaDesktopOrganizerIKRelLeanObsEnvCfg",
+    "FrankaDesktopOrganizerIKRelLeanObsEnvCfg_PLAY",
+    "FrankaDesktopOrganizerIKRelBCObsEnvCfg",
+    "FrankaDesktopOrganizerIKRelPrivilegedCriticEnvCfg",
+    "FrankaDesktopOrganizerIKRelPrivilegedCriticEnvCfg_PLAY",
+    "OBSERVATION_PROFILES",
+    "FrankaDesktopOrganizerMultiObjectIKRelEnvCfg",
+    "FrankaDesktopOrganizerMultiObjectIKRelEnvCfg_PLAY",
     "FrankaDesktopOrganizerIKRelMimicEnv",
     "FrankaDesktopOrganizerIKRelMimicEnvCfg",
 ]
@@ -0,0 +1,172 @@
+"""Asynchronous HDF5 export backend of the recorder manager.
+
+``RecorderManager.export_episodes`` writes every finished episode through its dataset file handler on the
+simulation thread: the tensors are copied to the host, gzip-compressed and written before the next step can
+run. Generation stalls on disk I/O, and teleoperation hitches whenever a demonstration is saved.
+
+:class:`AsyncHDF5DatasetFileHandler` is a drop-in replacement for ``HDF5DatasetFileHandler``, selected with
+``RecorderManagerBaseCfg.dataset_file_handler_class_type``. :meth:`write_episode` only snapshots the episode
+tensors into (pinned, when CUDA is available) host memory with non-blocking copies and puts the snapshot on a
+queue. A writer thread drains the queue and writes with the upstream handler. When ``max_pending_episodes``
+episodes are waiting, :meth:`write_episode` blocks until the writer catches up (backpressure), which bounds
+the host memory held by pending episodes. :meth:`flush` is queued as well; :meth:`close` (and
+:meth:`close_all`, to call before ``simulation_app.close()``) waits until every queued episode is on disk.
+Errors of the writer thread are raised on the next call from the simulation thread.
+"""
+
+from __future__ import annotations
+
+import copy
+import queue
+import threading
+import torch
+import weakref
+
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+
+_FLUSH = object()
+_STOP = object()
+
+
+class AsyncHDF5DatasetFileHandler(HDF5DatasetFileHandler):
+    """HDF5 dataset file handler writing episodes from a background thread."""
+
+    max_pending_episodes: int = 8
+    """Maximum number of episodes waiting to be written before :meth:`write_episode` blocks."""
+
+    _instances: weakref.WeakSet[AsyncHDF5DatasetFileHandler] = weakref.WeakSet()
+
+    def __init__(self):
+        super().__init__()
+        self._queue: queue.Queue = queue.Queue()
+        # bounds the queued episodes only, flush requests never block
+        self._slots = threading.BoundedSemaphore(self.max_pending_episodes)
+        # updated by the simulation and writer threads
+        self._num_pending = 0
+        self._num_pending_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._error: BaseException | None = None
+        self._instances.add(self)
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_pending_episodes(self) -> int:
+        """Number of episodes queued and not yet written."""
+        return self._num_pending
+
+    """
+    Operations.
+    """
+
+    def create(self, file_path: str, env_name: str = None):
+        super().create(file_path, env_name=env_name)
+        self._start_writer()
+
+    def open(self, file_path: str, mode: str = "r"):
+        super().open(file_path, mode=mode)
+        if mode != "r":
+            self._start_writer()
+
+    def write_episode(self, episode: EpisodeData):
+        """Queue a snapshot of the episode for the writer thread.
+
+        Args:
+            episode: The episode data to write. It can be cleared or reused as soon as the call returns.
+        """
+        self._raise_if_failed()
+        if self._writer is None:
+            super().write_episode(episode)
+            return
+        if episode.is_empty():
+            return
+        snapshot = copy.copy(episode)
+        snapshot.data = _to_host(episode.data)
+        ready = None
+        if torch.cuda.is_available() and torch.cuda.is_initialized():
+            ready = torch.cuda.Event()
+            ready.record()
+        self._slots.acquire()
+        with self._num_pending_lock:
+            self._num_pending += 1
+        self._queue.put((snapshot, ready))
+
+    def flush(self):
+        """Queue a flush of the file after the episodes written so far."""
+        self._raise_if_failed()
+        if self._writer is None:
+            super().flush()
+        else:
+            self._queue.put((_FLUSH, None))
+
+    def wait(self):
+        """Block until every queued episode is written and flushed."""
+        if self._writer is not None:
+            self._queue.put((_FLUSH, None))
+            self._queue.join()
+        self._raise_if_failed()
+
+    def close(self):
+        """Write the queued episodes, stop the writer thread and close the file."""
+        if self._writer is not None:
+            self._queue.put((_STOP, None))
+            self._writer.join()
+            self._writer = None
+        super().close()
+        self._raise_if_failed()
+
+    @classmethod
+    def close_all(cls):
+        """Close every open handler, for example before closing the simulation app, which ends the process."""
+        for handler in list(cls._instances):
+            handler.close()
+
+    """
+    Helper functions.
+    """
+
+    def _start_writer(self):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="hdf5-episode-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            item, ready = self._queue.get()
+            try:
+                if item is _STOP:
+                    super().flush()
+                    return
+                if self._error is None:
+                    if item is _FLUSH:
+                        super().flush()
+                    else:
+                        if ready is not None:
+                            ready.synchronize()
+                        super().write_episode(item)
+            except BaseException as error:
+                # keep draining so that the simulation thread never blocks on a full queue
+                self._error = error
+            finally:
+                if item is not _FLUSH and item is not _STOP:
+                    with self._num_pending_lock:
+                        self._num_pending -= 1
+                    self._slots.release()
+                self._queue.task_done()
+
+    def _raise_if_failed(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Writing an episode in the background failed.") from error
+
+
+def _to_host(data):
+    """Copy nested episode tensors to (pinned) host memory without waiting for the device."""
+    if isinstance(data, dict):
+        return {key: _to_host(value) for key, value in data.items()}
+    if isinstance(data, torch.Tensor):
+        host = torch.empty(data.shape, dtype=data.dtype, pin_memory=data.is_cuda)
+        return host.copy_(data, non_blocking=data.is_cuda)
+    return copy.deepcopy(data)
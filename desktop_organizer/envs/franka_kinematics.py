@@ -0,0 +1,327 @@
+"""Batched forward and differential inverse kinematics of the Franka Panda arm in pure torch.
+
+The Mimic end-effector pose (``ee_frame`` in :class:`DesktopOrganizerRLSceneCfg`) is the ``panda_hand`` frame
+shifted by 0.1034 m along its z-axis. Recorded datasets store the joint positions of the robot for every
+step, so the pose can be rebuilt offline from the joint states without the simulator. The chain below
+follows the joint origins of the Panda description used by ``FRANKA_PANDA_HIGH_PD_CFG`` (joints
+``panda_joint1`` to ``panda_joint7``, all revolute about their local z-axis, followed by the fixed
+``panda_hand`` mount). The finger joints do not affect the hand pose.
+
+Batched (N, 4, 4) matrix products are slow for tiny matrices, so the chain is evaluated on the matrix
+entries instead: every entry is an (N,) tensor, and the products with the constant joint origins skip
+their zero and unit coefficients (the origins are quarter turns about x). Millions of joint states are
+processed in one call on the CPU.
+
+The inverse kinematics mirrors the differential IK action of the task
+(``DifferentialIKControllerCfg(command_type="pose", use_relative_mode=True, ik_method="dls")`` with
+``scale=0.5`` on the ``panda_hand`` frame offset by 0.107 m): :func:`dls_ik_step` is one controller update,
+and :func:`solve_ik` iterates it to reach absolute target poses, for example to check the reachability of
+generated trajectories or reset layouts offline.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import torch
+
+from desktop_organizer.envs.so3 import so3_exp, so3_log
+
+PANDA_JOINT_ORIGINS: tuple[tuple[tuple[float, float, float], tuple[float, float, float]], ...] = (
+    ((0.0, 0.0, 0.333), (0.0, 0.0, 0.0)),
+    ((0.0, 0.0, 0.0), (-math.pi / 2, 0.0, 0.0)),
+    ((0.0, -0.316, 0.0), (math.pi / 2, 0.0, 0.0)),
+    ((0.0825, 0.0, 0.0), (math.pi / 2, 0.0, 0.0)),
+    ((-0.0825, 0.384, 0.0), (-math.pi / 2, 0.0, 0.0)),
+    ((0.0, 0.0, 0.0), (math.pi / 2, 0.0, 0.0)),
+    ((0.088, 0.0, 0.0), (math.pi / 2, 0.0, 0.0)),
+)
+"""Origins (xyz in m, roll-pitch-yaw in rad) of ``panda_joint1`` to ``panda_joint7`` in their parent link."""
+
+PANDA_HAND_ORIGIN: tuple[tuple[float, float, float], tuple[float, float, float]] = (
+    (0.0, 0.0, 0.107),
+    (0.0, 0.0, -math.pi / 4),
+)
+"""Origin of the fixed ``panda_hand`` frame in ``panda_link7``."""
+
+EE_FRAME_OFFSET: tuple[float, float, float] = (0.0, 0.0, 0.1034)
+"""Offset of the end-effector frame from ``panda_hand`` (the ``ee_frame`` sensor of the scene)."""
+
+NUM_ARM_JOINTS = len(PANDA_JOINT_ORIGINS)
+"""Number of arm joints. They are the first joints of the articulation, before the two finger joints."""
+
+PANDA_JOINT_LIMITS: tuple[tuple[float, float], ...] = (
+    (-2.8973, 2.8973),
+    (-1.7628, 1.7628),
+    (-2.8973, 2.8973),
+    (-3.0718, -0.0698),
+    (-2.8973, 2.8973),
+    (-0.0175, 3.7525),
+    (-2.8973, 2.8973),
+)
+"""Position limits (rad) of the arm joints."""
+
+IK_EE_OFFSET: tuple[float, float, float] = (0.0, 0.0, 0.107)
+"""Offset of the controlled frame from ``panda_hand`` in the differential IK action of the task."""
+
+IK_ACTION_SCALE = 0.5
+"""Scale of the raw relative pose actions in the differential IK action of the task."""
+
+DLS_LAMBDA = 0.01
+"""Damping of the damped least-squares solver (Isaac Lab default ``lambda_val`` for ``ik_method="dls"``)."""
+
+_COEFF_TOL = 1.0e-12
+
+
+def origin_matrix(xyz: tuple[float, float, float], rpy: tuple[float, float, float]) -> torch.Tensor:
+    """Homogeneous transform of a URDF-style origin (fixed-axis roll, pitch, yaw) in double precision."""
+    roll, pitch, yaw = rpy
+    cr, sr = math.cos(roll), math.sin(roll)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cy, sy = math.cos(yaw), math.sin(yaw)
+    return torch.tensor(
+        [
+            [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr, xyz[0]],
+            [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr, xyz[1]],
+            [-sp, cp * sr, cp * cr, xyz[2]],
+            [0.0, 0.0, 0.0, 1.0],
+        ],
+        dtype=torch.float64,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _chain_constants(ee_offset: tuple[float, float, float]) -> tuple[list[list[list[float]]], list[list[float]]]:
+    """Joint origins and the constant hand-to-end-effector transform, as nested lists of floats."""
+    joint_origins = [origin_matrix(xyz, rpy).tolist() for xyz, rpy in PANDA_JOINT_ORIGINS]
+    tool = origin_matrix(*PANDA_HAND_ORIGIN) @ origin_matrix(ee_offset, (0.0, 0.0, 0.0))
+    return joint_origins, tool.tolist()
+
+
+def _combine(terms: list[tuple[float, torch.Tensor]], like: torch.Tensor) -> torch.Tensor:
+    """Sum of constant-weighted tensors, skipping zero weights and multiplications by +-1."""
+    out = None
+    for coeff, value in terms:
+        if abs(coeff) < _COEFF_TOL:
+            continue
+        if abs(coeff - 1.0) < _COEFF_TOL:
+            term = value
+        elif abs(coeff + 1.0) < _COEFF_TOL:
+            term = -value
+        else:
+            term = coeff * value
+        out = term if out is None else out + term
+    return torch.zeros_like(like) if out is None else out
+
+
+def _apply_origin(
+    rot: list[list[torch.Tensor]], pos: list[torch.Tensor], origin: list[list[float]]
+) -> tuple[list[list[torch.Tensor]], list[torch.Tensor]]:
+    """Right-multiply a batched transform (entries of shape (N,)) by a constant transform."""
+    like = pos[0]
+    new_pos = [_combine([(1.0, pos[r])] + [(origin[j][3], rot[r][j]) for j in range(3)], like) for r in range(3)]
+    new_rot = [[_combine([(origin[j][k], rot[r][j]) for j in range(3)], like) for k in range(3)] for r in range(3)]
+    return new_rot, new_pos
+
+
+def franka_forward_kinematics(
+    joint_pos: torch.Tensor,
+    ee_offset: tuple[float, float, float] = EE_FRAME_OFFSET,
+    root_pose: torch.Tensor | None = None,
+    return_joint_axes: bool = False,
+) -> torch.Tensor | tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """End-effector poses of the Panda arm for a batch of joint states.
+
+    Args:
+        joint_pos: Joint positions. Shape is (..., J) with J >= 7; only the first seven (arm) joints are used,
+            so full articulation states including the finger joints can be passed directly.
+        ee_offset: Offset of the end-effector frame from ``panda_hand``. Defaults to the ``ee_frame`` offset.
+            Use (0.0, 0.0, 0.107) for the frame of the differential IK action.
+        root_pose: Homogeneous pose of the robot base (``panda_link0``) the result is expressed in, for
+            example the recorded root pose relative to the environment origin. Shape is (..., 4, 4) or (4, 4).
+            Defaults to None (poses in the base frame).
+        return_joint_axes: Whether to also return the rotation axes and positions of the seven arm joints
+            in the same frame, as needed for the geometric Jacobian.
+
+    Returns:
+        The end-effector poses with shape (..., 4, 4). If ``return_joint_axes`` is True, a tuple of the poses,
+        the joint axes with shape (..., 7, 3) and the joint positions with shape (..., 7, 3).
+    """
+    joint_origins, tool = _chain_constants(tuple(ee_offset))
+    batch_shape = joint_pos.shape[:-1]
+    angles = joint_pos.reshape(-1, joint_pos.shape[-1])[:, :NUM_ARM_JOINTS].T
+    cos_q = torch.cos(angles)
+    sin_q = torch.sin(angles)
+    num_samples = angles.shape[1]
+
+    # start from the base pose (identity if not given)
+    if root_pose is None:
+        one = torch.ones(num_samples, dtype=joint_pos.dtype, device=joint_pos.device)
+        zero = torch.zeros_like(one)
+        rot = [[one if r == k else zero for k in range(3)] for r in range(3)]
+        pos = [zero, zero, zero]
+    else:
+        root = root_pose.to(joint_pos.dtype).expand(*batch_shape, 4, 4).reshape(-1, 4, 4)
+        rot = [[root[:, r, k] for k in range(3)] for r in range(3)]
+        pos = [root[:, r, 3] for r in range(3)]
+
+    axes = []
+    positions = []
+    for i in range(NUM_ARM_JOINTS):
+        rot, pos = _apply_origin(rot, pos, joint_origins[i])
+        # rotation about the local z-axis: only the x and y columns change
+        c, s = cos_q[i], sin_q[i]
+        rot = [[c * row[0] + s * row[1], c * row[1] - s * row[0], row[2]] for row in rot]
+        if return_joint_axes:
+            axes.append(torch.stack([row[2] for row in rot], dim=-1))
+            positions.append(torch.stack(pos, dim=-1))
+    rot, pos = _apply_origin(rot, pos, tool)
+
+    pose = torch.zeros(num_samples, 4, 4, dtype=joint_pos.dtype, device=joint_pos.device)
+    pose[:, :3, :3] = torch.stack([torch.stack(row, dim=-1) for row in rot], dim=-2)
+    pose[:, :3, 3] = torch.stack(pos, dim=-1)
+    pose[:, 3, 3] = 1.0
+    pose = pose.view(*batch_shape, 4, 4)
+
+    if return_joint_axes:
+        joint_axes = torch.stack(axes, dim=-2).view(*batch_shape, NUM_ARM_JOINTS, 3)
+        joint_positions = torch.stack(positions, dim=-2).view(*batch_shape, NUM_ARM_JOINTS, 3)
+        return pose, joint_axes, joint_positions
+    return pose
+
+
+def franka_jacobian(
+    joint_pos: torch.Tensor, ee_offset: tuple[float, float, float] = IK_EE_OFFSET
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """End-effector poses and geometric Jacobians of the Panda arm in the robot base frame.
+
+    Args:
+        joint_pos: Joint positions. Shape is (..., J) with J >= 7.
+        ee_offset: Offset of the end-effector frame from ``panda_hand``. Defaults to the IK action frame.
+
+    Returns:
+        A tuple of the end-effector poses with shape (..., 4, 4) and the Jacobians with shape (..., 6, 7)
+        (linear velocity rows first, then angular velocity rows).
+    """
+    pose, joint_axes, joint_positions = franka_forward_kinematics(joint_pos, ee_offset, return_joint_axes=True)
+    # revolute joints: linear part z_i x (p_ee - p_i), angular part z_i
+    linear = torch.linalg.cross(joint_axes, pose[..., None, :3, 3] - joint_positions, dim=-1)
+    jacobian = torch.cat([linear, joint_axes], dim=-1).transpose(-1, -2)
+    return pose, jacobian
+
+
+def pose_error(current_pose: torch.Tensor, target_pose: torch.Tensor) -> torch.Tensor:
+    """Position and axis-angle errors from current to target poses, as ``compute_pose_error`` of Isaac Lab.
+
+    Args:
+        current_pose: Current poses. Shape is (..., 4, 4).
+        target_pose: Target poses. Shape is (..., 4, 4).
+
+    Returns:
+        The stacked position and rotation errors with shape (..., 6).
+    """
+    position_error = target_pose[..., :3, 3] - current_pose[..., :3, 3]
+    rotation_error = so3_log(target_pose[..., :3, :3] @ current_pose[..., :3, :3].transpose(-1, -2))
+    return torch.cat([position_error, rotation_error], dim=-1)
+
+
+def relative_action_to_target_pose(
+    ee_pose: torch.Tensor, action: torch.Tensor, scale: float = IK_ACTION_SCALE
+) -> torch.Tensor:
+    """Target poses of relative pose actions, as ``apply_delta_pose`` of the relative IK controller.
+
+    Args:
+        ee_pose: Current end-effector poses. Shape is (..., 4, 4).
+        action: Raw actions; the first six entries are the position and axis-angle deltas. Shape is (..., >=6).
+        scale: Scale applied to the raw actions by the action term.
+
+    Returns:
+        The target poses with shape (..., 4, 4).
+    """
+    delta = action[..., :6] * scale
+    target_pose = ee_pose.clone()
+    target_pose[..., :3, 3] += delta[..., :3]
+    target_pose[..., :3, :3] = so3_exp(delta[..., 3:6]) @ ee_pose[..., :3, :3]
+    return target_pose
+
+
+def dls_ik_step(
+    joint_pos: torch.Tensor,
+    target_pose: torch.Tensor,
+    ee_offset: tuple[float, float, float] = IK_EE_OFFSET,
+    lambda_val: float = DLS_LAMBDA,
+) -> torch.Tensor:
+    """One damped least-squares update of the arm joints towards target poses.
+
+    Matches ``DifferentialIKController.compute`` with ``ik_method="dls"``:
+    ``dq = J^T (J J^T + lambda^2 I)^-1 e``.
+
+    Args:
+        joint_pos: Joint positions. Shape is (..., J) with J >= 7.
+        target_pose: Target end-effector poses in the robot base frame. Shape is (..., 4, 4).
+        ee_offset: Offset of the end-effector frame from ``panda_hand``. Defaults to the IK action frame.
+        lambda_val: Damping of the least-squares solve.
+
+    Returns:
+        The desired arm joint positions with shape (..., 7).
+    """
+    pose, jacobian = franka_jacobian(joint_pos, ee_offset)
+    error = pose_error(pose, target_pose)
+    damping = (lambda_val**2) * torch.eye(6, dtype=jacobian.dtype, device=jacobian.device)
+    jjt = jacobian @ jacobian.transpose(-1, -2) + damping
+    delta_joint_pos = (jacobian.transpose(-1, -2) @ torch.linalg.solve(jjt, error.unsqueeze(-1))).squeeze(-1)
+    return joint_pos[..., :NUM_ARM_JOINTS] + delta_joint_pos
+
+
+def solve_ik(
+    target_pose: torch.Tensor,
+    joint_pos: torch.Tensor,
+    ee_offset: tuple[float, float, float] = IK_EE_OFFSET,
+    lambda_val: float = DLS_LAMBDA,
+    num_iterations: int = 100,
+    pos_tolerance: float = 1.0e-3,
+    rot_tolerance: float = 1.0e-2,
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Iterate damped least-squares updates to reach absolute target poses, within the joint limits.
+
+    Args:
+        target_pose: Target end-effector poses in the robot base frame. Shape is (N, 4, 4).
+        joint_pos: Initial joint positions, for example the default joint positions of the robot.
+            Shape is (N, J) or (J,) with J >= 7.
+        ee_offset: Offset of the end-effector frame from ``panda_hand``. Defaults to the IK action frame.
+        lambda_val: Damping of the least-squares solve.
+        num_iterations: Maximum number of updates.
+        pos_tolerance: Position error (m) below which a target counts as reached.
+        rot_tolerance: Rotation error (rad) below which a target counts as reached.
+
+    Returns:
+        A tuple of the arm joint positions with shape (N, 7), the reached flags with shape (N,) and the
+        final pose errors with shape (N, 6).
+    """
+    limits = torch.tensor(PANDA_JOINT_LIMITS, dtype=target_pose.dtype, device=target_pose.device)
+    joint_pos = joint_pos[..., :NUM_ARM_JOINTS].to(target_pose.dtype).expand(target_pose.shape[0], -1).clone()
+    active = torch.arange(target_pose.shape[0], device=target_pose.device)
+    error = torch.zeros(target_pose.shape[0], 6, dtype=target_pose.dtype, device=target_pose.device)
+
+    for _ in range(num_iterations):
+        # only keep updating the targets that are not reached yet
+        pose, _ = franka_jacobian(joint_pos[active], ee_offset)
+        error[active] = pose_error(pose, target_pose[active])
+        reached = (torch.linalg.vector_norm(error[active, :3], dim=-1) < pos_tolerance) & (
+            torch.linalg.vector_norm(error[active, 3:], dim=-1) < rot_tolerance
+        )
+        active = active[~reached]
+        if active.numel() == 0:
+            break
+        joint_pos[active] = torch.clamp(
+            dls_ik_step(joint_pos[active], target_pose[active], ee_offset, lambda_val), limits[:, 0], limits[:, 1]
+        )
+    else:
+        # errors of the last update
+        pose, _ = franka_jacobian(joint_pos[active], ee_offset)
+        error[active] = pose_error(pose, target_pose[active])
+
+    reached = (torch.linalg.vector_norm(error[:, :3], dim=-1) < pos_tolerance) & (
+        torch.linalg.vector_norm(error[:, 3:], dim=-1) < rot_tolerance
+    )
+    return joint_pos, reached, error
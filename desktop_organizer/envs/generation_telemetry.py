@@ -0,0 +1,255 @@
+"""Periodic throughput, success and timing metrics of the Mimic data generation.
+
+``generate_dataset.py`` runs the upstream ``env_loop``: it waits until every data generator coroutine has queued
+an action (the coroutines also request env resets through a reset queue), then steps all environments at once.
+Without metrics over time it is not visible whether a run is bound by the simulation or by the coroutines,
+which subtask the trials fail in, or why.
+
+:class:`GenerationTelemetry` gathers, without changing the upstream loop:
+
+- the time spent in ``env.step`` and ``env.reset`` (the methods of the environment instance are wrapped), the
+  rest of the wall time being spent in the data generator coroutines and the loop itself,
+- the depth of the action and reset queues seen by the coroutines when they queue an item (the queues handed to
+  the coroutines are wrapped),
+- for every trial (:meth:`begin_trial`, :meth:`end_trial`), the subtasks it completed, latched from the subtask
+  term signals after every step (the final subtask is completed when the trial succeeds), its outcome and its
+  failure reason.
+
+Every ``interval`` seconds, one record with the rates over the interval and the cumulative counts is appended
+to a JSON Lines file, or written as TensorBoard scalars.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import torch
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLMimicEnv
+
+UNSUCCESSFUL = "unsuccessful"
+"""Failure reason of the trials that ran to the end without success."""
+
+
+class GenerationTelemetry:
+    """Periodic metrics of a Mimic data generation run."""
+
+    def __init__(
+        self,
+        env: ManagerBasedRLMimicEnv,
+        file_path: str | None = None,
+        log_dir: str | None = None,
+        interval: float = 10.0,
+    ):
+        """Wrap the step and reset methods of the environment and open the outputs.
+
+        Args:
+            env: The Mimic environment.
+            file_path: JSON Lines file the records are appended to. Defaults to None (no file).
+            log_dir: TensorBoard log directory. Defaults to None (no TensorBoard scalars).
+            interval: Minimum time (s) between two records.
+        """
+        self.env = env
+        self.interval = interval
+        self.file_path = file_path
+        self._file = None
+        if file_path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            self._file = open(file_path, "a")
+        self._writer = None
+        if log_dir is not None:
+            from torch.utils.tensorboard import SummaryWriter
+
+            self._writer = SummaryWriter(log_dir=log_dir)
+
+        subtask_configs = next(iter(env.cfg.subtask_configs.values()))
+        self.subtask_names = [subtask_name(index, config) for index, config in enumerate(subtask_configs)]
+        """Names of the subtasks of the first end-effector, used as metric names."""
+        self._signal_names = [config.subtask_term_signal for config in subtask_configs[:-1]]
+        self._reached = torch.zeros(env.num_envs, len(self._signal_names), dtype=torch.bool, device=env.device)
+
+        self.num_trials = 0
+        self.num_successes = 0
+        self.subtask_completions = [0] * len(self.subtask_names)
+        """Number of finished trials that completed each subtask."""
+        self.failure_reasons: dict[str, int] = {}
+        """Number of failed trials per failure reason."""
+
+        self._start = time.perf_counter()
+        self._last = {"time": self._start, "steps": env.common_step_counter, "successes": 0, "trials": 0}
+        self._step_time = 0.0
+        self._reset_time = 0.0
+        self._queue_depths: dict[str, list[int]] = {}
+        self._wrap_env()
+
+    """
+    Operations.
+    """
+
+    def watch_queue(self, name: str, queue):
+        """Wrap a queue handed to the data generators to record its depth when an item is queued.
+
+        Args:
+            name: Name of the queue in the records, such as ``"action_queue"``.
+            queue: The asyncio queue.
+
+        Returns:
+            The wrapped queue.
+        """
+        self._queue_depths[name] = [0, 0, 0]
+        return _WatchedQueue(queue, self._queue_depths[name])
+
+    def begin_trial(self, env_id: int):
+        """Clear the latched subtask signals of an environment at the start of a trial."""
+        self._reached[env_id] = False
+
+    def end_trial(self, env_id: int, success: bool, reason: str | None = None):
+        """Count a finished trial.
+
+        Args:
+            env_id: The environment of the trial.
+            success: Whether the trial succeeded.
+            reason: Failure reason of an aborted trial. Failed trials without reason count as
+                :data:`UNSUCCESSFUL`.
+        """
+        self.num_trials += 1
+        # a successful trial completed every subtask, the final one has no term signal
+        completed = [reached or success for reached in self._reached[env_id].tolist()] + [success]
+        for index, subtask_completed in enumerate(completed):
+            self.subtask_completions[index] += int(subtask_completed)
+        if success:
+            self.num_successes += 1
+        else:
+            reason = reason or UNSUCCESSFUL
+            self.failure_reasons[reason] = self.failure_reasons.get(reason, 0) + 1
+
+    def record(self) -> dict:
+        """Write one record with the rates since the previous record and the cumulative counts."""
+        now = time.perf_counter()
+        steps = self.env.common_step_counter
+        elapsed = max(now - self._last["time"], 1.0e-9)
+        num_steps = steps - self._last["steps"]
+        num_trials = max(self.num_trials, 1)
+        record = {
+            "time": now - self._start,
+            "steps": steps,
+            "steps_per_s": num_steps / elapsed,
+            "env_steps_per_s": num_steps * self.env.num_envs / elapsed,
+            "demos_per_min": (self.num_successes - self._last["successes"]) * 60.0 / elapsed,
+            "trials_per_min": (self.num_trials - self._last["trials"]) * 60.0 / elapsed,
+            "trials": self.num_trials,
+            "successes": self.num_successes,
+            "success_rate": self.num_successes / num_trials,
+            "subtask_success_rates": {
+                name: count / num_trials for name, count in zip(self.subtask_names, self.subtask_completions)
+            },
+            "failure_reasons": dict(self.failure_reasons),
+            "queue_depths": {
+                name: {"mean": total / max(count, 1), "max": maximum}
+                for name, (total, count, maximum) in self._queue_depths.items()
+            },
+            "time_split": {
+                "env_step": self._step_time / elapsed,
+                "env_reset": self._reset_time / elapsed,
+                "generators": max(elapsed - self._step_time - self._reset_time, 0.0) / elapsed,
+            },
+        }
+        if self._file is not None:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+        if self._writer is not None:
+            for tag, value in _flatten(record):
+                self._writer.add_scalar(tag, value, global_step=steps)
+            self._writer.flush()
+
+        self._last = {"time": now, "steps": steps, "successes": self.num_successes, "trials": self.num_trials}
+        self._step_time = 0.0
+        self._reset_time = 0.0
+        for depths in self._queue_depths.values():
+            depths[:] = [0, 0, 0]
+        return record
+
+    def close(self):
+        """Write a last record, restore the environment methods and close the outputs."""
+        self.record()
+        self.env.__dict__.pop("step", None)
+        self.env.__dict__.pop("reset", None)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    """
+    Helper functions.
+    """
+
+    def _wrap_env(self):
+        step, reset = self.env.step, self.env.reset
+
+        def timed_step(*args, **kwargs):
+            start = time.perf_counter()
+            result = step(*args, **kwargs)
+            self._step_time += time.perf_counter() - start
+            self._on_step()
+            return result
+
+        def timed_reset(*args, **kwargs):
+            start = time.perf_counter()
+            result = reset(*args, **kwargs)
+            self._reset_time += time.perf_counter() - start
+            return result
+
+        # instance attributes shadow the methods called by the upstream env_loop
+        self.env.step = timed_step
+        self.env.reset = timed_reset
+
+    def _on_step(self):
+        if self._signal_names:
+            signals = self.env.get_subtask_term_signals()
+            self._reached |= torch.stack([signals[name].bool().view(-1) for name in self._signal_names], dim=1)
+        if time.perf_counter() - self._last["time"] >= self.interval:
+            self.record()
+
+
+class _WatchedQueue:
+    """Queue wrapper recording the number of queued items when an item is added."""
+
+    def __init__(self, queue, depths: list[int]):
+        self._queue = queue
+        self._depths = depths
+
+    async def put(self, item):
+        depth = self._queue.qsize()
+        self._depths[0] += depth
+        self._depths[1] += 1
+        self._depths[2] = max(self._depths[2], depth)
+        await self._queue.put(item)
+
+    def __getattr__(self, name):
+        return getattr(self._queue, name)
+
+
+def subtask_name(index: int, config) -> str:
+    """Metric name of a subtask: its term signal, else the first word of its description, else its index."""
+    if config.subtask_term_signal:
+        return config.subtask_term_signal
+    if config.description:
+        return config.description.split()[0].lower()
+    return f"subtask_{index}"
+
+
+def _flatten(record: dict, prefix: str = "") -> list[tuple[str, float]]:
+    """Scalar entries of a nested record as ``(tag, value)`` pairs."""
+    scalars = []
+    for key, value in record.items():
+        tag = f"{prefix}{key}"
+        if isinstance(value, dict):
+            scalars.extend(_flatten(value, prefix=f"{tag}/"))
+        else:
+            scalars.append((tag, value))
+    return scalars
@@ -5,6 +5,10 @@ from collections.abc import Sequence
 
 import isaaclab.utils.math as PoseUtils
 from isaaclab.envs import ManagerBasedRLMimicEnv
+from isaaclab.managers import SceneEntityCfg
+
+from desktop_organizer import mdp
+from desktop_organizer.envs.so3 import so3_exp, so3_log
 
 
 class FrankaDesktopOrganizerIKRelMimicEnv(ManagerBasedRLMimicEnv):
@@ -15,6 +19,9 @@ class FrankaDesktopOrganizerIKRelMimicEnv(ManagerBasedRLMimicEnv):
     with IK relative control.
     """
 
+    eef_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame")
+    """Frame transformer sensor providing the end-effector pose of the "franka" eef."""
+
     def get_robot_eef_pose(self, eef_name: str, env_ids: Sequence[int] | None = None) -> torch.Tensor:
         """
         Get current robot end effector pose. Should be the same frame as used by the robot end-effector controller.
@@ -26,14 +33,13 @@ class FrankaDesktopOrganizerIKRelMimicEnv(ManagerBasedRLMimicEnv):
         Returns:
             A torch.Tensor eef pose matrix. Shape is (len(env_ids), 4, 4)
         """
+        # Read the end effector frame directly, independent of the observation buffer. The 4x4 poses of all
+        # envs are built once per step and invalidated on reset (see mdp.ee_frame_pose_matrix).
+        eef_pose = mdp.ee_frame_pose_matrix(self, self.eef_frame_cfg)
+        # never hand out the shared cache: copy all envs, or gather the requested subset
         if env_ids is None:
-            env_ids = slice(None)
-
-        # Retrieve end effector pose from the observation buffer
-        eef_pos = self.obs_buf["policy"]["eef_pos"][env_ids]
-        eef_quat = self.obs_buf["policy"]["eef_quat"][env_ids]
-        # Quaternion format is w,x,y,z
-        return PoseUtils.make_pose(eef_pos, PoseUtils.matrix_from_quat(eef_quat))
+            return eef_pose.clone()
+        return eef_pose[env_ids]
 
     def target_eef_pose_to_action(
         self,
@@ -47,6 +53,8 @@ class FrankaDesktopOrganizerIKRelMimicEnv(ManagerBasedRLMimicEnv):
         (usually a normalized delta pose action) to try and achieve that target pose.
         Noise is added to the target pose action if specified.
 
+        Thin wrapper around :meth:`target_eef_poses_to_actions` for a single environment.
+
         Args:
             target_eef_pose_dict: Dictionary of 4x4 target eef pose for each end-effector.
             gripper_action_dict: Dictionary of gripper actions for each end-effector.
@@ -56,6 +64,35 @@ class FrankaDesktopOrganizerIKRelMimicEnv(ManagerBasedRLMimicEnv):
         Returns:
             An action torch.Tensor that's compatible with env.step().
         """
+        target_eef_poses = {name: pose.unsqueeze(0) for name, pose in target_eef_pose_dict.items()}
+        gripper_actions = {name: action.unsqueeze(0) for name, action in gripper_action_dict.items()}
+        actions = self.target_eef_poses_to_actions(
+            target_eef_poses, gripper_actions, action_noise_dict, env_ids=[env_id]
+        )
+        return actions[0]
+
+    def target_eef_poses_to_actions(
+        self,
+        target_eef_pose_dict: dict,
+        gripper_action_dict: dict,
+        action_noise_dict: dict | None = None,
+        env_ids: Sequence[int] | None = None,
+    ) -> torch.Tensor:
+        """
+        Batched version of :meth:`target_eef_pose_to_action` for many environments in one vectorized pass.
+
+        Args:
+            target_eef_pose_dict: Dictionary of stacked 4x4 target eef poses for each end-effector.
+                Shape is (len(env_ids), 4, 4).
+            gripper_action_dict: Dictionary of stacked gripper actions for each end-effector.
+                Shape is (len(env_ids), 1).
+            action_noise_dict: Noise scale to add to the actions. The scale is a float, or a tensor of shape
+                (len(env_ids),) for a per-environment scale. If None, no noise is added.
+            env_ids: Environment indices the targets belong to. If None, all envs are considered.
+
+        Returns:
+            An action torch.Tensor that's compatible with env.step(). Shape is (len(env_ids), 7).
+        """
         eef_name = list(self.cfg.subtask_configs.keys())[0]
 
         # target position and rotation
@@ -63,7 +100,7 @@ class FrankaDesktopOrganizerIKRelMimicEnv(ManagerBasedRLMimicEnv):
         target_pos, target_rot = PoseUtils.unmake_pose(target_eef_pose)
 
         # current position and rotation
-        curr_pose = self.get_robot_eef_pose(eef_name, env_ids=[env_id])[0]
+        curr_pose = self.get_robot_eef_pose(eef_name, env_ids=env_ids)
         curr_pos, curr_rot = PoseUtils.unmake_pose(curr_pose)
 
         # normalized delta position action
@@ -71,20 +108,21 @@ class FrankaDesktopOrganizerIKRelMimicEnv(ManagerBasedRLMimicEnv):
 
         # normalized delta rotation action
         delta_rot_mat = target_rot.matmul(curr_rot.transpose(-1, -2))
-        delta_quat = PoseUtils.quat_from_matrix(delta_rot_mat)
-        delta_rotation = PoseUtils.axis_angle_from_quat(delta_quat)
+        delta_rotation = so3_log(delta_rot_mat)
 
         # get gripper action for single eef
         (gripper_action,) = gripper_action_dict.values()
 
         # add noise to action
-        pose_action = torch.cat([delta_position, delta_rotation], dim=0)
+        pose_action = torch.cat([delta_position, delta_rotation], dim=-1)
         if action_noise_dict is not None:
-            noise = action_noise_dict["franka"] * torch.randn_like(pose_action)
-            pose_action += noise
+            noise_scale = torch.as_tensor(action_noise_dict["franka"], dtype=pose_action.dtype, device=self.device)
+            if noise_scale.dim() > 0:
+                noise_scale = noise_scale.view(-1, 1)
+            pose_action = pose_action + noise_scale * torch.randn_like(pose_action)
             pose_action = torch.clamp(pose_action, -1.0, 1.0)
 
-        return torch.cat([pose_action, gripper_action], dim=0)
+        return torch.cat([pose_action, gripper_action.view(pose_action.shape[0], -1)], dim=-1)
 
     def action_to_target_eef_pose(self, action: torch.Tensor) -> dict[str, torch.Tensor]:
         """
@@ -110,16 +148,8 @@ class FrankaDesktopOrganizerIKRelMimicEnv(ManagerBasedRLMimicEnv):
         # get pose target
         target_pos = curr_pos + delta_position
 
-        # Convert delta_rotation to axis angle form
-        delta_rotation_angle = torch.linalg.norm(delta_rotation, dim=-1, keepdim=True)
-        delta_rotation_axis = delta_rotation / delta_rotation_angle
-
-        # Handle invalid division for the case when delta_rotation_angle is close to zero
-        is_close_to_zero_angle = torch.isclose(delta_rotation_angle, torch.zeros_like(delta_rotation_angle)).squeeze(1)
-        delta_rotation_axis[is_close_to_zero_angle] = torch.zeros_like(delta_rotation_axis)[is_close_to_zero_angle]
-
-        delta_quat = PoseUtils.quat_from_angle_axis(delta_rotation_angle.squeeze(1), delta_rotation_axis).squeeze(0)
-        delta_rot_mat = PoseUtils.matrix_from_quat(delta_quat)
+        # delta rotation (axis-angle) to rotation matrix
+        delta_rot_mat = so3_exp(delta_rotation)
         target_rot = torch.matmul(delta_rot_mat, curr_rot)
 
         target_poses = PoseUtils.make_pose(target_pos, target_rot).clone()
@@ -1,17 +1,26 @@
 """Isaac Lab Mimic environment config for Franka Desktop Organizer IK Rel task."""
 
 from isaaclab.envs.mimic_env_cfg import MimicEnvCfg, SubTaskConfig
-from isaaclab.managers import EventTermCfg as EventTerm
 from isaaclab.managers import ObservationGroupCfg as ObsGroup
 from isaaclab.managers import ObservationTermCfg as ObsTerm
 from isaaclab.managers import SceneEntityCfg
 from isaaclab.utils import configclass
 
-from isaaclab_tasks.manager_based.manipulation.place import mdp as place_mdp
 from isaaclab_tasks.manager_based.manipulation.stack import mdp as stack_mdp
-from isaaclab_tasks.manager_based.manipulation.stack.mdp import franka_stack_events
 
-from desktop_organizer.envs.rl_env_cfg import FrankaDesktopOrganizerIKRelEnvCfg
+from desktop_organizer import mdp
+from desktop_organizer.envs.rl_env_cfg import TRACKED_OBJECT_CFGS, FrankaDesktopOrganizerIKRelEnvCfg
+from desktop_organizer.envs.trial_monitor import TrialFailureCfg
+
+# Shared parameters of the subtask signal terms (one batched evaluation per step for all three signals)
+SUBTASK_SIGNAL_PARAMS = {
+    "gripper_cfg": SceneEntityCfg("robot", joint_names=["panda_finger_joint1", "panda_finger_joint2"]),
+    "object_cfg": SceneEntityCfg("ketchup"),
+    "ee_frame_cfg": SceneEntityCfg("ee_frame"),
+    "reach_distance": 0.08,
+    "grasp_distance": 0.05,
+    "lift_height": 0.52,
+}
 
 
 @configclass
@@ -26,6 +35,9 @@ class FrankaDesktopOrganizerIKRelMimicEnvCfg(FrankaDesktopOrganizerIKRelEnvCfg,
     4. Place: Place the ketchup into the basket
     """
 
+    trial_failures: TrialFailureCfg = TrialFailureCfg()
+    """Failure detectors that abort doomed trials during data generation (see ``generate_dataset.py``)."""
+
     def __post_init__(self):
         # post init of parents
         super().__post_init__()
@@ -141,20 +153,36 @@ class FrankaDesktopOrganizerIKRelMimicEnvCfg(FrankaDesktopOrganizerIKRelEnvCfg,
             eef_quat = ObsTerm(func=stack_mdp.ee_frame_quat, params={"ee_frame_cfg": SceneEntityCfg("ee_frame")})
             gripper_pos = ObsTerm(func=stack_mdp.gripper_pos)
             ketchup_pos = ObsTerm(
-                func=place_mdp.object_poses_in_base_frame,
-                params={"object_cfg": SceneEntityCfg("ketchup"), "return_key": "pos"},
+                func=mdp.object_pose_in_robot_root_frame,
+                params={
+                    "object_cfg": SceneEntityCfg("ketchup"),
+                    "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                    "return_key": "pos",
+                },
             )
             ketchup_quat = ObsTerm(
-                func=place_mdp.object_poses_in_base_frame,
-                params={"object_cfg": SceneEntityCfg("ketchup"), "return_key": "quat"},
+                func=mdp.object_pose_in_robot_root_frame,
+                params={
+                    "object_cfg": SceneEntityCfg("ketchup"),
+                    "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                    "return_key": "quat",
+                },
             )
             basket_pos = ObsTerm(
-                func=place_mdp.object_poses_in_base_frame,
-                params={"object_cfg": SceneEntityCfg("basket"), "return_key": "pos"},
+                func=mdp.object_pose_in_robot_root_frame,
+                params={
+                    "object_cfg": SceneEntityCfg("basket"),
+                    "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                    "return_key": "pos",
+                },
             )
             basket_quat = ObsTerm(
-                func=place_mdp.object_poses_in_base_frame,
-                params={"object_cfg": SceneEntityCfg("basket"), "return_key": "quat"},
+                func=mdp.object_pose_in_robot_root_frame,
+                params={
+                    "object_cfg": SceneEntityCfg("basket"),
+                    "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                    "return_key": "quat",
+                },
             )
 
             def __post_init__(self):
@@ -164,39 +192,46 @@ class FrankaDesktopOrganizerIKRelMimicEnvCfg(FrankaDesktopOrganizerIKRelEnvCfg,
         # Replace the policy observation configuration
         self.observations.policy = MimicPolicyCfg()
 
+        # Subtask completion signals read by get_subtask_term_signals (used by annotate_demos.py --auto)
+        @configclass
+        class SubtaskCfg(ObsGroup):
+            """Observations for subtask group."""
+
+            reach = ObsTerm(func=mdp.subtask_signal, params={"signal": "reach", **SUBTASK_SIGNAL_PARAMS})
+            grasp = ObsTerm(func=mdp.subtask_signal, params={"signal": "grasp", **SUBTASK_SIGNAL_PARAMS})
+            lift = ObsTerm(func=mdp.subtask_signal, params={"signal": "lift", **SUBTASK_SIGNAL_PARAMS})
+
+            def __post_init__(self):
+                self.enable_corruption = False
+                self.concatenate_terms = False
+
+        self.observations.subtask_terms = SubtaskCfg()
+
+        # Generation-time failure detectors read the same batched subtask signals
+        self.trial_failures.signal_params = SUBTASK_SIGNAL_PARAMS
+        self.trial_failures.minimum_height = self.terminations.object_dropping.params["minimum_height"]
+
         # Override randomization ranges for Mimic environment (match main project)
+        randomize_params = self.events.randomize_object_poses.params
+        asset_names = [asset_cfg.name for asset_cfg in randomize_params["asset_cfgs"]]
+        pose_ranges = randomize_params["per_object_pose_ranges"]
+
         # Ketchup: very small range (3cm x 4cm)
-        self.events.randomize_ketchup = EventTerm(
-            func=franka_stack_events.randomize_object_pose,
-            mode="reset",
-            params={
-                "pose_range": {
-                    "x": (1.315, 1.345),  # 3cm range (match main project)
-                    "y": (1.475, 1.515),  # 4cm range (match main project)
-                    "z": (0.50771, 0.50771),
-                    "roll": (1.5708, 1.5708),
-                    "pitch": (0.0, 0.0),
-                    "yaw": (-0.15, 0.15),  # ±8.6° (match main project)
-                },
-                "min_separation": 0.0,
-                "asset_cfgs": [SceneEntityCfg("ketchup")],
-            },
-        )
+        pose_ranges[asset_names.index("ketchup")] = {
+            "x": (1.315, 1.345),  # 3cm range (match main project)
+            "y": (1.475, 1.515),  # 4cm range (match main project)
+            "z": (0.50771, 0.50771),
+            "roll": (1.5708, 1.5708),
+            "pitch": (0.0, 0.0),
+            "yaw": (-0.15, 0.15),  # ±8.6° (match main project)
+        }
 
         # Basket: small range (6cm x 6cm)
-        self.events.randomize_basket = EventTerm(
-            func=franka_stack_events.randomize_object_pose,
-            mode="reset",
-            params={
-                "pose_range": {
-                    "x": (1.73, 1.79),  # 6cm range (match main project)
-                    "y": (1.45, 1.51),  # 6cm range (match main project)
-                    "z": (0.48, 0.48),
-                    "roll": (0.0, 0.0),
-                    "pitch": (0.0, 0.0),
-                    "yaw": (-0.5, 0.5),
-                },
-                "min_separation": 0.0,
-                "asset_cfgs": [SceneEntityCfg("basket")],
-            },
-        )
+        pose_ranges[asset_names.index("basket")] = {
+            "x": (1.73, 1.79),  # 6cm range (match main project)
+            "y": (1.45, 1.51),  # 6cm range (match main project)
+            "z": (0.48, 0.48),
+            "roll": (0.0, 0.0),
+            "pitch": (0.0, 0.0),
+            "yaw": (-0.5, 0.5),
+        }
@@ -0,0 +1,185 @@
+"""Configuration for the multi-object desktop organizer RL task.
+
+All three tabletop objects (ketchup, orange juice and cream cheese) can be the target. Each environment
+samples its active object at reset, and all reward, termination and observation terms operate on the
+stacked object state in one vectorized pass (see :mod:`desktop_organizer.mdp.multi_object`).
+"""
+
+import isaaclab.envs.mdp as isaaclab_mdp
+from isaaclab.managers import EventTermCfg as EventTerm
+from isaaclab.managers import ObservationGroupCfg as ObsGroup
+from isaaclab.managers import ObservationTermCfg as ObsTerm
+from isaaclab.managers import RewardTermCfg as RewTerm
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.managers import TerminationTermCfg as DoneTerm
+from isaaclab.utils import configclass
+
+from desktop_organizer import mdp
+from desktop_organizer.envs.rl_env_cfg import FrankaDesktopOrganizerIKRelEnvCfg
+
+# Shared settings of the multi-object engine (objects into basket, goal from the object_pose command)
+MULTI_OBJECT_ENGINE_PARAMS = {
+    "object_cfgs": [SceneEntityCfg("ketchup"), SceneEntityCfg("orange_juice"), SceneEntityCfg("cream_cheese")],
+    "command_name": "object_pose",
+    # lift heights ~1.2-1.5cm above the initial height of each object
+    "minimal_height": [0.52, 0.535, 0.475],
+    "xy_threshold": 0.11,
+    "height_threshold": 0.20,
+    "height_diff": 0.0,
+    "robot_cfg": SceneEntityCfg("robot"),
+    "target_cfg": SceneEntityCfg("basket"),
+    "ee_frame_cfg": SceneEntityCfg("ee_frame"),
+}
+
+
+@configclass
+class MultiObjectObservationsCfg:
+    """Observation specifications for the multi-object MDP."""
+
+    @configclass
+    class PolicyCfg(ObsGroup):
+        """Observations for policy group."""
+
+        # Robot state
+        joint_pos = ObsTerm(func=isaaclab_mdp.joint_pos_rel)
+        joint_vel = ObsTerm(func=isaaclab_mdp.joint_vel_rel)
+
+        # Active object position (in robot root frame) and its index
+        active_object_position = ObsTerm(
+            func=mdp.multi_object_observation,
+            params={"output": "active_object_position", **MULTI_OBJECT_ENGINE_PARAMS},
+        )
+        active_object_one_hot = ObsTerm(
+            func=mdp.multi_object_observation,
+            params={"output": "active_object_one_hot", **MULTI_OBJECT_ENGINE_PARAMS},
+        )
+
+        # All object positions (in robot root frame)
+        object_positions = ObsTerm(
+            func=mdp.multi_object_observation,
+            params={"output": "object_positions", **MULTI_OBJECT_ENGINE_PARAMS},
+        )
+
+        # Target position (basket center above)
+        target_object_position = ObsTerm(func=isaaclab_mdp.generated_commands, params={"command_name": "object_pose"})
+
+        # Previous actions
+        actions = ObsTerm(func=isaaclab_mdp.last_action)
+
+        def __post_init__(self):
+            self.enable_corruption = True
+            self.concatenate_terms = True
+
+    # observation groups
+    policy: PolicyCfg = PolicyCfg()
+
+
+@configclass
+class MultiObjectRewardsCfg:
+    """Reward terms for the multi-object MDP (same terms and weights as the single-object task)."""
+
+    reaching_object = RewTerm(
+        func=mdp.multi_object_reward,
+        params={"output": "reaching_object", "std": 0.1, **MULTI_OBJECT_ENGINE_PARAMS},
+        weight=1.0,
+    )
+
+    lifting_object = RewTerm(
+        func=mdp.multi_object_reward,
+        params={"output": "lifting_object", **MULTI_OBJECT_ENGINE_PARAMS},
+        weight=10.0,
+    )
+
+    command_progress = RewTerm(
+        func=mdp.multi_object_reward,
+        params={"output": "command_progress", "std": 0.8, **MULTI_OBJECT_ENGINE_PARAMS},
+        weight=30.0,
+    )
+
+    object_goal_tracking = RewTerm(
+        func=mdp.multi_object_reward,
+        params={"output": "object_goal_tracking", "std": 0.3, **MULTI_OBJECT_ENGINE_PARAMS},
+        weight=10.0,
+    )
+
+    object_goal_tracking_fine_grained = RewTerm(
+        func=mdp.multi_object_reward,
+        params={"output": "object_goal_tracking", "std": 0.05, **MULTI_OBJECT_ENGINE_PARAMS},
+        weight=50.0,
+    )
+
+    success_reward = RewTerm(
+        func=mdp.multi_object_reward,
+        params={"output": "success", **MULTI_OBJECT_ENGINE_PARAMS},
+        weight=20000.0,
+    )
+
+    gripper_closed_penalty = RewTerm(
+        func=mdp.multi_object_reward,
+        params={"output": "gripper_closed_at_goal", "distance_threshold": 0.08, **MULTI_OBJECT_ENGINE_PARAMS},
+        weight=-100.0,
+    )
+
+    # Action penalties
+    action_rate = RewTerm(func=isaaclab_mdp.action_rate_l2, weight=-1e-4)
+
+    joint_vel = RewTerm(
+        func=isaaclab_mdp.joint_vel_l2,
+        weight=-1e-4,
+        params={"asset_cfg": SceneEntityCfg("robot")},
+    )
+
+
+@configclass
+class MultiObjectTerminationsCfg:
+    """Termination terms for the multi-object MDP."""
+
+    time_out = DoneTerm(func=isaaclab_mdp.time_out, time_out=True)
+
+    # Active object dropping (failure)
+    object_dropping = DoneTerm(
+        func=mdp.multi_object_termination,
+        params={"output": "object_dropping", "minimum_height": 0.3, **MULTI_OBJECT_ENGINE_PARAMS},
+    )
+
+    # Success: active object successfully placed in basket
+    success = DoneTerm(
+        func=mdp.multi_object_termination,
+        params={"output": "success", **MULTI_OBJECT_ENGINE_PARAMS},
+    )
+
+
+@configclass
+class FrankaDesktopOrganizerMultiObjectIKRelEnvCfg(FrankaDesktopOrganizerIKRelEnvCfg):
+    """Configuration for Franka multi-object desktop organizer RL with IK relative control."""
+
+    observations: MultiObjectObservationsCfg = MultiObjectObservationsCfg()
+    rewards: MultiObjectRewardsCfg = MultiObjectRewardsCfg()
+    terminations: MultiObjectTerminationsCfg = MultiObjectTerminationsCfg()
+
+    def __post_init__(self):
+        # post init of parent
+        super().__post_init__()
+
+        # Sample the active object of every reset environment
+        self.events.sample_active_object = EventTerm(
+            func=mdp.sample_active_object,
+            mode="reset",
+            params=dict(MULTI_OBJECT_ENGINE_PARAMS),
+        )
+
+
+@configclass
+class FrankaDesktopOrganizerMultiObjectIKRelEnvCfg_PLAY(FrankaDesktopOrganizerMultiObjectIKRelEnvCfg):
+    """Configuration for playing (evaluation) mode."""
+
+    def __post_init__(self):
+        # post init of parent
+        super().__post_init__()
+        # make a smaller scene for play
+        self.scene.num_envs = 50
+        self.scene.env_spacing = 2.5
+        # disable randomization for play
+        self.observations.policy.enable_corruption = False
+        # show the goal marker
+        self.commands.object_pose.debug_vis = True
@@ -27,9 +27,7 @@ from isaaclab.envs.mdp.actions.actions_cfg import DifferentialInverseKinematicsA
 from desktop_organizer import mdp
 
 # Import official MDP functions
-from isaaclab_tasks.manager_based.manipulation.place import mdp as place_mdp
 from isaaclab_tasks.manager_based.manipulation.stack import mdp as stack_mdp
-from isaaclab_tasks.manager_based.manipulation.stack.mdp import franka_stack_events
 
 # Import Franka robot configuration
 from isaaclab_assets.robots.franka import FRANKA_PANDA_HIGH_PD_CFG
@@ -145,21 +143,12 @@ class DesktopOrganizerRLSceneCfg(InteractiveSceneCfg):
 class CommandsCfg:
     """Command specifications for the MDP."""
 
-    # Target position: above basket (robot local coordinates, fixed)
-    object_pose = isaaclab_mdp.UniformPoseCommandCfg(
+    # Target position: above basket (robot local coordinates, fixed, never resampled)
+    object_pose = mdp.FixedPoseCommandCfg(
         asset_name="robot",
-        body_name="panda_hand",
-        resampling_time_range=(5.0, 5.0),
-        debug_vis=True,
-        ranges=isaaclab_mdp.UniformPoseCommandCfg.Ranges(
-            # Basket fixed position (1.76, 1.48) in robot local coordinates
-            pos_x=(0.406, 0.406),  # Fixed X (world coord 1.76)
-            pos_y=(0.222, 0.222),  # Fixed Y (world coord 1.48)
-            pos_z=(0.375, 0.375),  # Fixed Z (world coord 0.8)
-            roll=(0.0, 0.0),
-            pitch=(0.0, 0.0),
-            yaw=(0.0, 0.0)
-        ),
+        # Basket fixed position (1.76, 1.48) in robot local coordinates
+        pos=(0.406, 0.222, 0.375),  # world coord (1.76, 1.48, 0.8)
+        rot=(1.0, 0.0, 0.0, 0.0),
     )
 
 
@@ -172,6 +161,10 @@ class ActionsCfg:
     gripper_action: isaaclab_mdp.BinaryJointPositionActionCfg = MISSING
 
 
+# Rigid objects transformed into the robot root frame together by the observation pose cache
+TRACKED_OBJECT_CFGS = [SceneEntityCfg("ketchup"), SceneEntityCfg("basket")]
+
+
 @configclass
 class ObservationsCfg:
     """Observation specifications for the MDP."""
@@ -193,26 +186,45 @@ class ObservationsCfg:
 
         # Ketchup position and orientation (for BC training)
         ketchup_pos = ObsTerm(
-            func=place_mdp.object_poses_in_base_frame,
-            params={"object_cfg": SceneEntityCfg("ketchup"), "return_key": "pos"},
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("ketchup"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "pos",
+            },
         )
         ketchup_quat = ObsTerm(
-            func=place_mdp.object_poses_in_base_frame,
-            params={"object_cfg": SceneEntityCfg("ketchup"), "return_key": "quat"},
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("ketchup"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "quat",
+            },
         )
 
         # Basket position and orientation (for BC training)
         basket_pos = ObsTerm(
-            func=place_mdp.object_poses_in_base_frame,
-            params={"object_cfg": SceneEntityCfg("basket"), "return_key": "pos"},
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("basket"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "pos",
+            },
         )
         basket_quat = ObsTerm(
-            func=place_mdp.object_poses_in_base_frame,
-            params={"object_cfg": SceneEntityCfg("basket"), "return_key": "quat"},
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("basket"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "quat",
+            },
         )
 
         # Ketchup position (in robot root frame) - for RL training
-        object_position = ObsTerm(func=mdp.object_position_in_robot_root_frame, params={"object_cfg": SceneEntityCfg("ketchup")})
+        object_position = ObsTerm(
+            func=mdp.object_pose_in_robot_root_frame,
+            params={"object_cfg": SceneEntityCfg("ketchup"), "tracked_object_cfgs": TRACKED_OBJECT_CFGS},
+        )
 
         # Target position (basket center above) - for RL training
         target_object_position = ObsTerm(func=isaaclab_mdp.generated_commands, params={"command_name": "object_pose"})
@@ -228,6 +240,131 @@ class ObservationsCfg:
     policy: PolicyCfg = PolicyCfg()
 
 
+@configclass
+class LeanObservationsCfg:
+    """Minimal observation profile for RL.
+
+    Only the terms PPO needs: robot joint state, ketchup position, goal and last action. The BC-only
+    end-effector, gripper and object orientation terms are left out.
+    """
+
+    @configclass
+    class PolicyCfg(ObsGroup):
+        """Observations for policy group."""
+
+        joint_pos = ObsTerm(func=isaaclab_mdp.joint_pos_rel)
+        joint_vel = ObsTerm(func=isaaclab_mdp.joint_vel_rel)
+        object_position = ObsTerm(
+            func=mdp.object_pose_in_robot_root_frame,
+            params={"object_cfg": SceneEntityCfg("ketchup"), "tracked_object_cfgs": TRACKED_OBJECT_CFGS},
+        )
+        target_object_position = ObsTerm(func=isaaclab_mdp.generated_commands, params={"command_name": "object_pose"})
+        actions = ObsTerm(func=isaaclab_mdp.last_action)
+
+        def __post_init__(self):
+            self.enable_corruption = True
+            self.concatenate_terms = True
+
+    # observation groups
+    policy: PolicyCfg = PolicyCfg()
+
+
+@configclass
+class BCObservationsCfg:
+    """Observation profile for BC/Mimic data (same terms as the recorded datasets)."""
+
+    @configclass
+    class PolicyCfg(ObsGroup):
+        """Observations for policy group."""
+
+        actions = ObsTerm(func=isaaclab_mdp.last_action)
+        joint_pos = ObsTerm(func=isaaclab_mdp.joint_pos_rel)
+        joint_vel = ObsTerm(func=isaaclab_mdp.joint_vel_rel)
+        eef_pos = ObsTerm(func=stack_mdp.ee_frame_pos, params={"ee_frame_cfg": SceneEntityCfg("ee_frame")})
+        eef_quat = ObsTerm(func=stack_mdp.ee_frame_quat, params={"ee_frame_cfg": SceneEntityCfg("ee_frame")})
+        gripper_pos = ObsTerm(func=stack_mdp.gripper_pos)
+        ketchup_pos = ObsTerm(
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("ketchup"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "pos",
+            },
+        )
+        ketchup_quat = ObsTerm(
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("ketchup"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "quat",
+            },
+        )
+        basket_pos = ObsTerm(
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("basket"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "pos",
+            },
+        )
+        basket_quat = ObsTerm(
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("basket"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "quat",
+            },
+        )
+
+        def __post_init__(self):
+            self.enable_corruption = False
+            self.concatenate_terms = False
+
+    # observation groups
+    policy: PolicyCfg = PolicyCfg()
+
+
+@configclass
+class PrivilegedCriticObservationsCfg:
+    """Asymmetric actor-critic profile: lean actor observations, privileged critic observations."""
+
+    @configclass
+    class CriticCfg(LeanObservationsCfg.PolicyCfg):
+        """Observations for critic group (lean terms plus privileged object and end-effector state)."""
+
+        object_orientation = ObsTerm(
+            func=mdp.object_pose_in_robot_root_frame,
+            params={
+                "object_cfg": SceneEntityCfg("ketchup"),
+                "tracked_object_cfgs": TRACKED_OBJECT_CFGS,
+                "return_key": "quat",
+            },
+        )
+        object_lin_vel = ObsTerm(func=isaaclab_mdp.root_lin_vel_w, params={"asset_cfg": SceneEntityCfg("ketchup")})
+        basket_position = ObsTerm(
+            func=mdp.object_pose_in_robot_root_frame,
+            params={"object_cfg": SceneEntityCfg("basket"), "tracked_object_cfgs": TRACKED_OBJECT_CFGS},
+        )
+        eef_pos = ObsTerm(func=stack_mdp.ee_frame_pos, params={"ee_frame_cfg": SceneEntityCfg("ee_frame")})
+
+        def __post_init__(self):
+            self.enable_corruption = False
+            self.concatenate_terms = True
+
+    # observation groups
+    policy: LeanObservationsCfg.PolicyCfg = LeanObservationsCfg.PolicyCfg()
+    critic: CriticCfg = CriticCfg()
+
+
+OBSERVATION_PROFILES = {
+    "full": ObservationsCfg,
+    "lean": LeanObservationsCfg,
+    "bc": BCObservationsCfg,
+    "privileged_critic": PrivilegedCriticObservationsCfg,
+}
+"""Observation profiles selectable on :class:`DesktopOrganizerRLEnvCfg` subclasses."""
+
+
 @configclass
 class RewardsCfg:
     """Reward terms for the MDP (aligned with official Lift task + command_progress)."""
@@ -274,7 +411,7 @@ class RewardsCfg:
 
     # 6. Success reward: ketchup successfully placed in basket (VERY HIGH reward)
     success_reward = RewTerm(
-        func=place_mdp.object_a_is_into_b,
+        func=mdp.object_a_is_into_b,
         params={
             "robot_cfg": SceneEntityCfg("robot"),
             "object_a_cfg": SceneEntityCfg("ketchup"),
@@ -308,6 +445,80 @@ class RewardsCfg:
     )
 
 
+# Shared settings of the fused reward engine (ketchup into basket, goal from the object_pose command)
+FUSED_REWARD_ENGINE_PARAMS = {
+    "command_name": "object_pose",
+    "minimal_height": 0.52,
+    "xy_threshold": 0.11,
+    "height_threshold": 0.20,
+    "height_diff": 0.0,
+    "robot_cfg": SceneEntityCfg("robot"),
+    "object_cfg": SceneEntityCfg("ketchup"),
+    "target_cfg": SceneEntityCfg("basket"),
+    "ee_frame_cfg": SceneEntityCfg("ee_frame"),
+}
+
+
+@configclass
+class FusedRewardsCfg:
+    """Reward terms for the MDP computed by the fused reward engine.
+
+    Same terms and weights as :class:`RewardsCfg`, but the goal transform, distances, lifted mask and
+    gripper state are computed once per step and shared by all terms.
+    """
+
+    reaching_object = RewTerm(
+        func=mdp.fused_reward,
+        params={"output": "reaching_object", "std": 0.1, **FUSED_REWARD_ENGINE_PARAMS},
+        weight=1.0,
+    )
+
+    lifting_object = RewTerm(
+        func=mdp.fused_reward,
+        params={"output": "lifting_object", **FUSED_REWARD_ENGINE_PARAMS},
+        weight=10.0,
+    )
+
+    command_progress = RewTerm(
+        func=mdp.fused_reward,
+        params={"output": "command_progress", "std": 0.8, **FUSED_REWARD_ENGINE_PARAMS},
+        weight=30.0,
+    )
+
+    object_goal_tracking = RewTerm(
+        func=mdp.fused_reward,
+        params={"output": "object_goal_tracking", "std": 0.3, **FUSED_REWARD_ENGINE_PARAMS},
+        weight=10.0,
+    )
+
+    object_goal_tracking_fine_grained = RewTerm(
+        func=mdp.fused_reward,
+        params={"output": "object_goal_tracking", "std": 0.05, **FUSED_REWARD_ENGINE_PARAMS},
+        weight=50.0,
+    )
+
+    success_reward = RewTerm(
+        func=mdp.fused_reward,
+        params={"output": "success", **FUSED_REWARD_ENGINE_PARAMS},
+        weight=20000.0,
+    )
+
+    gripper_closed_penalty = RewTerm(
+        func=mdp.fused_reward,
+        params={"output": "gripper_closed_at_goal", "distance_threshold": 0.08, **FUSED_REWARD_ENGINE_PARAMS},
+        weight=-100.0,
+    )
+
+    # Action penalties
+    action_rate = RewTerm(func=isaaclab_mdp.action_rate_l2, weight=-1e-4)
+
+    joint_vel = RewTerm(
+        func=isaaclab_mdp.joint_vel_l2,
+        weight=-1e-4,
+        params={"asset_cfg": SceneEntityCfg("robot")},
+    )
+
+
 @configclass
 class TerminationsCfg:
     """Termination terms for the MDP."""
@@ -322,7 +533,7 @@ class TerminationsCfg:
 
     # Success: ketchup successfully placed in basket
     success = DoneTerm(
-        func=place_mdp.object_a_is_into_b,
+        func=mdp.object_a_is_into_b,
         params={
             "robot_cfg": SceneEntityCfg("robot"),
             "object_a_cfg": SceneEntityCfg("ketchup"),
@@ -359,72 +570,59 @@ class EventCfg:
         params={"reset_joint_targets": True},
     )
 
-    # Randomize object positions
-    randomize_ketchup = EventTerm(
-        func=franka_stack_events.randomize_object_pose,
-        mode="reset",
-        params={
-            "pose_range": {
-                "x": (1.30, 1.45),  
-                "y": (1.45, 1.60),  
-                "z": (0.50771, 0.50771),
-                "roll": (1.5708, 1.5708),
-                "pitch": (0.0, 0.0),
-                "yaw": (-0.3, 0.3),
-            },
-            "min_separation": 0.0,
-            "asset_cfgs": [SceneEntityCfg("ketchup")],
-        },
-    )
-
-    randomize_orange_juice = EventTerm(
-        func=franka_stack_events.randomize_object_pose,
-        mode="reset",
-        params={
-            "pose_range": {
-                "x": (1.10, 1.60),  # Medium generalization: 50cm range
-                "y": (1.20, 1.80),  # Medium generalization: 60cm range
-                "z": (0.52, 0.52),
-                "roll": (1.5708, 1.5708),
-                "pitch": (0.0, 0.0),
-                "yaw": (-0.5, 0.5),
-            },
-            "min_separation": 0.0,
-            "asset_cfgs": [SceneEntityCfg("orange_juice")],
-        },
-    )
+    # Drop memoized success/lifted checks of the previous state
+    reset_step_memo = EventTerm(func=mdp.reset_step_memo, mode="reset")
 
-    randomize_cream_cheese = EventTerm(
-        func=franka_stack_events.randomize_object_pose,
+    # Randomize object positions (all assets sampled in one batched pass)
+    randomize_object_poses = EventTerm(
+        func=mdp.randomize_object_poses,
         mode="reset",
         params={
-            "pose_range": {
-                "x": (1.10, 1.60),
-                "y": (1.20, 1.80),
-                "z": (0.45974, 0.45974),
-                "roll": (1.5708, 1.5708),
-                "pitch": (0.0, 0.0),
-                "yaw": (-0.5, 0.5),
-            },
+            "per_object_pose_ranges": [
+                # Ketchup
+                {
+                    "x": (1.30, 1.45),
+                    "y": (1.45, 1.60),
+                    "z": (0.50771, 0.50771),
+                    "roll": (1.5708, 1.5708),
+                    "pitch": (0.0, 0.0),
+                    "yaw": (-0.3, 0.3),
+                },
+                # Orange juice
+                {
+                    "x": (1.10, 1.60),  # Medium generalization: 50cm range
+                    "y": (1.20, 1.80),  # Medium generalization: 60cm range
+                    "z": (0.52, 0.52),
+                    "roll": (1.5708, 1.5708),
+                    "pitch": (0.0, 0.0),
+                    "yaw": (-0.5, 0.5),
+                },
+                # Cream cheese
+                {
+                    "x": (1.10, 1.60),
+                    "y": (1.20, 1.80),
+                    "z": (0.45974, 0.45974),
+                    "roll": (1.5708, 1.5708),
+                    "pitch": (0.0, 0.0),
+                    "yaw": (-0.5, 0.5),
+                },
+                # Basket
+                {
+                    "x": (1.76, 1.76),  # Fixed X
+                    "y": (1.48, 1.48),  # Fixed Y
+                    "z": (0.48, 0.48),
+                    "roll": (0.0, 0.0),
+                    "pitch": (0.0, 0.0),
+                    "yaw": (0.0, 0.0),
+                },
+            ],
             "min_separation": 0.0,
-            "asset_cfgs": [SceneEntityCfg("cream_cheese")],
-        },
-    )
-
-    randomize_basket = EventTerm(
-        func=franka_stack_events.randomize_object_pose,
-        mode="reset",
-        params={
-            "pose_range": {
-                "x": (1.76, 1.76),  # Fixed X
-                "y": (1.48, 1.48),  # Fixed Y
-                "z": (0.48, 0.48),
-                "roll": (0.0, 0.0),
-                "pitch": (0.0, 0.0),
-                "yaw": (0.0, 0.0),
-            },
-            "min_separation": 0.0,
-            "asset_cfgs": [SceneEntityCfg("basket")],
+            "asset_cfgs": [
+                SceneEntityCfg("ketchup"),
+                SceneEntityCfg("orange_juice"),
+                SceneEntityCfg("cream_cheese"),
+                SceneEntityCfg("basket"),
+            ],
         },
     )
 
@@ -503,3 +701,53 @@ class FrankaDesktopOrganizerIKRelEnvCfg_PLAY(FrankaDesktopOrganizerIKRelEnvCfg):
         self.scene.env_spacing = 2.5
         # disable randomization for play
         self.observations.policy.enable_corruption = False
+        # show the goal marker
+        self.commands.object_pose.debug_vis = True
+
+
+##
+# Franka with IK Control and Fused Rewards Configuration
+##
+@configclass
+class FrankaDesktopOrganizerIKRelFusedEnvCfg(FrankaDesktopOrganizerIKRelEnvCfg):
+    """Configuration for Franka desktop organizer RL with IK relative control and fused rewards."""
+
+    rewards: FusedRewardsCfg = FusedRewardsCfg()
+
+
+##
+# Observation Profile Configurations
+##
+@configclass
+class FrankaDesktopOrganizerIKRelLeanObsEnvCfg(FrankaDesktopOrganizerIKRelEnvCfg):
+    """Configuration for Franka desktop organizer RL with the minimal RL observation profile."""
+
+    observations: LeanObservationsCfg = LeanObservationsCfg()
+
+
+@configclass
+class FrankaDesktopOrganizerIKRelLeanObsEnvCfg_PLAY(FrankaDesktopOrganizerIKRelEnvCfg_PLAY):
+    """Configuration for playing (evaluation) mode with the minimal RL observation profile."""
+
+    observations: LeanObservationsCfg = LeanObservationsCfg()
+
+
+@configclass
+class FrankaDesktopOrganizerIKRelBCObsEnvCfg(FrankaDesktopOrganizerIKRelEnvCfg):
+    """Configuration for Franka desktop organizer with the BC/Mimic observation profile."""
+
+    observations: BCObservationsCfg = BCObservationsCfg()
+
+
+@configclass
+class FrankaDesktopOrganizerIKRelPrivilegedCriticEnvCfg(FrankaDesktopOrganizerIKRelEnvCfg):
+    """Configuration for Franka desktop organizer RL with lean actor and privileged critic observations."""
+
+    observations: PrivilegedCriticObservationsCfg = PrivilegedCriticObservationsCfg()
+
+
+@configclass
+class FrankaDesktopOrganizerIKRelPrivilegedCriticEnvCfg_PLAY(FrankaDesktopOrganizerIKRelEnvCfg_PLAY):
+    """Configuration for playing (evaluation) mode with lean actor and privileged critic observations."""
+
+    observations: PrivilegedCriticObservationsCfg = PrivilegedCriticObservationsCfg()
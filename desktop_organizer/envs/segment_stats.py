@@ -0,0 +1,202 @@
+"""Online success statistics of the Mimic source segments for failure-aware source selection.
+
+With ``selection_strategy="nearest_neighbor_object"``, the Mimic data generator draws the source segment of a
+subtask uniformly among the ``nn_k`` nearest ones, so a source segment that keeps producing failed trials is
+selected as often as a reliable neighbor.
+
+:class:`SourceSegmentStats` counts, for every end-effector, subtask and source demonstration, the generation
+trials that used the segment and succeeded or failed. The ``adaptive_nearest_neighbor_object`` strategy
+(:mod:`desktop_organizer.envs.selection_strategy`) draws among the ``nn_k`` nearest segments by Thompson
+sampling: one success rate is sampled from the Beta posterior of every candidate and the highest one wins.
+Without recorded trials all candidates share the prior and the draw is uniform, as with
+``nearest_neighbor_object``; segments that keep failing are then selected less and less often, while rarely
+tried ones still get explored.
+
+Each generation trial runs in its own asyncio task, whose context holds the segments selected so far in the
+trial (:meth:`begin_trial`, :meth:`select`), so that the outcome of the trial is credited to the segments it
+used (:meth:`end_trial`). A trial selects its segments subtask after subtask, so a trial aborted during a
+subtask is only credited to the segments selected up to that subtask.
+
+The counts are persisted as JSON and reloaded by later runs on the same source demonstrations. Saving adds
+the counts gathered since the last load or save to the file content while holding an exclusive lock on a
+``<file>.lock`` sidecar, so several generation processes can share one file.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import fcntl
+import json
+import numpy as np
+import os
+import tempfile
+from collections.abc import Sequence
+
+STATS_VERSION = 1
+"""Version of the persisted layout. Files of another version are ignored."""
+
+_trial_selections: contextvars.ContextVar[list | None] = contextvars.ContextVar("trial_selections", default=None)
+
+
+class SourceSegmentStats:
+    """Success and failure counts of the source segments, with Thompson sampling among candidates."""
+
+    def __init__(self, file_path: str | None = None, autosave_interval: int = 50):
+        """Load the counts persisted in a file, if any.
+
+        Args:
+            file_path: JSON file of the counts. Defaults to None (the counts are not persisted).
+            autosave_interval: Number of finished trials between two saves to :attr:`file_path`.
+        """
+        self.file_path = file_path
+        self.autosave_interval = autosave_interval
+        self.successes: dict[str, np.ndarray] = {}
+        """Number of successful trials that used each source segment, per ``<eef_name>/<subtask_index>``."""
+        self.failures: dict[str, np.ndarray] = {}
+        """Number of failed trials that used each source segment, per ``<eef_name>/<subtask_index>``."""
+        self.num_trials = 0
+        """Number of trials recorded by this instance."""
+        # counts already in the file, the deltas are added to the file content on save
+        self._saved_successes: dict[str, np.ndarray] = {}
+        self._saved_failures: dict[str, np.ndarray] = {}
+        self._trials_since_save = 0
+        if file_path is not None and os.path.isfile(file_path):
+            self._saved_successes, self._saved_failures = _read_counts(file_path)
+            self.successes = _copy_counts(self._saved_successes)
+            self.failures = _copy_counts(self._saved_failures)
+
+    """
+    Operations.
+    """
+
+    def begin_trial(self):
+        """Start recording the segments selected by the trial of the current asyncio task."""
+        _trial_selections.set([])
+
+    def select(
+        self,
+        eef_name: str,
+        candidates: Sequence[int],
+        prior_successes: float = 1.0,
+        prior_failures: float = 1.0,
+    ) -> int:
+        """Draw one of the candidate source segments of the next subtask of the current trial.
+
+        Args:
+            eef_name: Name of the end-effector.
+            candidates: Indices of the candidate source demonstrations.
+            prior_successes: Pseudo-count of successes of the Beta prior.
+            prior_failures: Pseudo-count of failures of the Beta prior.
+
+        Returns:
+            The index of the selected source demonstration.
+        """
+        selections = _trial_selections.get()
+        # outside a recorded trial, the subtask is unknown: draw uniformly
+        if selections is None:
+            return int(candidates[np.random.randint(len(candidates))])
+        key = f"{eef_name}/{sum(1 for selection in selections if selection[0] == eef_name)}"
+        candidates = np.asarray(candidates, dtype=np.int64)
+        successes = self._counts(self.successes, key, candidates.max() + 1)[candidates]
+        failures = self._counts(self.failures, key, candidates.max() + 1)[candidates]
+        samples = np.random.beta(prior_successes + successes, prior_failures + failures)
+        selected = int(candidates[np.argmax(samples)])
+        selections.append((eef_name, key, selected))
+        return selected
+
+    def end_trial(self, success: bool):
+        """Credit the outcome of the trial of the current asyncio task to the segments it selected."""
+        selections = _trial_selections.get()
+        _trial_selections.set(None)
+        if selections is None:
+            return
+        counts = self.successes if success else self.failures
+        for _, key, source in selections:
+            self._counts(counts, key, source + 1)[source] += 1
+        self.num_trials += 1
+        self._trials_since_save += 1
+        if self.file_path is not None and self._trials_since_save >= self.autosave_interval:
+            self.save()
+
+    def success_rates(self, key: str, prior_successes: float = 1.0, prior_failures: float = 1.0) -> np.ndarray:
+        """Posterior mean success rate of every source segment of one ``<eef_name>/<subtask_index>``."""
+        num_sources = max(len(self.successes.get(key, ())), len(self.failures.get(key, ())))
+        successes = self._counts(self.successes, key, num_sources)
+        failures = self._counts(self.failures, key, num_sources)
+        return (prior_successes + successes) / (prior_successes + prior_failures + successes + failures)
+
+    def save(self, file_path: str | None = None):
+        """Add the counts gathered since the last load or save to the file and reload the merged counts.
+
+        Args:
+            file_path: JSON file of the counts. Defaults to :attr:`file_path`.
+        """
+        file_path = file_path or self.file_path
+        if file_path is None:
+            raise ValueError("No file to save the source segment statistics to.")
+        directory = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(directory, exist_ok=True)
+        # concurrent runs: no other save may replace the file between the read and the replace
+        with open(f"{file_path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            successes, failures = _read_counts(file_path) if os.path.isfile(file_path) else ({}, {})
+            for merged, current, saved in (
+                (successes, self.successes, self._saved_successes),
+                (failures, self.failures, self._saved_failures),
+            ):
+                for key, counts in current.items():
+                    delta = counts - _resized(saved.get(key, np.zeros(0, dtype=np.int64)), len(counts))
+                    on_disk = merged.get(key, np.zeros(0, dtype=np.int64))
+                    size = max(len(on_disk), len(delta))
+                    merged[key] = _resized(on_disk, size) + _resized(delta, size)
+
+            segments = {}
+            for key in sorted(set(successes) | set(failures)):
+                num_sources = max(len(successes.get(key, ())), len(failures.get(key, ())))
+                successes[key] = self._counts(successes, key, num_sources)
+                failures[key] = self._counts(failures, key, num_sources)
+                segments[key] = {"successes": successes[key].tolist(), "failures": failures[key].tolist()}
+            # replace the file atomically, loading runs do not take the lock
+            fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+            with os.fdopen(fd, "w") as file:
+                json.dump({"version": STATS_VERSION, "segments": segments}, file, indent=2)
+            os.replace(tmp_path, file_path)
+
+        self.successes, self.failures = successes, failures
+        self._saved_successes, self._saved_failures = _copy_counts(successes), _copy_counts(failures)
+        self._trials_since_save = 0
+
+    """
+    Helper functions.
+    """
+
+    @staticmethod
+    def _counts(counts: dict[str, np.ndarray], key: str, num_sources: int) -> np.ndarray:
+        # source pools may grow during generation, the counts grow with them
+        array = counts.get(key)
+        if array is None or len(array) < num_sources:
+            array = _resized(np.zeros(0, dtype=np.int64) if array is None else array, num_sources)
+            counts[key] = array
+        return array
+
+
+def _resized(array: np.ndarray, size: int) -> np.ndarray:
+    """Integer copy of an array padded with zeros to at least ``size`` entries."""
+    resized = np.zeros(max(len(array), size), dtype=np.int64)
+    resized[: len(array)] = array
+    return resized
+
+
+def _copy_counts(counts: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    return {key: array.copy() for key, array in counts.items()}
+
+
+def _read_counts(file_path: str) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Read the success and failure counts of a statistics file."""
+    with open(file_path) as file:
+        content = json.load(file)
+    if content.get("version") != STATS_VERSION:
+        return {}, {}
+    successes = {key: np.asarray(value["successes"], dtype=np.int64) for key, value in content["segments"].items()}
+    failures = {key: np.asarray(value["failures"], dtype=np.int64) for key, value in content["segments"].items()}
+    return successes, failures
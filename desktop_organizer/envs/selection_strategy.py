@@ -0,0 +1,72 @@
+"""Failure-aware ``adaptive_nearest_neighbor_object`` source selection strategy of Isaac Lab Mimic.
+
+Isaac Lab Mimic looks up the ``selection_strategy`` of a subtask by name among the subclasses of its
+``SelectionStrategy``, which are registered when they are defined. Importing this module (as
+``scripts/bc/generate_dataset.py`` does) registers :class:`AdaptiveNearestNeighborObjectStrategy` next to
+``nearest_neighbor_object``. The module is not imported by the package, which does not depend on
+``isaaclab_mimic``.
+
+The strategy takes the parameters of ``nearest_neighbor_object`` plus the Beta prior of the success rates
+(``prior_successes``, ``prior_failures``). It draws among the ``nn_k`` nearest source segments with the
+:class:`SourceSegmentStats` set on the class, or uniformly like ``nearest_neighbor_object`` when none is set.
+The ``IndexedDataGenerator`` of ``scripts/bc/generate_dataset.py`` answers the strategy from its prebuilt
+source segment indices instead and passes its statistics directly.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+
+from isaaclab_mimic.datagen.selection_strategy import SelectionStrategy
+
+from desktop_organizer.envs.segment_stats import SourceSegmentStats
+from desktop_organizer.envs.source_index import SourceSegmentIndex
+
+
+class AdaptiveNearestNeighborObjectStrategy(SelectionStrategy):
+    """Thompson sampling among the nearest source segments, by the success counts of the segments."""
+
+    NAME = "adaptive_nearest_neighbor_object"
+
+    segment_stats: SourceSegmentStats | None = None
+    """Success counts the draws are made with. Defaults to None (uniform draw)."""
+
+    eef_name: str | None = None
+    """End-effector the counts are recorded for. The upstream data generator does not pass it to the strategies."""
+
+    def select_source_demo(
+        self,
+        eef_pose: torch.Tensor,
+        object_pose: torch.Tensor,
+        src_subtask_datagen_infos: list,
+        pos_weight: float = 1.0,
+        rot_weight: float = 1.0,
+        nn_k: int = 3,
+        prior_successes: float = 1.0,
+        prior_failures: float = 1.0,
+    ) -> int:
+        """Select a source segment among the ``nn_k`` nearest ones to the current object pose.
+
+        Args:
+            eef_pose: The current end-effector pose. Shape is (4, 4).
+            object_pose: The current pose of the subtask object. Shape is (4, 4).
+            src_subtask_datagen_infos: The datagen info of the subtask segment of every source demonstration.
+            pos_weight: Weight of the position distance (m).
+            rot_weight: Weight of the rotation distance (rad).
+            nn_k: Number of nearest neighbors to draw from.
+            prior_successes: Pseudo-count of successes of the Beta prior.
+            prior_failures: Pseudo-count of failures of the Beta prior.
+
+        Returns:
+            The index of the selected source demonstration.
+        """
+        # the segments only hold the poses of the subtask object
+        index = SourceSegmentIndex([next(iter(info.object_poses.values())) for info in src_subtask_datagen_infos])
+        start_indices = torch.zeros(index.num_sources, dtype=torch.long, device=index.device)
+        neighbors = index.query(
+            object_pose.unsqueeze(0), start_indices, k=nn_k, pos_weight=pos_weight, rot_weight=rot_weight
+        )[0].tolist()
+        if self.segment_stats is None or self.eef_name is None:
+            return neighbors[np.random.randint(len(neighbors))]
+        return self.segment_stats.select(self.eef_name, neighbors, prior_successes, prior_failures)
@@ -0,0 +1,97 @@
+"""Batched SO(3) exponential and logarithm maps on rotation matrices.
+
+The Mimic env converts between delta rotations (axis-angle actions) and rotation matrices. Going through
+quaternions costs an extra conversion in each direction, and the zero-angle case of the axis-angle to
+quaternion path needs a masked assignment. The maps below work directly on rotation matrices with
+Rodrigues' formula. Small angles use Taylor expansions and angles close to pi use the symmetric part of the
+matrix; all cases are evaluated branch-free with :func:`torch.where`.
+"""
+
+from __future__ import annotations
+
+import torch
+
+SMALL_ANGLE = 1.0e-2
+"""Angle (rad) below which the Taylor expansions are used."""
+
+NEAR_PI_COS = -0.95
+"""Cosine of the angle above which :func:`so3_log` extracts the axis from the symmetric part."""
+
+
+def skew(vec: torch.Tensor) -> torch.Tensor:
+    """Skew-symmetric (cross product) matrices of vectors.
+
+    Args:
+        vec: Vectors. Shape is (..., 3).
+
+    Returns:
+        The skew-symmetric matrices. Shape is (..., 3, 3).
+    """
+    x, y, z = vec.unbind(-1)
+    zero = torch.zeros_like(x)
+    return torch.stack([zero, -z, y, z, zero, -x, -y, x, zero], dim=-1).view(*vec.shape[:-1], 3, 3)
+
+
+def so3_exp(axis_angle: torch.Tensor) -> torch.Tensor:
+    """Rotation matrices from axis-angle vectors (Rodrigues' formula).
+
+    Args:
+        axis_angle: Rotation vectors (axis scaled by angle in radians). Shape is (..., 3).
+
+    Returns:
+        The rotation matrices. Shape is (..., 3, 3).
+    """
+    angle_sq = (axis_angle * axis_angle).sum(dim=-1, keepdim=True).unsqueeze(-1)
+    angle = torch.sqrt(angle_sq)
+    small = angle < SMALL_ANGLE
+    # avoid 0 / 0 in the exact branch, the Taylor branch is selected there
+    safe_angle = torch.where(small, torch.ones_like(angle), angle)
+    # R = I + A * K + B * K^2 with A = sin(t) / t and B = (1 - cos(t)) / t^2
+    taylor_a = 1.0 - angle_sq / 6.0 * (1.0 - angle_sq / 20.0)
+    taylor_b = 0.5 - angle_sq / 24.0 * (1.0 - angle_sq / 30.0)
+    coeff_a = torch.where(small, taylor_a, torch.sin(safe_angle) / safe_angle)
+    coeff_b = torch.where(small, taylor_b, (1.0 - torch.cos(safe_angle)) / (safe_angle * safe_angle))
+
+    skew_mat = skew(axis_angle)
+    identity = torch.eye(3, dtype=axis_angle.dtype, device=axis_angle.device)
+    return identity + coeff_a * skew_mat + coeff_b * (skew_mat @ skew_mat)
+
+
+def so3_log(rot: torch.Tensor) -> torch.Tensor:
+    """Axis-angle vectors of rotation matrices, with angles in [0, pi].
+
+    Args:
+        rot: Rotation matrices. Shape is (..., 3, 3).
+
+    Returns:
+        The rotation vectors (axis scaled by angle in radians). Shape is (..., 3).
+    """
+    trace = rot[..., 0, 0] + rot[..., 1, 1] + rot[..., 2, 2]
+    cos_angle = torch.clamp((trace - 1.0) * 0.5, -1.0, 1.0).unsqueeze(-1)
+    # vee(R - R^T) = 2 * sin(t) * axis
+    vee = torch.stack(
+        [rot[..., 2, 1] - rot[..., 1, 2], rot[..., 0, 2] - rot[..., 2, 0], rot[..., 1, 0] - rot[..., 0, 1]], dim=-1
+    )
+    sin_angle = 0.5 * torch.linalg.vector_norm(vee, dim=-1, keepdim=True)
+    # atan2 keeps full precision near 0 and pi, unlike acos of the trace
+    angle = torch.atan2(sin_angle, cos_angle)
+
+    # general and small angles: axis_angle = t / (2 sin(t)) * vee
+    small = angle < SMALL_ANGLE
+    safe_sin = torch.where(small, torch.ones_like(sin_angle), sin_angle)
+    angle_sq = angle * angle
+    scale = torch.where(small, 0.5 + angle_sq / 12.0 * (1.0 + 0.7 * angle_sq / 6.0), 0.5 * angle / safe_sin)
+    axis_angle = scale * vee
+
+    # angles close to pi: sin(t) vanishes, use R + R^T = 2 cos(t) I + 2 (1 - cos(t)) a a^T instead
+    identity = torch.eye(3, dtype=rot.dtype, device=rot.device)
+    outer = 0.5 * (rot + rot.transpose(-1, -2)) - cos_angle.unsqueeze(-1) * identity
+    outer = outer / (1.0 - cos_angle).clamp_min(1.0e-6).unsqueeze(-1)
+    # the row with the largest diagonal entry is the best conditioned multiple of the axis
+    row = torch.argmax(torch.diagonal(outer, dim1=-2, dim2=-1), dim=-1, keepdim=True)
+    axis = torch.take_along_dim(outer, row.unsqueeze(-1), dim=-2).squeeze(-2)
+    axis = axis / torch.linalg.vector_norm(axis, dim=-1, keepdim=True).clamp_min(1.0e-12)
+    # the sign of the axis follows vee (undetermined exactly at pi, where both signs are equivalent)
+    axis = torch.where((axis * vee).sum(dim=-1, keepdim=True) < 0.0, -axis, axis)
+
+    return torch.where(cos_angle < NEAR_PI_COS, angle * axis, axis_angle)
@@ -0,0 +1,231 @@
+"""On-disk cache of the parsed Mimic source demonstrations.
+
+Every ``generate_dataset.py`` run loads the annotated source dataset into the datagen info pool, which reads
+every episode entirely (all observations and states) through the dataset file handler, although the pool only
+keeps ``obs/datagen_info`` and the actions. This module extracts those entries once and stores them as
+contiguous ``.npy`` arrays (one array per entry, the episodes concatenated along time) with a JSON manifest
+of the episode names and offsets. Later runs memory-map the arrays, so startup no longer depends on the size
+of the source dataset.
+
+A cache entry is keyed by the content hash of the dataset file and by the subtask configuration (term signals
+and offset ranges of every end-effector), which decides the subtask segments parsed from the signals: editing
+either creates a new entry. Hashing a large dataset takes a while, so the hash is recorded with the size and
+modification time of the file and only recomputed when they change. Entries are written to a temporary
+directory and renamed, so an interrupted run never leaves a partial cache behind.
+"""
+
+from __future__ import annotations
+
+import h5py
+import hashlib
+import json
+import numpy as np
+import os
+import shutil
+import tempfile
+from collections.abc import Mapping
+
+CACHE_VERSION = 1
+"""Version of the cache layout. Bumping it invalidates all existing entries."""
+
+DATAGEN_INFO_KEYS = ("eef_pose", "target_eef_pose", "object_pose", "subtask_term_signals")
+"""Groups of ``obs/datagen_info`` read by the datagen info pool."""
+
+_SEPARATOR = "__"
+
+
+def file_digest(file_path: str, chunk_size: int = 1 << 24) -> str:
+    """BLAKE2b hash of the content of a file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dataset_digest(file_path: str, cache_root: str) -> str:
+    """Content hash of a dataset, reused while the size and modification time of the file are unchanged.
+
+    Args:
+        file_path: Path to the dataset.
+        cache_root: Directory of the cache entries, which holds the recorded hashes.
+
+    Returns:
+        The hexadecimal digest of :func:`file_digest`.
+    """
+    stat = os.stat(file_path)
+    records_path = os.path.join(cache_root, "file_digests.json")
+    records = {}
+    if os.path.isfile(records_path):
+        with open(records_path) as file:
+            records = json.load(file)
+    key = os.path.realpath(file_path)
+    record = records.get(key)
+    if record is not None and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+        return record["digest"]
+
+    digest = file_digest(file_path)
+    records[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}
+    os.makedirs(cache_root, exist_ok=True)
+    # replace the records atomically, concurrent runs may read them
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=cache_root)
+    with os.fdopen(fd, "w") as file:
+        json.dump(records, file, indent=2)
+    os.replace(tmp_path, records_path)
+    return digest
+
+
+def subtask_config_digest(subtask_configs: Mapping[str, list]) -> str:
+    """Hash of the subtask settings that decide how the source demonstrations are split into segments.
+
+    Args:
+        subtask_configs: The ``SubTaskConfig`` list of every end-effector (``MimicEnvCfg.subtask_configs``).
+
+    Returns:
+        The hexadecimal digest.
+    """
+    settings = {
+        eef_name: [
+            [subtask_config.subtask_term_signal, list(subtask_config.subtask_term_offset_range)]
+            for subtask_config in configs
+        ]
+        for eef_name, configs in sorted(subtask_configs.items())
+    }
+    payload = json.dumps({"version": CACHE_VERSION, "subtasks": settings}, sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def read_source_episodes(file_path: str) -> dict[str, dict]:
+    """Read the datagen info and actions of every episode of an annotated dataset.
+
+    Args:
+        file_path: Path to the annotated HDF5 dataset.
+
+    Returns:
+        The episodes in file order, each a nested dictionary ``{"actions": (T, A), "obs": {"datagen_info":
+        {<group>: {<name>: array}}}}`` with the groups of :data:`DATAGEN_INFO_KEYS`.
+    """
+    episodes = {}
+    with h5py.File(file_path, "r") as file:
+        for episode_name, demo in file["data"].items():
+            if "obs/datagen_info" not in demo:
+                raise ValueError(f"Episode '{episode_name}' of '{file_path}' lacks datagen_info annotations.")
+            datagen_info = {
+                key: {name: dataset[()] for name, dataset in demo[f"obs/datagen_info/{key}"].items()}
+                for key in DATAGEN_INFO_KEYS
+            }
+            episodes[episode_name] = {"actions": demo["actions"][()], "obs": {"datagen_info": datagen_info}}
+    return episodes
+
+
+def _flatten(episode: dict) -> dict[str, np.ndarray]:
+    """Arrays of one episode keyed by their file names in the cache."""
+    arrays = {"actions": episode["actions"]}
+    for key, entries in episode["obs"]["datagen_info"].items():
+        for name, value in entries.items():
+            arrays[f"{key}{_SEPARATOR}{name}"] = value
+    return arrays
+
+
+def write_source_cache(cache_dir: str, episodes: Mapping[str, dict]):
+    """Write parsed episodes as contiguous arrays and a manifest.
+
+    Args:
+        cache_dir: Directory of the cache entry. An entry of another layout version is replaced; a valid entry
+            written concurrently by another process is kept.
+        episodes: The episodes returned by :func:`read_source_episodes`.
+    """
+    flat_episodes = {name: _flatten(episode) for name, episode in episodes.items()}
+    names = list(flat_episodes)
+    keys = sorted(flat_episodes[names[0]]) if names else []
+    for name, arrays in flat_episodes.items():
+        if sorted(arrays) != keys:
+            raise ValueError(f"Episode '{name}' does not have the same datagen info entries as '{names[0]}'.")
+    lengths = [int(flat_episodes[name]["actions"].shape[0]) for name in names]
+
+    parent_dir = os.path.dirname(os.path.abspath(cache_dir))
+    os.makedirs(parent_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=parent_dir)
+    try:
+        for key in keys:
+            values = [flat_episodes[name][key] for name in names]
+            if any(value.shape[0] != length for value, length in zip(values, lengths)):
+                raise ValueError(f"The '{key}' entries do not have one row per action.")
+            np.save(os.path.join(tmp_dir, f"{key}.npy"), np.ascontiguousarray(np.concatenate(values, axis=0)))
+        manifest = {
+            "version": CACHE_VERSION,
+            "episodes": names,
+            "offsets": np.concatenate([[0], np.cumsum(lengths)]).tolist(),
+            "keys": keys,
+        }
+        with open(os.path.join(tmp_dir, "manifest.json"), "w") as file:
+            json.dump(manifest, file, indent=2)
+        if os.path.isdir(cache_dir) and read_source_cache(cache_dir) is None:
+            shutil.rmtree(cache_dir)
+        try:
+            os.replace(tmp_dir, cache_dir)
+        except OSError:
+            # a concurrent generation process wrote the same entry first
+            if read_source_cache(cache_dir) is None:
+                raise
+            shutil.rmtree(tmp_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def read_source_cache(cache_dir: str) -> dict[str, dict] | None:
+    """Memory-map a cache entry.
+
+    Args:
+        cache_dir: Directory of the cache entry.
+
+    Returns:
+        The episodes in the layout of :func:`read_source_episodes`, as copy-on-write memory-mapped views, or
+        None if the entry is missing or has another layout version.
+    """
+    manifest_path = os.path.join(cache_dir, "manifest.json")
+    if not os.path.isfile(manifest_path):
+        return None
+    with open(manifest_path) as file:
+        manifest = json.load(file)
+    if manifest.get("version") != CACHE_VERSION:
+        return None
+
+    arrays = {key: np.load(os.path.join(cache_dir, f"{key}.npy"), mmap_mode="c") for key in manifest["keys"]}
+    offsets = manifest["offsets"]
+    episodes = {}
+    for index, name in enumerate(manifest["episodes"]):
+        rows = slice(offsets[index], offsets[index + 1])
+        datagen_info = {key: {} for key in DATAGEN_INFO_KEYS}
+        for key, array in arrays.items():
+            if key != "actions":
+                group, entry = key.split(_SEPARATOR, 1)
+                datagen_info[group][entry] = array[rows]
+        episodes[name] = {"actions": arrays["actions"][rows], "obs": {"datagen_info": datagen_info}}
+    return episodes
+
+
+def load_source_episodes(
+    file_path: str, subtask_configs: Mapping[str, list], cache_root: str | None = None
+) -> tuple[dict[str, dict], str]:
+    """Load the parsed source episodes from the cache, building the cache entry on a miss.
+
+    Args:
+        file_path: Path to the annotated HDF5 dataset.
+        subtask_configs: The ``SubTaskConfig`` list of every end-effector.
+        cache_root: Directory of the cache entries. Defaults to ``.source_cache`` next to the dataset.
+
+    Returns:
+        A tuple of the episodes (layout of :func:`read_source_episodes`) and the directory of the cache entry.
+    """
+    if cache_root is None:
+        cache_root = os.path.join(os.path.dirname(os.path.abspath(file_path)), ".source_cache")
+    key = f"{dataset_digest(file_path, cache_root)}-{subtask_config_digest(subtask_configs)}"
+    cache_dir = os.path.join(cache_root, key)
+
+    episodes = read_source_cache(cache_dir)
+    if episodes is None:
+        write_source_cache(cache_dir, read_source_episodes(file_path))
+        episodes = read_source_cache(cache_dir)
+    return episodes, cache_dir
@@ -0,0 +1,162 @@
+"""Prebuilt nearest-neighbor index over the object poses of the Mimic source demonstrations.
+
+With ``selection_strategy="nearest_neighbor_object"``, the Mimic data generator picks the source segment of
+a subtask by comparing the current object pose with the object pose at the start of that subtask in every
+source demonstration, and draws one of the ``nn_k`` closest segments uniformly at random. The upstream
+strategy rebuilds the list of source segments and stacks their start poses on every selection, so its cost
+grows with the size of the source pool.
+
+:class:`SourceSegmentIndex` stacks the object pose trajectories of all source demonstrations once, at
+generation start, as padded (M, T, 3) positions and (M, T, 3, 3) rotations. A query gathers the segment
+start poses for the current subtask boundaries (which are re-randomized for every generation trial) and
+scores all segments against a batch of object poses with one distance matrix, so the selections of all
+environments can be answered at once. The distance is the one of the upstream strategy:
+``pos_weight * |p_src - p| + rot_weight * angle(R_src R^T)``.
+
+One index per object serves every subtask that refers to the object: the subtasks only differ by their
+segment start indices.
+"""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+
+class SourceSegmentIndex:
+    """Nearest-neighbor index over the poses of one object in all source demonstrations."""
+
+    def __init__(self, object_poses: Sequence[torch.Tensor], device: str | torch.device | None = None):
+        """Stack the object pose trajectories of the source demonstrations.
+
+        Args:
+            object_poses: The object pose trajectory of every source demonstration, each with shape (T_i, 4, 4).
+                Shorter trajectories are padded with their last pose.
+            device: Device of the index. Defaults to the device of the first trajectory.
+        """
+        if len(object_poses) == 0:
+            raise ValueError("Cannot build a source segment index without source demonstrations.")
+        device = object_poses[0].device if device is None else device
+        lengths = [pose.shape[0] for pose in object_poses]
+        max_length = max(lengths)
+
+        stacked = torch.empty(len(object_poses), max_length, 4, 4, device=device)
+        for demo_index, pose in enumerate(object_poses):
+            stacked[demo_index, : pose.shape[0]] = pose
+            stacked[demo_index, pose.shape[0] :] = pose[-1]
+
+        self.positions = stacked[:, :, :3, 3].contiguous()
+        """Object positions of all source demonstrations. Shape is (M, T, 3)."""
+        self.rotations = stacked[:, :, :3, :3].contiguous()
+        """Object rotation matrices of all source demonstrations. Shape is (M, T, 3, 3)."""
+        self.lengths = torch.tensor(lengths, device=device)
+        """Number of steps of each source demonstration. Shape is (M,)."""
+        self._sources = torch.arange(len(object_poses), device=device)
+
+    @classmethod
+    def from_datagen_infos(
+        cls, datagen_infos: Sequence, object_name: str, device: str | torch.device | None = None
+    ) -> SourceSegmentIndex:
+        """Build the index of one object from the datagen infos of a Mimic source pool.
+
+        Args:
+            datagen_infos: The ``DatagenInfo`` of every source demonstration (``DataGenInfoPool.datagen_infos``).
+            object_name: Name of the object (the ``object_ref`` of the subtasks).
+            device: Device of the index.
+
+        Returns:
+            The index over the poses of the object.
+        """
+        return cls([info.object_poses[object_name] for info in datagen_infos], device=device)
+
+    @property
+    def num_sources(self) -> int:
+        """Number of source demonstrations in the index."""
+        return self.positions.shape[0]
+
+    @property
+    def device(self) -> torch.device:
+        """Device of the index."""
+        return self.positions.device
+
+    def distances(
+        self,
+        object_pose: torch.Tensor,
+        start_indices: torch.Tensor,
+        pos_weight: float = 1.0,
+        rot_weight: float = 1.0,
+    ) -> torch.Tensor:
+        """Weighted pose distances between query object poses and the source segment starts.
+
+        Args:
+            object_pose: The query object poses. Shape is (N, 4, 4).
+            start_indices: The first step of the subtask segment in every source demonstration. Shape is (M,).
+            pos_weight: Weight of the position distance (m).
+            rot_weight: Weight of the rotation distance (rad).
+
+        Returns:
+            The distances of every query to every source segment. Shape is (N, M).
+        """
+        start_indices = torch.as_tensor(start_indices, device=self.device).long()
+        start_indices = torch.minimum(start_indices, self.lengths - 1)
+        src_pos = self.positions[self._sources, start_indices]
+        src_rot = self.rotations[self._sources, start_indices]
+
+        object_pose = object_pose.to(self.device, self.positions.dtype)
+        # exact differences: the matrix-product path of torch.cdist loses precision on nearby points
+        pos_dists = torch.linalg.vector_norm(object_pose[:, None, :3, 3] - src_pos, dim=-1)
+        # trace(R_src R^T) is the sum of the element-wise products of both matrices
+        trace = torch.einsum("nij,mij->nm", object_pose[:, :3, :3], src_rot)
+        rot_dists = torch.arccos(torch.clamp((trace - 1.0) / 2.0, -1.0, 1.0))
+        return pos_weight * pos_dists + rot_weight * rot_dists
+
+    def query(
+        self,
+        object_pose: torch.Tensor,
+        start_indices: torch.Tensor,
+        k: int = 3,
+        pos_weight: float = 1.0,
+        rot_weight: float = 1.0,
+    ) -> torch.Tensor:
+        """Nearest source segments of a batch of object poses.
+
+        Args:
+            object_pose: The query object poses. Shape is (N, 4, 4).
+            start_indices: The first step of the subtask segment in every source demonstration. Shape is (M,).
+            k: Number of neighbors, clipped to the number of source demonstrations.
+            pos_weight: Weight of the position distance (m).
+            rot_weight: Weight of the rotation distance (rad).
+
+        Returns:
+            The indices of the source demonstrations, nearest first. Shape is (N, min(k, M)).
+        """
+        dists = self.distances(object_pose, start_indices, pos_weight=pos_weight, rot_weight=rot_weight)
+        return torch.topk(dists, k=min(k, self.num_sources), dim=1, largest=False).indices
+
+    def select(
+        self,
+        object_pose: torch.Tensor,
+        start_indices: torch.Tensor,
+        nn_k: int = 3,
+        pos_weight: float = 1.0,
+        rot_weight: float = 1.0,
+        generator: torch.Generator | None = None,
+    ) -> torch.Tensor:
+        """Draw one of the ``nn_k`` nearest source segments uniformly at random for every query.
+
+        This is the ``nearest_neighbor_object`` selection strategy of Mimic, batched over the queries.
+
+        Args:
+            object_pose: The query object poses. Shape is (N, 4, 4).
+            start_indices: The first step of the subtask segment in every source demonstration. Shape is (M,).
+            nn_k: Number of nearest neighbors to draw from.
+            pos_weight: Weight of the position distance (m).
+            rot_weight: Weight of the rotation distance (rad).
+            generator: Random number generator of the draws. Defaults to the global generator.
+
+        Returns:
+            The indices of the selected source demonstrations. Shape is (N,).
+        """
+        neighbors = self.query(object_pose, start_indices, k=nn_k, pos_weight=pos_weight, rot_weight=rot_weight)
+        draws = torch.randint(neighbors.shape[1], (neighbors.shape[0], 1), generator=generator, device=self.device)
+        return torch.gather(neighbors, 1, draws).squeeze(1)
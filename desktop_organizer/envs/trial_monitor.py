@@ -0,0 +1,212 @@
+"""Generation-time failure detectors that abort doomed Mimic trials early.
+
+The Mimic data generator executes every subtask segment of a trial to the end and only checks success
+afterwards. A trial whose ketchup fell off the table, slipped out of the gripper during the lift, or whose
+end-effector stopped following the generated targets keeps its environment busy for hundreds of steps and
+is then exported as failed anyway.
+
+:class:`TrialMonitor` evaluates three detectors for all environments once per environment step:
+
+- ``object_dropped``: the object is below ``minimum_height`` (the height of the ``object_dropping``
+  termination of the RL task).
+- ``grasp_lost``: the object was grasped in this trial (``grasp`` subtask signal) and is not grasped any more
+  for ``grasp_lost_steps`` consecutive steps while the gripper is still commanded closed. An opening command
+  (the release of the place subtask) is never a failure.
+- ``target_diverged``: the end-effector is further than ``max_target_error`` from the transformed target pose
+  for ``target_error_steps`` consecutive steps. The IK-relative actions are the difference between the target
+  pose and the current end-effector pose, so the distance is the norm of the position part of the last action.
+
+:class:`MonitoredActionQueue` wraps the action queue handed to one data generator coroutine. Before an
+action is queued, it raises :class:`TrialAborted` if a detector fired for the environment of the coroutine,
+which ends :meth:`DataGenerator.generate` at the first violation. The generation loop then exports the partial
+episode as failed (with its ``failure_reason``) and starts the next trial in the same environment slot.
+"""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.utils import configclass
+
+from desktop_organizer import mdp
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLMimicEnv
+
+FAILURE_REASONS = ("object_dropped", "grasp_lost", "target_diverged")
+"""Names of the failure reasons. The ``failure_reason`` of an aborted episode is an index into this tuple."""
+
+
+@configclass
+class TrialFailureCfg:
+    """Configuration of the failure detectors of the Mimic generation trials."""
+
+    signal_params: dict = {}
+    """Parameters of :func:`desktop_organizer.mdp.subtask_signals`, shared with the ``subtask_terms`` group so
+    that both read one evaluation per step. ``object_cfg`` is the monitored object."""
+
+    minimum_height: float = 0.3
+    """Height (m) below which the object counts as dropped."""
+
+    grasp_lost_steps: int = 5
+    """Consecutive steps without grasp, while the gripper is commanded closed, after which the grasp is lost."""
+
+    max_target_error: float = 0.1
+    """Distance (m) between the end-effector and its target above which the target counts as not followed."""
+
+    target_error_steps: int = 10
+    """Consecutive steps above :attr:`max_target_error` after which the trial is aborted."""
+
+
+class TrialAborted(Exception):
+    """Raised in a data generator coroutine when its current trial is doomed."""
+
+    def __init__(self, env_id: int, reason: str):
+        super().__init__(f"Trial in env {env_id} aborted: {reason}")
+        self.env_id = env_id
+        self.reason = reason
+
+
+class TrialMonitor:
+    """Batched failure detectors of the trials running in all environments."""
+
+    def __init__(self, env: ManagerBasedRLMimicEnv, cfg: TrialFailureCfg):
+        self.env = env
+        self.cfg = cfg
+        # resolve private copies, the memo key then matches the one of the resolved observation terms
+        self._signal_params = {}
+        for name, value in cfg.signal_params.items():
+            if isinstance(value, SceneEntityCfg):
+                value = value.replace()
+                value.resolve(env.scene)
+            self._signal_params[name] = value
+        self._object_name = self._signal_params.get("object_cfg", SceneEntityCfg("ketchup")).name
+
+        num_envs = env.num_envs
+        self._grasped = torch.zeros(num_envs, dtype=torch.bool, device=env.device)
+        self._grasp_lost_steps = torch.zeros(num_envs, dtype=torch.long, device=env.device)
+        self._target_error_steps = torch.zeros(num_envs, dtype=torch.long, device=env.device)
+        self._reasons = [None] * num_envs
+        self._step = None
+        self.counts = {reason: 0 for reason in FAILURE_REASONS}
+        """Number of aborted trials per failure reason."""
+
+    """
+    Operations.
+    """
+
+    def start_trial(self, env_id: int):
+        """Clear the detector state of an environment at the start of a new trial."""
+        self._grasped[env_id] = False
+        self._grasp_lost_steps[env_id] = 0
+        self._target_error_steps[env_id] = 0
+        self._reasons[env_id] = None
+
+    def failure(self, env_id: int) -> str | None:
+        """Failure reason of the current trial of an environment, or None while the trial is sound."""
+        self._update()
+        return self._reasons[env_id]
+
+    def abort_trial(self, env_id: int, reason: str):
+        """Export the partial episode of an aborted trial as failed, with its ``failure_reason``."""
+        env_ids = [env_id]
+        recorder_manager = self.env.recorder_manager
+        code = torch.tensor([FAILURE_REASONS.index(reason)], dtype=torch.long, device=self.env.device)
+        recorder_manager.add_to_episodes("failure_reason", code, env_ids)
+        recorder_manager.set_success_to_episodes(
+            env_ids, torch.tensor([[False]], dtype=torch.bool, device=self.env.device)
+        )
+        recorder_manager.export_episodes(env_ids)
+        self.counts[reason] += 1
+
+    """
+    Helper functions.
+    """
+
+    def _update(self):
+        # all coroutines query after the same step, the detectors run once for all of them
+        step = self.env.common_step_counter
+        if step == self._step:
+            return
+        self._step = step
+
+        signals = mdp.subtask_signals(self.env, **self._signal_params)
+        object_height = self.env.scene[self._object_name].data.root_pos_w[:, 2]
+        actions = self.env.action_manager.action
+        reasons = detect_trial_failures(
+            object_height=object_height,
+            grasping=signals[:, mdp.SUBTASK_SIGNALS.index("grasp")],
+            gripper_closing=actions[:, -1] < 0.0,
+            target_error=torch.linalg.vector_norm(actions[:, :3], dim=1),
+            grasped=self._grasped,
+            grasp_lost_steps=self._grasp_lost_steps,
+            target_error_steps=self._target_error_steps,
+            cfg=self.cfg,
+        )
+        # one transfer per step, the coroutines then read plain Python values
+        for env_id, code in enumerate(reasons.tolist()):
+            if code >= 0 and self._reasons[env_id] is None:
+                self._reasons[env_id] = FAILURE_REASONS[code]
+
+
+class MonitoredActionQueue:
+    """Action queue of the data generator coroutines that aborts doomed trials before their next action."""
+
+    def __init__(self, queue, monitor: TrialMonitor):
+        self._queue = queue
+        self._monitor = monitor
+
+    async def put(self, item):
+        env_id = int(item[0])
+        reason = self._monitor.failure(env_id)
+        if reason is not None:
+            raise TrialAborted(env_id, reason)
+        await self._queue.put(item)
+
+    def __getattr__(self, name):
+        return getattr(self._queue, name)
+
+
+def detect_trial_failures(
+    object_height: torch.Tensor,
+    grasping: torch.Tensor,
+    gripper_closing: torch.Tensor,
+    target_error: torch.Tensor,
+    grasped: torch.Tensor,
+    grasp_lost_steps: torch.Tensor,
+    target_error_steps: torch.Tensor,
+    cfg: TrialFailureCfg,
+) -> torch.Tensor:
+    """Advance the detectors by one step for all environments.
+
+    Args:
+        object_height: Height (m) of the object. Shape is (N,).
+        grasping: Whether the object is grasped. Shape is (N,).
+        gripper_closing: Whether the last gripper action closes the gripper. Shape is (N,).
+        target_error: Distance (m) between the end-effector and its target. Shape is (N,).
+        grasped: Whether the object was grasped in the current trial. Shape is (N,). Updated in-place.
+        grasp_lost_steps: Consecutive steps of lost grasp. Shape is (N,). Updated in-place.
+        target_error_steps: Consecutive steps of large target error. Shape is (N,). Updated in-place.
+        cfg: The detector configuration.
+
+    Returns:
+        The index in :data:`FAILURE_REASONS` of the first firing detector, or -1. Shape is (N,).
+    """
+    grasped |= grasping
+    lost = grasped & ~grasping & gripper_closing
+    grasp_lost_steps.copy_(torch.where(lost, grasp_lost_steps + 1, 0))
+    diverged = target_error > cfg.max_target_error
+    target_error_steps.copy_(torch.where(diverged, target_error_steps + 1, 0))
+
+    failures = torch.stack(
+        [
+            object_height < cfg.minimum_height,
+            grasp_lost_steps >= cfg.grasp_lost_steps,
+            target_error_steps >= cfg.target_error_steps,
+        ],
+        dim=1,
+    )
+    # argmax returns the first True column
+    return torch.where(failures.any(dim=1), failures.int().argmax(dim=1), -1)
@@ -7,16 +7,75 @@ from isaaclab.envs.mdp import *  # noqa: F401, F403
 from isaaclab_tasks.manager_based.manipulation.lift.mdp import (  # noqa: F401
     object_ee_distance,
     object_goal_distance,
-    object_is_lifted,
     object_position_in_robot_root_frame,
 )
 
 # Import custom reward functions
 from .rewards import object_command_progress, gripper_closed_at_goal  # noqa: F401
 
+# Import fused reward engine
+from .fused_rewards import FusedRewardEngine, RewardIntermediates, fused_reward  # noqa: F401
+
+# Import per-step memoization and memoized predicates
+from .memo import StepMemo, get_step_memo, memoized, reset_step_memo  # noqa: F401
+from .predicates import object_a_is_into_b, object_is_lifted  # noqa: F401
+
+# Import custom observation functions
+from .observations import (  # noqa: F401
+    ee_frame_pose_matrix,
+    object_pose_in_robot_root_frame,
+    object_poses_in_robot_root_frame,
+)
+
+# Import subtask signals for Mimic annotation
+from .subtasks import SUBTASK_SIGNALS, subtask_signal, subtask_signals  # noqa: F401
+
+# Import custom command terms
+from .commands import FixedPoseCommand  # noqa: F401
+from .commands_cfg import FixedPoseCommandCfg  # noqa: F401
+
+# Import batched reset events
+from .events import randomize_object_poses, sample_object_poses_batched  # noqa: F401
+from .layout_bank import build_layout_bank, load_layout_bank, reset_from_layout_bank  # noqa: F401
+
+# Import batched multi-object terms
+from .multi_object import (  # noqa: F401
+    MultiObjectEngine,
+    multi_object_observation,
+    multi_object_reward,
+    multi_object_termination,
+    sample_active_object,
+)
+
 __all__ = [
     "object_command_progress",
     "gripper_closed_at_goal",
+    "FusedRewardEngine",
+    "RewardIntermediates",
+    "fused_reward",
+    "StepMemo",
+    "get_step_memo",
+    "memoized",
+    "reset_step_memo",
+    "object_a_is_into_b",
+    "ee_frame_pose_matrix",
+    "object_pose_in_robot_root_frame",
+    "object_poses_in_robot_root_frame",
+    "SUBTASK_SIGNALS",
+    "subtask_signal",
+    "subtask_signals",
+    "FixedPoseCommand",
+    "FixedPoseCommandCfg",
+    "randomize_object_poses",
+    "sample_object_poses_batched",
+    "build_layout_bank",
+    "load_layout_bank",
+    "reset_from_layout_bank",
+    "MultiObjectEngine",
+    "multi_object_observation",
+    "multi_object_reward",
+    "multi_object_termination",
+    "sample_active_object",
     "object_ee_distance",
     "object_goal_distance",
     "object_is_lifted",
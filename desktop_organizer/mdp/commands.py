@@ -0,0 +1,136 @@
+"""Custom command terms for Desktop Organizer task."""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from isaaclab.assets import Articulation, RigidObject
+from isaaclab.managers import CommandTerm
+from isaaclab.markers import VisualizationMarkers
+from isaaclab.utils.math import combine_frame_transforms, subtract_frame_transforms
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+    from .commands_cfg import FixedPoseCommandCfg
+
+
+class FixedPoseCommand(CommandTerm):
+    """Command term holding a constant goal pose in the robot root frame.
+
+    Unlike :class:`isaaclab.envs.mdp.UniformPoseCommand` with degenerate ranges, the goal is never
+    resampled and no metrics are tracked, so :meth:`compute` does no work. If a target asset is configured,
+    the goal position follows the target (plus an offset) and is recomputed only when environments reset.
+    The goal is stored as a device tensor and returned without copies.
+    """
+
+    cfg: FixedPoseCommandCfg
+    """Configuration for the command term."""
+
+    def __init__(self, cfg: FixedPoseCommandCfg, env: ManagerBasedEnv):
+        """Initialize the command term.
+
+        Args:
+            cfg: The configuration parameters for the command term.
+            env: The environment object.
+        """
+        super().__init__(cfg, env)
+
+        # extract the robot and the target asset
+        self.robot: Articulation = env.scene[cfg.asset_name]
+        self.target: RigidObject | None = env.scene[cfg.target_asset_name] if cfg.target_asset_name else None
+        self._target_offset = torch.tensor(cfg.target_offset, dtype=torch.float, device=self.device)
+
+        # create buffers
+        # -- command: (x, y, z, qw, qx, qy, qz) in root frame
+        self.pose_command_b = torch.zeros(self.num_envs, 7, device=self.device)
+        self.pose_command_b[:, :3] = torch.tensor(cfg.pos, dtype=torch.float, device=self.device)
+        self.pose_command_b[:, 3:] = torch.tensor(cfg.rot, dtype=torch.float, device=self.device)
+
+    def __str__(self) -> str:
+        msg = "FixedPoseCommand:\n"
+        msg += f"\tCommand dimension: {tuple(self.command.shape[1:])}\n"
+        msg += f"\tTarget asset: {self.cfg.target_asset_name}\n"
+        return msg
+
+    """
+    Properties
+    """
+
+    @property
+    def command(self) -> torch.Tensor:
+        """The desired pose command. Shape is (num_envs, 7).
+
+        The first three elements correspond to the position, followed by the quaternion orientation in (w, x, y, z).
+        """
+        return self.pose_command_b
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, float]:
+        """Move the goal of the reset environments onto the target asset, if one is configured.
+
+        Args:
+            env_ids: The list of environment IDs to reset. Defaults to None.
+
+        Returns:
+            An empty dictionary, since the term has no metrics.
+        """
+        if env_ids is None:
+            env_ids = slice(None)
+        if self.target is not None:
+            # the reset events have already written the new target pose
+            goal_pos_w = self.target.data.root_pos_w[env_ids] + self._target_offset
+            self.pose_command_b[env_ids, :3], _ = subtract_frame_transforms(
+                self.robot.data.root_pos_w[env_ids], self.robot.data.root_quat_w[env_ids], goal_pos_w
+            )
+        return {}
+
+    def compute(self, dt: float):
+        """Keep the goal unchanged (no resampling, no metrics).
+
+        Args:
+            dt: The time step passed since the last call to compute.
+        """
+        pass
+
+    """
+    Implementation specific functions.
+    """
+
+    def _update_metrics(self):
+        pass
+
+    def _resample_command(self, env_ids: Sequence[int]):
+        pass
+
+    def _update_command(self):
+        pass
+
+    def _set_debug_vis_impl(self, debug_vis: bool):
+        # create markers if necessary for the first time
+        if debug_vis:
+            if not hasattr(self, "goal_pose_visualizer"):
+                self.goal_pose_visualizer = VisualizationMarkers(self.cfg.goal_pose_visualizer_cfg)
+            # set their visibility to true
+            self.goal_pose_visualizer.set_visibility(True)
+        else:
+            if hasattr(self, "goal_pose_visualizer"):
+                self.goal_pose_visualizer.set_visibility(False)
+
+    def _debug_vis_callback(self, event):
+        # check if robot is initialized
+        if not self.robot.is_initialized:
+            return
+        # update the goal marker in world frame
+        goal_pos_w, goal_quat_w = combine_frame_transforms(
+            self.robot.data.root_pos_w,
+            self.robot.data.root_quat_w,
+            self.pose_command_b[:, :3],
+            self.pose_command_b[:, 3:],
+        )
+        self.goal_pose_visualizer.visualize(goal_pos_w, goal_quat_w)
@@ -0,0 +1,45 @@
+"""Configuration for custom command terms of Desktop Organizer task."""
+
+import math
+from dataclasses import MISSING
+
+from isaaclab.managers import CommandTermCfg
+from isaaclab.markers import VisualizationMarkersCfg
+from isaaclab.markers.config import FRAME_MARKER_CFG
+from isaaclab.utils import configclass
+
+from .commands import FixedPoseCommand
+
+
+@configclass
+class FixedPoseCommandCfg(CommandTermCfg):
+    """Configuration for the constant goal pose command."""
+
+    class_type: type = FixedPoseCommand
+
+    resampling_time_range: tuple[float, float] = (math.inf, math.inf)
+    """Unused. The goal is never resampled."""
+
+    debug_vis: bool = False
+    """Whether to visualize the goal pose. Defaults to False."""
+
+    asset_name: str = MISSING
+    """Name of the robot whose root frame the goal is expressed in."""
+
+    pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """Goal position in the robot root frame. Used until the first reset if a target asset is set."""
+
+    rot: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """Goal orientation (w, x, y, z) in the robot root frame."""
+
+    target_asset_name: str | None = None
+    """Name of an asset the goal position follows at reset. Defaults to None (goal fixed at :attr:`pos`)."""
+
+    target_offset: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """Offset of the goal from the target asset position, in world frame."""
+
+    goal_pose_visualizer_cfg: VisualizationMarkersCfg = FRAME_MARKER_CFG.replace(prim_path="/Visuals/Command/goal_pose")
+    """The configuration for the goal pose visualization marker."""
+
+    # Set the scale of the visualization markers to (0.1, 0.1, 0.1)
+    goal_pose_visualizer_cfg.markers["frame"].scale = (0.1, 0.1, 0.1)
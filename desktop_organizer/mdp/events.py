@@ -0,0 +1,144 @@
+"""Custom event functions for Desktop Organizer task."""
+
+from __future__ import annotations
+
+import math
+import torch
+from typing import TYPE_CHECKING
+
+import isaaclab.utils.math as math_utils
+from isaaclab.assets import RigidObject
+from isaaclab.managers import EventTermCfg, ManagerTermBase, SceneEntityCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+POSE_RANGE_KEYS = ("x", "y", "z", "roll", "pitch", "yaw")
+"""Keys of a pose range, in the order of the sampled pose vector."""
+
+
+def pose_range_bounds(
+    per_object_pose_ranges: list[dict[str, tuple[float, float]]], device: str
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Convert per-object pose ranges to lower and upper bound tensors.
+
+    Args:
+        per_object_pose_ranges: One pose range per object. Missing keys default to ``(0.0, 0.0)``.
+        device: The device of the returned tensors.
+
+    Returns:
+        The lower and upper bounds, each with shape (num_objects, 6).
+    """
+    ranges = [[pose_range.get(key, (0.0, 0.0)) for key in POSE_RANGE_KEYS] for pose_range in per_object_pose_ranges]
+    bounds = torch.tensor(ranges, dtype=torch.float, device=device)
+    return bounds[..., 0], bounds[..., 1]
+
+
+def sample_object_poses_batched(
+    num_envs: int,
+    low: torch.Tensor,
+    high: torch.Tensor,
+    min_separation: float = 0.0,
+    max_sample_tries: int = 5000,
+    batch_tries: int = 64,
+    generator: torch.Generator | None = None,
+) -> torch.Tensor:
+    """Sample object poses for many environments at once with rejection sampling on the position.
+
+    Batched counterpart of ``franka_stack_events.sample_object_poses``. Objects are placed in order; every
+    object draws ``batch_tries`` candidates per round for all environments that are still unresolved and
+    keeps the first candidate farther than ``min_separation`` from the objects placed before it. After
+    ``max_sample_tries`` candidates the last one is accepted, as in the upstream sampler.
+
+    Args:
+        num_envs: Number of environments to sample for.
+        low: Lower pose bounds (x, y, z, roll, pitch, yaw) per object. Shape is (num_objects, 6).
+        high: Upper pose bounds per object. Shape is (num_objects, 6).
+        min_separation: Minimum distance between the object positions.
+        max_sample_tries: Maximum number of candidates per object and environment.
+        batch_tries: Number of candidates drawn per rejection round.
+        generator: Random number generator. If None, the global generator is used.
+
+    Returns:
+        The sampled poses with shape (num_envs, num_objects, 6).
+    """
+    num_objects = low.shape[0]
+    device = low.device
+    poses = low + (high - low) * torch.rand(num_envs, num_objects, 6, device=device, generator=generator)
+    if min_separation <= 0.0:
+        return poses
+
+    num_rounds = max(1, math.ceil(max_sample_tries / batch_tries))
+    for object_id in range(1, num_objects):
+        pending = torch.arange(num_envs, device=device)
+        placed_pos = poses[:, :object_id, :3]
+        for _ in range(num_rounds):
+            # (num_pending, batch_tries, 6) candidates checked against all previously placed objects
+            candidates = low[object_id] + (high[object_id] - low[object_id]) * torch.rand(
+                len(pending), batch_tries, 6, device=device, generator=generator
+            )
+            distances = torch.cdist(candidates[..., :3], placed_pos[pending])
+            valid = torch.all(distances > min_separation, dim=-1)
+            found = torch.any(valid, dim=1)
+            # first valid candidate, or the last candidate once the tries are exhausted
+            choice = torch.where(found, torch.argmax(valid.int(), dim=1), batch_tries - 1)
+            poses[pending, object_id] = candidates[torch.arange(len(pending), device=device), choice]
+            pending = pending[~found]
+            if len(pending) == 0:
+                break
+    return poses
+
+
+class randomize_object_poses(ManagerTermBase):
+    """Randomize the root poses of several rigid objects on reset in one batched pass.
+
+    Replaces one ``franka_stack_events.randomize_object_pose`` event per asset. Poses of all assets and
+    all reset environments are sampled as device tensors (see :func:`sample_object_poses_batched`), so
+    ``min_separation`` holds between all configured assets. Each asset gets a single root state write
+    with zero velocity for all reset environments.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        """Initialize the term.
+
+        Args:
+            cfg: The configuration of the event term.
+            env: The environment.
+        """
+        super().__init__(cfg, env)
+
+        asset_cfgs: list[SceneEntityCfg] = cfg.params["asset_cfgs"]
+        per_object_pose_ranges = cfg.params["per_object_pose_ranges"]
+        if len(per_object_pose_ranges) != len(asset_cfgs):
+            raise ValueError(
+                f"Expected {len(asset_cfgs)} pose ranges for assets {[a.name for a in asset_cfgs]},"
+                f" got: {len(per_object_pose_ranges)}"
+            )
+        self._assets: list[RigidObject] = [env.scene[asset_cfg.name] for asset_cfg in asset_cfgs]
+        self._low, self._high = pose_range_bounds(per_object_pose_ranges, env.device)
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor | None,
+        asset_cfgs: list[SceneEntityCfg],
+        per_object_pose_ranges: list[dict[str, tuple[float, float]]],
+        min_separation: float = 0.0,
+        max_sample_tries: int = 5000,
+    ):
+        if env_ids is None:
+            env_ids = torch.arange(env.num_envs, device=env.device)
+        if len(env_ids) == 0:
+            return
+
+        poses = sample_object_poses_batched(len(env_ids), self._low, self._high, min_separation, max_sample_tries)
+        positions = poses[..., :3] + env.scene.env_origins[env_ids].unsqueeze(1)
+        orientations = math_utils.quat_from_euler_xyz(
+            poses[..., 3].flatten(), poses[..., 4].flatten(), poses[..., 5].flatten()
+        ).view(len(env_ids), -1, 4)
+        velocities = torch.zeros(len(env_ids), 6, device=env.device)
+
+        for asset_id, asset in enumerate(self._assets):
+            root_state = torch.cat([positions[:, asset_id], orientations[:, asset_id], velocities], dim=-1)
+            asset.write_root_state_to_sim(root_state, env_ids=env_ids)
@@ -0,0 +1,244 @@
+"""Fused reward engine for Desktop Organizer task.
+
+The per-term reward functions recompute the goal position in world frame, the object distances, the
+lifted mask and the gripper state for every term that needs them. The engine below computes these
+shared intermediates once per environment step and each fused reward term derives its value from them.
+"""
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from isaaclab.assets import Articulation, RigidObject
+from isaaclab.managers import ManagerTermBase, RewardTermCfg, SceneEntityCfg
+from isaaclab.sensors import FrameTransformer
+from isaaclab.utils.math import combine_frame_transforms
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+COMMAND_PROGRESS_MAX_DISTANCE = 1.0
+"""Normalization distance (in meters) used by the command progress reward."""
+
+
+@dataclass
+class RewardIntermediates:
+    """Tensors shared by all fused reward terms within one environment step."""
+
+    goal_pos_w: torch.Tensor
+    """Goal position in world frame. Shape is (num_envs, 3)."""
+
+    object_goal_distance: torch.Tensor
+    """Distance from the object to the goal. Shape is (num_envs,)."""
+
+    ee_object_distance: torch.Tensor
+    """Distance from the end-effector to the object. Shape is (num_envs,)."""
+
+    is_lifted: torch.Tensor
+    """Whether the object is above the minimal height. Shape is (num_envs,)."""
+
+    is_into_target: torch.Tensor
+    """Whether the object lies inside the target (e.g. basket) region. Shape is (num_envs,)."""
+
+    gripper_open: torch.Tensor
+    """Whether both gripper fingers are at the open position. Shape is (num_envs,)."""
+
+    gripper_closed: torch.Tensor
+    """Whether both gripper fingers are away from the open position. Shape is (num_envs,)."""
+
+
+class FusedRewardEngine:
+    """Computes the shared reward intermediates once per environment step.
+
+    Engines are shared between all fused reward terms that use the same scene entities and
+    thresholds. Use :meth:`get` to retrieve the engine attached to an environment.
+    """
+
+    def __init__(
+        self,
+        env: ManagerBasedRLEnv,
+        command_name: str,
+        minimal_height: float,
+        xy_threshold: float,
+        height_threshold: float,
+        height_diff: float,
+        robot_cfg: SceneEntityCfg,
+        object_cfg: SceneEntityCfg,
+        target_cfg: SceneEntityCfg,
+        ee_frame_cfg: SceneEntityCfg,
+    ):
+        self._env = env
+        self._minimal_height = minimal_height
+        self._xy_threshold = xy_threshold
+        self._height_threshold = height_threshold
+        self._height_diff = height_diff
+
+        # resolve scene entities once
+        self._robot: Articulation = env.scene[robot_cfg.name]
+        self._object: RigidObject = env.scene[object_cfg.name]
+        self._target: RigidObject = env.scene[target_cfg.name]
+        self._ee_frame: FrameTransformer = env.scene[ee_frame_cfg.name]
+        self._command_term = env.command_manager.get_term(command_name)
+
+        # resolve gripper joints once (same joints as the place task success check)
+        gripper_joint_ids, _ = self._robot.find_joints(env.cfg.gripper_joint_names)
+        if len(gripper_joint_ids) != 2:
+            raise ValueError(f"Fused rewards only support a parallel gripper, got joints: {gripper_joint_ids}")
+        self._gripper_joint_ids = torch.tensor(gripper_joint_ids, dtype=torch.long, device=env.device)
+        self._gripper_open_val = env.cfg.gripper_open_val
+        self._gripper_threshold = env.cfg.gripper_threshold
+
+        self._cached_step = -1
+        self._intermediates: RewardIntermediates | None = None
+
+    @classmethod
+    def get(cls, env: ManagerBasedRLEnv, **kwargs) -> FusedRewardEngine:
+        """Get the engine matching the given settings, creating it on first use.
+
+        Args:
+            env: The RL environment.
+            **kwargs: Keyword arguments forwarded to the engine constructor.
+
+        Returns:
+            The engine shared by all terms with the same settings.
+        """
+        key = tuple(
+            (name, value.name if isinstance(value, SceneEntityCfg) else value) for name, value in sorted(kwargs.items())
+        )
+        engines = env.__dict__.setdefault("_fused_reward_engines", {})
+        if key not in engines:
+            engines[key] = cls(env, **kwargs)
+        return engines[key]
+
+    def compute(self) -> RewardIntermediates:
+        """Compute the shared intermediates, or return the ones already computed in this step."""
+        step = self._env.common_step_counter
+        if self._intermediates is not None and step == self._cached_step:
+            return self._intermediates
+
+        robot_data = self._robot.data
+        object_pos_w = self._object.data.root_pos_w
+
+        # goal position in world frame (single frame transform for all terms)
+        des_pos_b = self._command_term.command[:, :3]
+        goal_pos_w, _ = combine_frame_transforms(robot_data.root_pos_w, robot_data.root_quat_w, des_pos_b)
+
+        # distances
+        object_goal_distance = torch.linalg.vector_norm(goal_pos_w - object_pos_w, dim=1)
+        ee_pos_w = self._ee_frame.data.target_pos_w[..., 0, :]
+        ee_object_distance = torch.linalg.vector_norm(object_pos_w - ee_pos_w, dim=1)
+
+        # object in target region
+        pos_diff = object_pos_w - self._target.data.root_pos_w
+        xy_dist = torch.linalg.vector_norm(pos_diff[:, :2], dim=1)
+        height_dist = torch.abs(pos_diff[:, 2])
+        is_into_target = torch.logical_and(
+            xy_dist < self._xy_threshold, (height_dist - self._height_diff) < self._height_threshold
+        )
+
+        # gripper state from a single gather over both finger joints
+        finger_offset = torch.abs(
+            torch.abs(robot_data.joint_pos.index_select(1, self._gripper_joint_ids)) - self._gripper_open_val
+        )
+        gripper_open = torch.all(finger_offset < self._gripper_threshold, dim=1)
+        gripper_closed = torch.all(finger_offset > self._gripper_threshold, dim=1)
+
+        self._intermediates = RewardIntermediates(
+            goal_pos_w=goal_pos_w,
+            object_goal_distance=object_goal_distance,
+            ee_object_distance=ee_object_distance,
+            is_lifted=object_pos_w[:, 2] > self._minimal_height,
+            is_into_target=is_into_target,
+            gripper_open=gripper_open,
+            gripper_closed=gripper_closed,
+        )
+        self._cached_step = step
+        return self._intermediates
+
+
+def _reaching_object(x: RewardIntermediates, std: float, distance_threshold: float) -> torch.Tensor:
+    return 1 - torch.tanh(x.ee_object_distance / std)
+
+
+def _lifting_object(x: RewardIntermediates, std: float, distance_threshold: float) -> torch.Tensor:
+    return x.is_lifted.float()
+
+
+def _command_progress(x: RewardIntermediates, std: float, distance_threshold: float) -> torch.Tensor:
+    progress = x.object_goal_distance / COMMAND_PROGRESS_MAX_DISTANCE
+    return x.is_lifted * (1 - torch.tanh(progress / std))
+
+
+def _object_goal_tracking(x: RewardIntermediates, std: float, distance_threshold: float) -> torch.Tensor:
+    return x.is_lifted * (1 - torch.tanh(x.object_goal_distance / std))
+
+
+def _success(x: RewardIntermediates, std: float, distance_threshold: float) -> torch.Tensor:
+    return torch.logical_and(x.is_into_target, x.gripper_open).float()
+
+
+def _gripper_closed_at_goal(x: RewardIntermediates, std: float, distance_threshold: float) -> torch.Tensor:
+    return torch.logical_and(x.object_goal_distance < distance_threshold, x.gripper_closed).float()
+
+
+FUSED_REWARD_OUTPUTS = {
+    "reaching_object": _reaching_object,
+    "lifting_object": _lifting_object,
+    "command_progress": _command_progress,
+    "object_goal_tracking": _object_goal_tracking,
+    "success": _success,
+    "gripper_closed_at_goal": _gripper_closed_at_goal,
+}
+"""Reward outputs that can be derived from :class:`RewardIntermediates`."""
+
+
+class fused_reward(ManagerTermBase):
+    """Reward term that derives its value from the shared :class:`FusedRewardEngine`.
+
+    The term selects one of :data:`FUSED_REWARD_OUTPUTS` through the ``output`` parameter. All terms
+    configured with the same scene entities and thresholds share one engine, so the goal transform,
+    distances, lifted mask and gripper state are computed once per step regardless of the term count.
+    """
+
+    def __init__(self, cfg: RewardTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        params = cfg.params
+        output = params["output"]
+        if output not in FUSED_REWARD_OUTPUTS:
+            raise ValueError(f"Unknown fused reward output '{output}'. Available: {list(FUSED_REWARD_OUTPUTS)}")
+        self._kernel = FUSED_REWARD_OUTPUTS[output]
+        self._std = params.get("std", 1.0)
+        self._distance_threshold = params.get("distance_threshold", 0.08)
+        self._engine = FusedRewardEngine.get(
+            env,
+            command_name=params["command_name"],
+            minimal_height=params["minimal_height"],
+            xy_threshold=params["xy_threshold"],
+            height_threshold=params["height_threshold"],
+            height_diff=params["height_diff"],
+            robot_cfg=params.get("robot_cfg", SceneEntityCfg("robot")),
+            object_cfg=params.get("object_cfg", SceneEntityCfg("object")),
+            target_cfg=params.get("target_cfg", SceneEntityCfg("basket")),
+            ee_frame_cfg=params.get("ee_frame_cfg", SceneEntityCfg("ee_frame")),
+        )
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        output: str,
+        command_name: str,
+        minimal_height: float,
+        xy_threshold: float,
+        height_threshold: float,
+        height_diff: float,
+        std: float = 1.0,
+        distance_threshold: float = 0.08,
+        robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+        object_cfg: SceneEntityCfg = SceneEntityCfg("object"),
+        target_cfg: SceneEntityCfg = SceneEntityCfg("basket"),
+        ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
+    ) -> torch.Tensor:
+        return self._kernel(self._engine.compute(), self._std, self._distance_threshold)
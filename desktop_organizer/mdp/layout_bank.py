@@ -0,0 +1,174 @@
+"""Precomputed reset layout bank for Desktop Organizer task.
+
+A layout bank stores many valid object layouts (one root pose per asset) sampled offline from the pose
+ranges of the reset event. Every layout satisfies the pairwise separation and the reachability
+constraints, so a reset only gathers random rows of the bank instead of sampling and rejection-testing
+poses. The bank is built with ``scripts/tools/build_layout_bank.py`` and stored as a ``.pt`` file.
+"""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+import isaaclab.utils.math as math_utils
+from isaaclab.assets import RigidObject
+from isaaclab.managers import EventTermCfg, ManagerTermBase, SceneEntityCfg
+
+from .events import pose_range_bounds, sample_object_poses_batched
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+LAYOUT_BANK_VERSION = 1
+"""Format version written to the layout bank file."""
+
+
+def build_layout_bank(
+    asset_names: list[str],
+    per_object_pose_ranges: list[dict[str, tuple[float, float]]],
+    num_layouts: int,
+    min_separation: float,
+    robot_base_pos: tuple[float, float, float],
+    reachable_assets: list[str],
+    max_reach: float,
+    seed: int = 0,
+    batch_size: int = 65536,
+    max_batches: int = 1000,
+) -> dict:
+    """Sample layouts until ``num_layouts`` valid ones are found.
+
+    A layout is valid if all asset positions are farther than ``min_separation`` from each other and the
+    assets in ``reachable_assets`` lie within ``max_reach`` of the robot base in the xy-plane.
+
+    Args:
+        asset_names: The asset names, in the order of ``per_object_pose_ranges``.
+        per_object_pose_ranges: One pose range per asset (local to the environment origin).
+        num_layouts: Number of layouts in the bank.
+        min_separation: Minimum distance between any two asset positions.
+        robot_base_pos: Position of the robot base (local to the environment origin).
+        reachable_assets: Assets that the robot must be able to reach.
+        max_reach: Maximum horizontal distance from the robot base to a reachable asset.
+        seed: Seed of the sampling generator.
+        batch_size: Number of layouts sampled per batch.
+        max_batches: Maximum number of batches before giving up.
+
+    Returns:
+        The layout bank as a dictionary with the layouts (num_layouts, num_assets, 7) as position and
+        quaternion (w, x, y, z), the asset names and the generation settings.
+
+    Raises:
+        RuntimeError: If not enough valid layouts are found within ``max_batches`` batches.
+    """
+    generator = torch.Generator().manual_seed(seed)
+    low, high = pose_range_bounds(per_object_pose_ranges, "cpu")
+    reachable_ids = [asset_names.index(name) for name in reachable_assets]
+    base_xy = torch.tensor(robot_base_pos[:2], dtype=torch.float)
+    pair_mask = ~torch.eye(len(asset_names), dtype=torch.bool)
+
+    layouts = []
+    num_valid = 0
+    num_sampled = 0
+    for _ in range(max_batches):
+        poses = sample_object_poses_batched(batch_size, low, high, min_separation, generator=generator)
+        num_sampled += batch_size
+        # the sampler accepts its last candidate when it runs out of tries, so check separation again
+        distances = torch.cdist(poses[..., :3], poses[..., :3])
+        separated = torch.all(distances[:, pair_mask] > min_separation, dim=1)
+        reach = torch.linalg.vector_norm(poses[:, reachable_ids, :2] - base_xy, dim=-1)
+        reachable = torch.all(reach < max_reach, dim=1)
+        valid_poses = poses[separated & reachable]
+        layouts.append(valid_poses)
+        num_valid += len(valid_poses)
+        if num_valid >= num_layouts:
+            break
+    if num_valid < num_layouts:
+        raise RuntimeError(
+            f"Found only {num_valid} valid layouts out of {num_sampled} samples. Relax 'min_separation' or 'max_reach'."
+        )
+
+    poses = torch.cat(layouts)[:num_layouts]
+    quats = math_utils.quat_from_euler_xyz(poses[..., 3].flatten(), poses[..., 4].flatten(), poses[..., 5].flatten())
+    return {
+        "version": LAYOUT_BANK_VERSION,
+        "layouts": torch.cat([poses[..., :3], quats.view(num_layouts, -1, 4)], dim=-1).contiguous(),
+        "asset_names": list(asset_names),
+        "per_object_pose_ranges": [dict(pose_range) for pose_range in per_object_pose_ranges],
+        "min_separation": min_separation,
+        "robot_base_pos": tuple(robot_base_pos),
+        "reachable_assets": list(reachable_assets),
+        "max_reach": max_reach,
+        "seed": seed,
+        "acceptance_rate": num_valid / num_sampled,
+    }
+
+
+def load_layout_bank(path: str, device: str = "cpu") -> dict:
+    """Load a layout bank written by :func:`build_layout_bank` and ``torch.save``.
+
+    Args:
+        path: Path to the ``.pt`` file.
+        device: Device to move the layouts to.
+
+    Returns:
+        The layout bank dictionary.
+    """
+    bank = torch.load(path, map_location=device, weights_only=False)
+    if bank.get("version") != LAYOUT_BANK_VERSION:
+        raise ValueError(f"Unsupported layout bank version {bank.get('version')} in '{path}'.")
+    return bank
+
+
+class reset_from_layout_bank(ManagerTermBase):
+    """Reset the asset root poses to random layouts of a precomputed layout bank.
+
+    The bank is loaded to the simulation device once. A reset draws one layout index per reset
+    environment and gathers the poses, so its cost does not depend on the separation constraints.
+    Layouts are drawn with the global torch generator and are reproducible under the environment seed.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        """Initialize the term.
+
+        Args:
+            cfg: The configuration of the event term.
+            env: The environment.
+        """
+        super().__init__(cfg, env)
+
+        bank = load_layout_bank(cfg.params["bank_path"], env.device)
+        asset_cfgs: list[SceneEntityCfg] = cfg.params["asset_cfgs"]
+        missing = [a.name for a in asset_cfgs if a.name not in bank["asset_names"]]
+        if missing:
+            raise ValueError(f"Assets {missing} are not part of the layout bank with assets {bank['asset_names']}.")
+
+        self._assets: list[RigidObject] = [env.scene[asset_cfg.name] for asset_cfg in asset_cfgs]
+        bank_ids = [bank["asset_names"].index(asset_cfg.name) for asset_cfg in asset_cfgs]
+        self._layouts = bank["layouts"][:, bank_ids].contiguous()
+
+    @property
+    def num_layouts(self) -> int:
+        """Number of layouts in the bank."""
+        return self._layouts.shape[0]
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor | None,
+        bank_path: str,
+        asset_cfgs: list[SceneEntityCfg],
+    ):
+        if env_ids is None:
+            env_ids = torch.arange(env.num_envs, device=env.device)
+        if len(env_ids) == 0:
+            return
+
+        layout_ids = torch.randint(self.num_layouts, (len(env_ids),), device=env.device)
+        layouts = self._layouts[layout_ids]
+        positions = layouts[..., :3] + env.scene.env_origins[env_ids].unsqueeze(1)
+        velocities = torch.zeros(len(env_ids), 6, device=env.device)
+
+        for asset_id, asset in enumerate(self._assets):
+            root_state = torch.cat([positions[:, asset_id], layouts[:, asset_id, 3:], velocities], dim=-1)
+            asset.write_root_state_to_sim(root_state, env_ids=env_ids)
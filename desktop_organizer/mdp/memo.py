@@ -0,0 +1,168 @@
+"""Per-step memoization of MDP predicates for Desktop Organizer task.
+
+Success and lifted checks are evaluated by several callers within one environment step: the reward
+manager, the termination manager and the recording/evaluation scripts (through ``success_term.func``).
+Wrapping a predicate with :func:`memoized` evaluates it once per step for a given set of parameters and
+returns the stored result to every later caller in the same step.
+
+Results are keyed by the function, its bound parameters and ``env.common_step_counter``. Resets change
+the state of the reset environments without advancing the step counter, so the memo must be cleared by
+the :func:`reset_step_memo` event term (mode ``"reset"``).
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import torch
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+from isaaclab.managers import SceneEntityCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+def _freeze(value):
+    """Convert a term parameter into a hashable memo key component."""
+    if isinstance(value, SceneEntityCfg):
+        return (
+            "SceneEntityCfg",
+            value.name,
+            _freeze(value.joint_names),
+            _freeze(value.joint_ids),
+            _freeze(value.body_names),
+            _freeze(value.body_ids),
+        )
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, slice):
+        return ("slice", value.start, value.stop, value.step)
+    return value
+
+
+class StepMemo:
+    """Stores predicate results of the current environment step.
+
+    The memo keeps at most one result per function and parameter set, together with the step counter at
+    which it was computed. It also counts hits and misses per function.
+    """
+
+    def __init__(self, env: ManagerBasedEnv):
+        self._env = env
+        self._entries: dict[tuple, tuple[int, torch.Tensor]] = {}
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._invalidations = 0
+
+    def evaluate(self, name: str, key: tuple, compute: Callable[[], torch.Tensor]) -> torch.Tensor:
+        """Return the stored result for the key in the current step, or compute and store it.
+
+        Args:
+            name: Name of the memoized function, used for the counters.
+            key: Hashable key of the function and its parameters.
+            compute: Callable evaluating the function when no valid result is stored.
+
+        Returns:
+            The result of the function. It is shared between callers and must not be modified in-place.
+        """
+        step = self._env.common_step_counter
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == step:
+            self._hits[name] = self._hits.get(name, 0) + 1
+            return entry[1]
+        self._misses[name] = self._misses.get(name, 0) + 1
+        value = compute()
+        self._entries[key] = (step, value)
+        return value
+
+    def invalidate(self, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Drop all stored results.
+
+        Stored results are computed for all environments at once, so a reset of any subset of the
+        environments makes the whole entry stale.
+
+        Args:
+            env_ids: The environment indices that were reset. Only used for bookkeeping.
+        """
+        if self._entries:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Get the hit/miss counters and the hit rate of every memoized function.
+
+        Returns:
+            A dictionary mapping function names to their ``hits``, ``misses`` and ``hit_rate``.
+        """
+        stats = {}
+        for name in sorted(set(self._hits) | set(self._misses)):
+            hits = self._hits.get(name, 0)
+            misses = self._misses.get(name, 0)
+            stats[name] = {"hits": hits, "misses": misses, "hit_rate": hits / max(hits + misses, 1)}
+        return stats
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        self._hits.clear()
+        self._misses.clear()
+        self._invalidations = 0
+
+    def __str__(self) -> str:
+        lines = [f"<StepMemo> entries: {len(self._entries)}, invalidations: {self._invalidations}"]
+        for name, stats in self.stats().items():
+            lines.append(
+                f"\t{name}: hits={stats['hits']}, misses={stats['misses']}, hit_rate={stats['hit_rate']:.2%}"
+            )
+        return "\n".join(lines)
+
+
+def get_step_memo(env: ManagerBasedEnv) -> StepMemo:
+    """Get the step memo of the environment, creating it on first use."""
+    memo = env.__dict__.get("_step_memo")
+    if memo is None:
+        memo = StepMemo(env)
+        env.__dict__["_step_memo"] = memo
+    return memo
+
+
+def memoized(func: Callable[..., torch.Tensor]) -> Callable[..., torch.Tensor]:
+    """Wrap an MDP predicate so that it is evaluated at most once per step and parameter set.
+
+    The wrapper keeps the signature of the wrapped function, so it can be used as the ``func`` of
+    reward, termination and observation terms. Parameters are bound against the signature before
+    building the key, so callers that omit default-valued parameters share results with callers that
+    pass them explicitly.
+
+    Args:
+        func: The function to wrap. Its first argument must be the environment.
+
+    Returns:
+        The memoized function.
+    """
+    signature = inspect.signature(func)
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(env: ManagerBasedEnv, *args, **kwargs) -> torch.Tensor:
+        bound = signature.bind(env, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        params.pop(next(iter(signature.parameters)))
+        key = (func, _freeze(params))
+        return get_step_memo(env).evaluate(name, key, lambda: func(env, *args, **kwargs))
+
+    return wrapper
+
+
+def reset_step_memo(env: ManagerBasedEnv, env_ids: torch.Tensor | None):
+    """Event term that invalidates the step memo when environments are reset.
+
+    Use with ``mode="reset"`` in every environment whose terms use :func:`memoized` functions.
+    """
+    memo = env.__dict__.get("_step_memo")
+    if memo is not None:
+        memo.invalidate(env_ids)
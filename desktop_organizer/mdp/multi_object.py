@@ -0,0 +1,362 @@
+"""Batched multi-object MDP terms for Desktop Organizer task.
+
+All tabletop objects are handled by one :class:`MultiObjectEngine`, which stacks their world positions
+into a ``(num_envs, num_objects, 3)`` tensor and keeps a per-environment active-object index. Reward,
+termination and observation terms select the current target from the stacked tensor by a single gather,
+so their cost stays nearly flat as objects are added.
+
+Every multi-object term takes the same engine parameters (``object_cfgs``, ``command_name``, thresholds
+and scene entities). Terms configured with the same parameters share one engine.
+"""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from isaaclab.assets import Articulation, RigidObject
+from isaaclab.managers import ManagerTermBase, ObservationTermCfg, RewardTermCfg, SceneEntityCfg, TerminationTermCfg
+from isaaclab.sensors import FrameTransformer
+from isaaclab.utils.math import combine_frame_transforms, subtract_frame_transforms
+
+from .fused_rewards import FUSED_REWARD_OUTPUTS, RewardIntermediates
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv, ManagerBasedRLEnv
+
+
+class MultiObjectEngine:
+    """Stacked object state and active-object selection shared by all multi-object terms.
+
+    The engine caches the stacked object positions and the derived reward intermediates per step.
+    The cache is cleared whenever active objects are resampled, which happens on reset through the
+    :func:`sample_active_object` event term.
+    """
+
+    def __init__(
+        self,
+        env: ManagerBasedEnv,
+        object_cfgs: Sequence[SceneEntityCfg],
+        command_name: str,
+        minimal_height: float | Sequence[float],
+        xy_threshold: float,
+        height_threshold: float,
+        height_diff: float,
+        robot_cfg: SceneEntityCfg,
+        target_cfg: SceneEntityCfg,
+        ee_frame_cfg: SceneEntityCfg,
+    ):
+        self._env = env
+        self._xy_threshold = xy_threshold
+        self._height_threshold = height_threshold
+        self._height_diff = height_diff
+
+        # resolve scene entities once
+        self._objects: list[RigidObject] = [env.scene[cfg.name] for cfg in object_cfgs]
+        self._robot: Articulation = env.scene[robot_cfg.name]
+        self._target: RigidObject = env.scene[target_cfg.name]
+        self._ee_frame: FrameTransformer = env.scene[ee_frame_cfg.name]
+        self._command_term = env.command_manager.get_term(command_name)
+        self.object_names = [cfg.name for cfg in object_cfgs]
+
+        # per-object lift height
+        if isinstance(minimal_height, (int, float)):
+            minimal_height = [minimal_height] * self.num_objects
+        if len(minimal_height) != self.num_objects:
+            raise ValueError(
+                f"Expected {self.num_objects} minimal heights for objects {self.object_names}, got: {minimal_height}"
+            )
+        self._minimal_heights = torch.tensor(minimal_height, dtype=torch.float, device=env.device)
+
+        # gripper joints (same joints as the place task success check)
+        gripper_joint_ids, _ = self._robot.find_joints(env.cfg.gripper_joint_names)
+        if len(gripper_joint_ids) != 2:
+            raise ValueError(f"Multi-object terms only support a parallel gripper, got joints: {gripper_joint_ids}")
+        self._gripper_joint_ids = torch.tensor(gripper_joint_ids, dtype=torch.long, device=env.device)
+        self._gripper_open_val = env.cfg.gripper_open_val
+        self._gripper_threshold = env.cfg.gripper_threshold
+
+        # active object per environment
+        self.active_object_ids = torch.zeros(env.num_envs, dtype=torch.long, device=env.device)
+        self._env_ids = torch.arange(env.num_envs, device=env.device)
+
+        self._cached_step = -1
+        self._object_pos_w: torch.Tensor | None = None
+        self._intermediates: RewardIntermediates | None = None
+
+    @classmethod
+    def get(cls, env: ManagerBasedEnv, **kwargs) -> MultiObjectEngine:
+        """Get the engine matching the given settings, creating it on first use.
+
+        Args:
+            env: The environment.
+            **kwargs: Keyword arguments forwarded to the engine constructor.
+
+        Returns:
+            The engine shared by all terms with the same settings.
+        """
+
+        def _key(value):
+            if isinstance(value, SceneEntityCfg):
+                return value.name
+            if isinstance(value, (list, tuple)):
+                return tuple(_key(item) for item in value)
+            return value
+
+        key = tuple((name, _key(value)) for name, value in sorted(kwargs.items()))
+        engines = env.__dict__.setdefault("_multi_object_engines", {})
+        if key not in engines:
+            engines[key] = cls(env, **kwargs)
+        return engines[key]
+
+    @property
+    def num_objects(self) -> int:
+        """Number of tracked objects."""
+        return len(self._objects)
+
+    def sample_active_objects(self, env_ids: torch.Tensor | None, object_index: int | None = None):
+        """Select the active object of the given environments and invalidate the per-step cache.
+
+        Args:
+            env_ids: The environment indices. If None, all environments are considered.
+            object_index: Index of the object to activate. If None, objects are sampled uniformly.
+        """
+        if env_ids is None:
+            env_ids = self._env_ids
+        if object_index is None:
+            self.active_object_ids[env_ids] = torch.randint(
+                self.num_objects, (len(env_ids),), dtype=torch.long, device=self._env.device
+            )
+        else:
+            self.active_object_ids[env_ids] = object_index
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop the per-step cache."""
+        self._object_pos_w = None
+        self._intermediates = None
+
+    def object_pos_w(self) -> torch.Tensor:
+        """Stacked object positions in world frame. Shape is (num_envs, num_objects, 3)."""
+        step = self._env.common_step_counter
+        if self._object_pos_w is None or step != self._cached_step:
+            self._object_pos_w = torch.stack([obj.data.root_pos_w for obj in self._objects], dim=1)
+            self._intermediates = None
+            self._cached_step = step
+        return self._object_pos_w
+
+    def active_object_pos_w(self) -> torch.Tensor:
+        """Position of the active object in world frame. Shape is (num_envs, 3)."""
+        return self.object_pos_w()[self._env_ids, self.active_object_ids]
+
+    def compute(self) -> RewardIntermediates:
+        """Compute the reward intermediates of the active objects, or return the ones of this step."""
+        object_pos_w = self.active_object_pos_w()
+        if self._intermediates is not None:
+            return self._intermediates
+
+        robot_data = self._robot.data
+
+        # goal position in world frame
+        des_pos_b = self._command_term.command[:, :3]
+        goal_pos_w, _ = combine_frame_transforms(robot_data.root_pos_w, robot_data.root_quat_w, des_pos_b)
+
+        # distances of the active object
+        object_goal_distance = torch.linalg.vector_norm(goal_pos_w - object_pos_w, dim=1)
+        ee_pos_w = self._ee_frame.data.target_pos_w[..., 0, :]
+        ee_object_distance = torch.linalg.vector_norm(object_pos_w - ee_pos_w, dim=1)
+
+        # active object in target region
+        pos_diff = object_pos_w - self._target.data.root_pos_w
+        xy_dist = torch.linalg.vector_norm(pos_diff[:, :2], dim=1)
+        height_dist = torch.abs(pos_diff[:, 2])
+        is_into_target = torch.logical_and(
+            xy_dist < self._xy_threshold, (height_dist - self._height_diff) < self._height_threshold
+        )
+
+        # gripper state
+        finger_offset = torch.abs(
+            torch.abs(robot_data.joint_pos.index_select(1, self._gripper_joint_ids)) - self._gripper_open_val
+        )
+
+        self._intermediates = RewardIntermediates(
+            goal_pos_w=goal_pos_w,
+            object_goal_distance=object_goal_distance,
+            ee_object_distance=ee_object_distance,
+            is_lifted=object_pos_w[:, 2] > self._minimal_heights[self.active_object_ids],
+            is_into_target=is_into_target,
+            gripper_open=torch.all(finger_offset < self._gripper_threshold, dim=1),
+            gripper_closed=torch.all(finger_offset > self._gripper_threshold, dim=1),
+        )
+        return self._intermediates
+
+    def object_pos_b(self) -> torch.Tensor:
+        """Stacked object positions in the robot root frame. Shape is (num_envs, num_objects, 3)."""
+        object_pos_w = self.object_pos_w()
+        robot_data = self._robot.data
+        root_pos_w = robot_data.root_pos_w.unsqueeze(1).expand_as(object_pos_w)
+        root_quat_w = robot_data.root_quat_w.unsqueeze(1).expand(-1, self.num_objects, -1)
+        object_pos_b, _ = subtract_frame_transforms(
+            root_pos_w.reshape(-1, 3), root_quat_w.reshape(-1, 4), object_pos_w.reshape(-1, 3)
+        )
+        return object_pos_b.view(-1, self.num_objects, 3)
+
+
+def _engine_from_params(env: ManagerBasedEnv, params: dict) -> MultiObjectEngine:
+    """Get the engine of a term from its configured parameters."""
+    return MultiObjectEngine.get(
+        env,
+        object_cfgs=params["object_cfgs"],
+        command_name=params["command_name"],
+        minimal_height=params["minimal_height"],
+        xy_threshold=params["xy_threshold"],
+        height_threshold=params["height_threshold"],
+        height_diff=params["height_diff"],
+        robot_cfg=params.get("robot_cfg", SceneEntityCfg("robot")),
+        target_cfg=params.get("target_cfg", SceneEntityCfg("basket")),
+        ee_frame_cfg=params.get("ee_frame_cfg", SceneEntityCfg("ee_frame")),
+    )
+
+
+class multi_object_reward(ManagerTermBase):
+    """Reward term computed on the active object of every environment.
+
+    The term selects one of :data:`~desktop_organizer.mdp.fused_rewards.FUSED_REWARD_OUTPUTS`
+    through the ``output`` parameter.
+    """
+
+    def __init__(self, cfg: RewardTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        output = cfg.params["output"]
+        if output not in FUSED_REWARD_OUTPUTS:
+            raise ValueError(f"Unknown multi-object reward output '{output}'. Available: {list(FUSED_REWARD_OUTPUTS)}")
+        self._kernel = FUSED_REWARD_OUTPUTS[output]
+        self._std = cfg.params.get("std", 1.0)
+        self._distance_threshold = cfg.params.get("distance_threshold", 0.08)
+        self._engine = _engine_from_params(env, cfg.params)
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        output: str,
+        object_cfgs: list[SceneEntityCfg],
+        command_name: str,
+        minimal_height: float | list[float],
+        xy_threshold: float,
+        height_threshold: float,
+        height_diff: float,
+        std: float = 1.0,
+        distance_threshold: float = 0.08,
+        robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+        target_cfg: SceneEntityCfg = SceneEntityCfg("basket"),
+        ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
+    ) -> torch.Tensor:
+        return self._kernel(self._engine.compute(), self._std, self._distance_threshold)
+
+
+class multi_object_termination(ManagerTermBase):
+    """Termination term computed on the active object of every environment.
+
+    Supported outputs are ``"success"`` (active object placed into the target with the gripper open)
+    and ``"object_dropping"`` (active object below ``minimum_height``).
+    """
+
+    def __init__(self, cfg: TerminationTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        self._output = cfg.params["output"]
+        if self._output not in ("success", "object_dropping"):
+            raise ValueError(f"Unknown multi-object termination output '{self._output}'.")
+        self._minimum_height = cfg.params.get("minimum_height", 0.3)
+        self._engine = _engine_from_params(env, cfg.params)
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        output: str,
+        object_cfgs: list[SceneEntityCfg],
+        command_name: str,
+        minimal_height: float | list[float],
+        xy_threshold: float,
+        height_threshold: float,
+        height_diff: float,
+        minimum_height: float = 0.3,
+        robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+        target_cfg: SceneEntityCfg = SceneEntityCfg("basket"),
+        ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
+    ) -> torch.Tensor:
+        if self._output == "object_dropping":
+            return self._engine.active_object_pos_w()[:, 2] < self._minimum_height
+        intermediates = self._engine.compute()
+        return torch.logical_and(intermediates.is_into_target, intermediates.gripper_open)
+
+
+class multi_object_observation(ManagerTermBase):
+    """Observation term over the stacked object state.
+
+    Supported outputs are ``"active_object_position"`` (active object position in the robot root frame),
+    ``"active_object_one_hot"`` (one-hot encoding of the active object index) and ``"object_positions"``
+    (all object positions in the robot root frame, flattened).
+    """
+
+    def __init__(self, cfg: ObservationTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        self._output = cfg.params["output"]
+        if self._output not in ("active_object_position", "active_object_one_hot", "object_positions"):
+            raise ValueError(f"Unknown multi-object observation output '{self._output}'.")
+        self._engine = _engine_from_params(env, cfg.params)
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        output: str,
+        object_cfgs: list[SceneEntityCfg],
+        command_name: str,
+        minimal_height: float | list[float],
+        xy_threshold: float,
+        height_threshold: float,
+        height_diff: float,
+        robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+        target_cfg: SceneEntityCfg = SceneEntityCfg("basket"),
+        ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
+    ) -> torch.Tensor:
+        engine = self._engine
+        if self._output == "active_object_one_hot":
+            return torch.nn.functional.one_hot(engine.active_object_ids, engine.num_objects).float()
+        object_pos_b = engine.object_pos_b()
+        if self._output == "object_positions":
+            return object_pos_b.flatten(1)
+        return object_pos_b[torch.arange(env.num_envs, device=env.device), engine.active_object_ids]
+
+
+def sample_active_object(
+    env: ManagerBasedEnv,
+    env_ids: torch.Tensor | None,
+    object_cfgs: list[SceneEntityCfg],
+    command_name: str,
+    minimal_height: float | list[float],
+    xy_threshold: float,
+    height_threshold: float,
+    height_diff: float,
+    object_index: int | None = None,
+    robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+    target_cfg: SceneEntityCfg = SceneEntityCfg("basket"),
+    ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
+):
+    """Event term that selects the active object of the reset environments.
+
+    Use with ``mode="reset"``. The object is sampled uniformly unless ``object_index`` is given.
+    """
+    engine = MultiObjectEngine.get(
+        env,
+        object_cfgs=object_cfgs,
+        command_name=command_name,
+        minimal_height=minimal_height,
+        xy_threshold=xy_threshold,
+        height_threshold=height_threshold,
+        height_diff=height_diff,
+        robot_cfg=robot_cfg,
+        target_cfg=target_cfg,
+        ee_frame_cfg=ee_frame_cfg,
+    )
+    engine.sample_active_objects(env_ids, object_index)
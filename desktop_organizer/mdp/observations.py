@@ -0,0 +1,116 @@
+"""Custom observation functions for Desktop Organizer task."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from isaaclab.assets import Articulation, RigidObject
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.sensors import FrameTransformer
+from isaaclab.utils.math import matrix_from_quat, subtract_frame_transforms
+
+from .memo import memoized
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+@memoized
+def object_poses_in_robot_root_frame(
+    env: ManagerBasedEnv,
+    object_cfgs: list[SceneEntityCfg],
+    robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Poses of all tracked objects in the robot's root frame, computed with one batched frame transform.
+
+    The result is memoized per step (see :mod:`desktop_organizer.mdp.memo`), so all observation terms
+    that slice from it share a single transform.
+
+    Args:
+        env: The environment.
+        object_cfgs: The tracked rigid objects.
+        robot_cfg: Robot scene entity configuration.
+
+    Returns:
+        A tuple of stacked positions with shape (num_envs, num_objects, 3) and stacked quaternions
+        (w, x, y, z) with shape (num_envs, num_objects, 4). The tensors are shared and must not be
+        modified in-place.
+    """
+    robot: Articulation = env.scene[robot_cfg.name]
+    objects: list[RigidObject] = [env.scene[cfg.name] for cfg in object_cfgs]
+    num_objects = len(objects)
+
+    object_pos_w = torch.stack([obj.data.root_pos_w for obj in objects], dim=1)
+    object_quat_w = torch.stack([obj.data.root_quat_w for obj in objects], dim=1)
+    root_pos_w = robot.data.root_pos_w.unsqueeze(1).expand(-1, num_objects, -1)
+    root_quat_w = robot.data.root_quat_w.unsqueeze(1).expand(-1, num_objects, -1)
+
+    object_pos_b, object_quat_b = subtract_frame_transforms(
+        root_pos_w.reshape(-1, 3), root_quat_w.reshape(-1, 4), object_pos_w.reshape(-1, 3), object_quat_w.reshape(-1, 4)
+    )
+    return object_pos_b.view(-1, num_objects, 3), object_quat_b.view(-1, num_objects, 4)
+
+
+def object_pose_in_robot_root_frame(
+    env: ManagerBasedEnv,
+    object_cfg: SceneEntityCfg,
+    tracked_object_cfgs: list[SceneEntityCfg],
+    return_key: str = "pos",
+    robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+) -> torch.Tensor:
+    """Position or orientation of an object in the robot's root frame.
+
+    Drop-in replacement for ``place_mdp.object_poses_in_base_frame`` that slices from the shared
+    :func:`object_poses_in_robot_root_frame` cache instead of transforming the object on its own.
+
+    Args:
+        env: The environment.
+        object_cfg: The object to observe. Must be one of ``tracked_object_cfgs``.
+        tracked_object_cfgs: All objects transformed together. Use the same list for every term.
+        return_key: ``"pos"`` for the position (num_envs, 3), ``"quat"`` for the quaternion (num_envs, 4).
+        robot_cfg: Robot scene entity configuration.
+
+    Returns:
+        The requested pose component of the object.
+    """
+    object_pos_b, object_quat_b = object_poses_in_robot_root_frame(env, tracked_object_cfgs, robot_cfg)
+    index = [cfg.name for cfg in tracked_object_cfgs].index(object_cfg.name)
+    # observation modifiers (scale, clip) operate in-place, so never hand out a view of the cache
+    if return_key == "pos":
+        return object_pos_b[:, index].clone()
+    elif return_key == "quat":
+        return object_quat_b[:, index].clone()
+    else:
+        raise ValueError(f"Invalid return key '{return_key}'. Expected 'pos' or 'quat'.")
+
+
+@memoized
+def ee_frame_pose_matrix(
+    env: ManagerBasedEnv,
+    ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
+) -> torch.Tensor:
+    """Homogeneous end-effector poses read from the frame transformer, relative to the environment origins.
+
+    Uses the first target frame of the sensor and the same frame as ``stack_mdp.ee_frame_pos`` and
+    ``stack_mdp.ee_frame_quat``, but does not depend on an observation group being computed. The result is
+    memoized per step (see :mod:`desktop_organizer.mdp.memo`), so repeated callers such as the Mimic env
+    and its recorders share one matrix build.
+
+    Args:
+        env: The environment.
+        ee_frame_cfg: The end-effector frame transformer sensor.
+
+    Returns:
+        The end-effector poses with shape (num_envs, 4, 4). The tensor is shared and must not be
+        modified in-place.
+    """
+    ee_frame: FrameTransformer = env.scene[ee_frame_cfg.name]
+    ee_pos = ee_frame.data.target_pos_w[:, 0, :] - env.scene.env_origins[:, 0:3]
+    ee_quat = ee_frame.data.target_quat_w[:, 0, :]
+
+    pose = torch.zeros(env.num_envs, 4, 4, dtype=ee_pos.dtype, device=ee_pos.device)
+    pose[:, :3, :3] = matrix_from_quat(ee_quat)
+    pose[:, :3, 3] = ee_pos
+    pose[:, 3, 3] = 1.0
+    return pose
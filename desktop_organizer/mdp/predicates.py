@@ -0,0 +1,16 @@
+"""Memoized success and lifted checks for Desktop Organizer task.
+
+These predicates are shared by the reward terms, the termination terms and the scripts that call
+``success_term.func`` directly. See :mod:`desktop_organizer.mdp.memo`.
+"""
+
+from isaaclab_tasks.manager_based.manipulation.lift.mdp import object_is_lifted as lift_object_is_lifted
+from isaaclab_tasks.manager_based.manipulation.place.mdp import object_a_is_into_b as place_object_a_is_into_b
+
+from .memo import memoized
+
+object_a_is_into_b = memoized(place_object_a_is_into_b)
+"""Memoized :func:`isaaclab_tasks.manager_based.manipulation.place.mdp.object_a_is_into_b`."""
+
+object_is_lifted = memoized(lift_object_is_lifted)
+"""Memoized :func:`isaaclab_tasks.manager_based.manipulation.lift.mdp.object_is_lifted`."""
@@ -0,0 +1,110 @@
+"""Subtask completion signals of the Desktop Organizer Mimic task.
+
+The Mimic API reads the reach, grasp and lift signals from the ``subtask_terms`` observation group
+(see :meth:`FrankaDesktopOrganizerIKRelMimicEnv.get_subtask_term_signals`), which lets
+``annotate_demos.py --auto`` split demonstrations without a manual keyboard pass. All three signals are
+computed together by :func:`subtask_signals` and memoized per step, so the observation terms only slice
+from one batched result.
+"""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from isaaclab.assets import Articulation, RigidObject
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.sensors import FrameTransformer
+
+from .memo import memoized
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+SUBTASK_SIGNALS = ("reach", "grasp", "lift")
+"""Names of the subtask signals, in the column order of :func:`subtask_signals`."""
+
+
+@memoized
+def subtask_signals(
+    env: ManagerBasedEnv,
+    gripper_cfg: SceneEntityCfg,
+    object_cfg: SceneEntityCfg = SceneEntityCfg("ketchup"),
+    ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
+    reach_distance: float = 0.08,
+    grasp_distance: float = 0.05,
+    lift_height: float = 0.52,
+) -> torch.Tensor:
+    """Reach, grasp and lift signals of all environments, computed in one batched pass.
+
+    - reach: the end-effector is within ``reach_distance`` of the object.
+    - grasp: the end-effector is within ``grasp_distance`` of the object and both fingers are closed
+      (further than ``env.cfg.gripper_threshold`` from ``env.cfg.gripper_open_val``).
+    - lift: the object is higher than ``lift_height`` in world frame.
+
+    Args:
+        env: The environment.
+        gripper_cfg: The robot with its finger joints as ``joint_names``. The joint ids are resolved by the
+            observation manager, so the configuration must be passed in the term parameters.
+        object_cfg: The manipulated object.
+        ee_frame_cfg: The end-effector frame transformer sensor.
+        reach_distance: Distance (m) below which the object counts as reached.
+        grasp_distance: Distance (m) below which a closed gripper counts as grasping the object.
+        lift_height: Height (m) above which the object counts as lifted.
+
+    Returns:
+        The signals with shape (num_envs, 3), ordered as :data:`SUBTASK_SIGNALS`. The tensor is shared
+        and must not be modified in-place.
+    """
+    obj: RigidObject = env.scene[object_cfg.name]
+    robot: Articulation = env.scene[gripper_cfg.name]
+    ee_frame: FrameTransformer = env.scene[ee_frame_cfg.name]
+
+    object_pos_w = obj.data.root_pos_w
+    ee_object_distance = torch.linalg.vector_norm(object_pos_w - ee_frame.data.target_pos_w[:, 0, :], dim=1)
+
+    finger_offset = torch.abs(torch.abs(robot.data.joint_pos[:, gripper_cfg.joint_ids]) - env.cfg.gripper_open_val)
+    gripper_closed = torch.all(finger_offset > env.cfg.gripper_threshold, dim=1)
+
+    return torch.stack(
+        [
+            ee_object_distance < reach_distance,
+            torch.logical_and(ee_object_distance < grasp_distance, gripper_closed),
+            object_pos_w[:, 2] > lift_height,
+        ],
+        dim=1,
+    )
+
+
+def subtask_signal(
+    env: ManagerBasedEnv,
+    signal: str,
+    gripper_cfg: SceneEntityCfg,
+    object_cfg: SceneEntityCfg = SceneEntityCfg("ketchup"),
+    ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
+    reach_distance: float = 0.08,
+    grasp_distance: float = 0.05,
+    lift_height: float = 0.52,
+) -> torch.Tensor:
+    """One subtask signal, sliced from the shared :func:`subtask_signals` result.
+
+    Pass the same parameters to every term of the group so that they share one evaluation.
+
+    Args:
+        env: The environment.
+        signal: Name of the signal, one of :data:`SUBTASK_SIGNALS`.
+        gripper_cfg: The robot with its finger joints as ``joint_names``.
+        object_cfg: The manipulated object.
+        ee_frame_cfg: The end-effector frame transformer sensor.
+        reach_distance: Distance (m) below which the object counts as reached.
+        grasp_distance: Distance (m) below which a closed gripper counts as grasping the object.
+        lift_height: Height (m) above which the object counts as lifted.
+
+    Returns:
+        The signal with shape (num_envs,).
+    """
+    if signal not in SUBTASK_SIGNALS:
+        raise ValueError(f"Invalid subtask signal '{signal}'. Expected one of {SUBTASK_SIGNALS}.")
+    signals = subtask_signals(env, gripper_cfg, object_cfg, ee_frame_cfg, reach_distance, grasp_distance, lift_height)
+    # never hand out a view of the cache
+    return signals[:, SUBTASK_SIGNALS.index(signal)].clone()
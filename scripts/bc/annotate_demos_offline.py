@@ -0,0 +1,264 @@
+"""Annotate recorded demonstrations for Mimic data generation without running the simulator.
+
+``annotate_demos.py --auto`` launches Isaac Sim and replays every episode action by action only to record
+``obs/datagen_info``. All of that information is already in the dataset written by ``record_demos.py``:
+
+- ``initial_state`` and ``states`` (post-step scene states, poses relative to the environment origin),
+- ``obs`` (pre-step policy observations of the Mimic env, including ``eef_pos`` and ``eef_quat``),
+- ``actions``.
+
+This tool rebuilds the datagen info of whole episodes at once with NumPy, in the same layout and frames as
+the recorders of ``annotate_demos.py`` (all entries aligned with the pre-step state of each action):
+
+- ``obs/datagen_info/object_pose/<object>``: (T, 4, 4) poses of every rigid object,
+- ``obs/datagen_info/eef_pose/<eef>``: (T, 4, 4) end-effector poses,
+- ``obs/datagen_info/target_eef_pose/<eef>``: (T, 4, 4) targets of the delta pose actions
+  (``FrankaDesktopOrganizerIKRelMimicEnv.action_to_target_eef_pose``),
+- ``obs/datagen_info/subtask_term_signals/{reach,grasp,lift}``: (T,) boolean signals with the thresholds of
+  ``SUBTASK_SIGNAL_PARAMS`` in ``desktop_organizer/envs/mimic_env_cfg.py``.
+
+Unlike the raw per-step signals of the simulator path, the signals are latched (false until the subtask is
+completed, true afterwards), as in the manual annotation mode. Episodes are skipped if a signal never turns
+on, is already on at the first step, or the subtasks complete out of order.
+
+Only ``numpy`` and ``h5py`` are required.
+
+Usage:
+    python scripts/bc/annotate_demos_offline.py \
+        --input_file ./datasets/raw.hdf5 --output_file ./datasets/annotated.hdf5
+"""
+
+import argparse
+import os
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Annotate demonstrations for Mimic without the simulator.")
+parser.add_argument("--input_file", type=str, required=True, help="Dataset recorded by record_demos.py.")
+parser.add_argument("--output_file", type=str, required=True, help="File name of the annotated output dataset.")
+parser.add_argument("--eef_name", type=str, default="franka", help="Name of the end-effector in the Mimic cfg.")
+parser.add_argument("--object_name", type=str, default="ketchup", help="Object of the reach/grasp/lift subtasks.")
+parser.add_argument("--reach_distance", type=float, default=0.08, help="EE-object distance (m) of 'reach'.")
+parser.add_argument("--grasp_distance", type=float, default=0.05, help="EE-object distance (m) of 'grasp'.")
+parser.add_argument("--lift_height", type=float, default=0.52, help="Object height (m) of 'lift'.")
+parser.add_argument("--gripper_open_val", type=float, default=0.04, help="Finger joint position when open.")
+parser.add_argument(
+    "--gripper_threshold", type=float, default=0.01, help="Finger offset from the open position when closed."
+)
+parser.add_argument(
+    "--keep_unsuccessful",
+    action="store_true",
+    default=False,
+    help="Also annotate episodes whose 'success' attribute is False.",
+)
+# parse the arguments
+args_cli = parser.parse_args()
+
+"""Rest everything follows."""
+
+import re
+import time
+
+import h5py
+import numpy as np
+
+SUBTASK_SIGNALS = ("reach", "grasp", "lift")
+"""Names of the subtask signals, in the order of the Mimic subtasks."""
+
+SMALL_ANGLE = 1.0e-2
+"""Angle (rad) below which the Taylor expansion of Rodrigues' formula is used."""
+
+
+def matrix_from_quat(quat: np.ndarray) -> np.ndarray:
+    """Rotation matrices of (w, x, y, z) quaternions. Shape is (..., 4) -> (..., 3, 3)."""
+    quat = quat / np.linalg.norm(quat, axis=-1, keepdims=True)
+    w, x, y, z = np.moveaxis(quat, -1, 0)
+    rot = np.stack(
+        [
+            1.0 - 2.0 * (y * y + z * z),
+            2.0 * (x * y - z * w),
+            2.0 * (x * z + y * w),
+            2.0 * (x * y + z * w),
+            1.0 - 2.0 * (x * x + z * z),
+            2.0 * (y * z - x * w),
+            2.0 * (x * z - y * w),
+            2.0 * (y * z + x * w),
+            1.0 - 2.0 * (x * x + y * y),
+        ],
+        axis=-1,
+    )
+    return rot.reshape(*quat.shape[:-1], 3, 3)
+
+
+def matrix_from_axis_angle(axis_angle: np.ndarray) -> np.ndarray:
+    """Rotation matrices of rotation vectors (Rodrigues' formula, as ``desktop_organizer.envs.so3.so3_exp``)."""
+    angle_sq = np.sum(axis_angle * axis_angle, axis=-1)[..., None, None]
+    angle = np.sqrt(angle_sq)
+    small = angle < SMALL_ANGLE
+    safe_angle = np.where(small, 1.0, angle)
+    coeff_a = np.where(small, 1.0 - angle_sq / 6.0 * (1.0 - angle_sq / 20.0), np.sin(safe_angle) / safe_angle)
+    coeff_b = np.where(
+        small, 0.5 - angle_sq / 24.0 * (1.0 - angle_sq / 30.0), (1.0 - np.cos(safe_angle)) / safe_angle**2
+    )
+
+    x, y, z = np.moveaxis(axis_angle, -1, 0)
+    zero = np.zeros_like(x)
+    skew = np.stack([zero, -z, y, z, zero, -x, -y, x, zero], axis=-1).reshape(*axis_angle.shape[:-1], 3, 3)
+    return np.eye(3) + coeff_a * skew + coeff_b * (skew @ skew)
+
+
+def make_pose(pos: np.ndarray, rot: np.ndarray) -> np.ndarray:
+    """Homogeneous poses from positions (..., 3) and rotation matrices (..., 3, 3)."""
+    pose = np.zeros((*pos.shape[:-1], 4, 4), dtype=np.float32)
+    pose[..., :3, :3] = rot
+    pose[..., :3, 3] = pos
+    pose[..., 3, 3] = 1.0
+    return pose
+
+
+def pre_step(initial: np.ndarray, post_step: np.ndarray) -> np.ndarray:
+    """Scene states before each action: the initial state followed by all but the last post-step state."""
+    return np.concatenate([initial[:1], post_step[:-1]], axis=0)
+
+
+def latch(signal: np.ndarray) -> np.ndarray:
+    """Keep a signal on once it has turned on."""
+    return np.logical_or.accumulate(signal)
+
+
+def annotate_episode(demo: h5py.Group) -> tuple[dict | None, str]:
+    """Compute the datagen info of one episode.
+
+    Args:
+        demo: The episode group of the recorded dataset.
+
+    Returns:
+        A tuple of the nested datagen info dictionary (None if the episode cannot be annotated) and a
+        message describing the result.
+    """
+    actions = demo["actions"][()]
+    num_steps = actions.shape[0]
+    obs = demo["obs"]
+    for key in ("eef_pos", "eef_quat"):
+        if key not in obs:
+            return None, f"missing 'obs/{key}' (record the demos with the Mimic task)"
+    if "states" not in demo or "initial_state" not in demo:
+        return None, "missing 'states' or 'initial_state'"
+
+    # end-effector pose and targets of the delta pose actions
+    eef_pos = obs["eef_pos"][()]
+    eef_rot = matrix_from_quat(obs["eef_quat"][()])
+    target_rot = matrix_from_axis_angle(actions[:, 3:6]) @ eef_rot
+    eef_pose = make_pose(eef_pos, eef_rot)
+    target_eef_pose = make_pose(eef_pos + actions[:, :3], target_rot)
+
+    # poses of all rigid objects before each action
+    object_pose = {}
+    object_pos = {}
+    for name, object_states in demo["states/rigid_object"].items():
+        root_pose = pre_step(demo[f"initial_state/rigid_object/{name}/root_pose"][()], object_states["root_pose"][()])
+        object_pose[name] = make_pose(root_pose[:, :3], matrix_from_quat(root_pose[:, 3:7]))
+        object_pos[name] = root_pose[:, :3]
+    if args_cli.object_name not in object_pos:
+        return None, f"object '{args_cli.object_name}' not found in the recorded states"
+    if len(object_pos[args_cli.object_name]) != num_steps or len(eef_pos) != num_steps:
+        return None, "the recorded states, observations and actions have different lengths"
+
+    # subtask signals (finger joints are the last two joints of the Franka)
+    joint_pos = pre_step(
+        demo["initial_state/articulation/robot/joint_position"][()],
+        demo["states/articulation/robot/joint_position"][()],
+    )
+    finger_offset = np.abs(np.abs(joint_pos[:, -2:]) - args_cli.gripper_open_val)
+    gripper_closed = np.all(finger_offset > args_cli.gripper_threshold, axis=1)
+    ee_object_distance = np.linalg.norm(object_pos[args_cli.object_name] - eef_pos, axis=1)
+    raw_signals = {
+        "reach": ee_object_distance < args_cli.reach_distance,
+        "grasp": np.logical_and(ee_object_distance < args_cli.grasp_distance, gripper_closed),
+        "lift": object_pos[args_cli.object_name][:, 2] > args_cli.lift_height,
+    }
+
+    signals = {}
+    last_index = 0
+    for name in SUBTASK_SIGNALS:
+        signal = latch(raw_signals[name])
+        if not signal.any():
+            return None, f'did not detect completion for the subtask "{name}"'
+        index = int(np.argmax(signal))
+        if index <= last_index:
+            return None, f'subtask "{name}" completes at step {index}, not after the previous subtask ({last_index})'
+        signals[name] = signal
+        last_index = index
+
+    datagen_info = {
+        "object_pose": object_pose,
+        "eef_pose": {args_cli.eef_name: eef_pose},
+        "target_eef_pose": {args_cli.eef_name: target_eef_pose},
+        "subtask_term_signals": signals,
+    }
+    boundaries = ", ".join(f"{name}@{int(np.argmax(signal))}" for name, signal in signals.items())
+    return datagen_info, f"{num_steps} steps, {boundaries}"
+
+
+def write_group(group: h5py.Group, data: dict):
+    """Write a nested dictionary of arrays into an HDF5 group."""
+    for key, value in data.items():
+        if isinstance(value, dict):
+            write_group(group.require_group(key), value)
+        else:
+            group.create_dataset(key, data=value, compression="gzip")
+
+
+def demo_sort_key(name: str) -> tuple:
+    """Sort ``demo_<i>`` names by their index."""
+    match = re.search(r"(\d+)$", name)
+    return (int(match.group(1)) if match else -1, name)
+
+
+def main():
+    """Add Mimic annotations to all episodes of the input dataset."""
+    if not os.path.exists(args_cli.input_file):
+        raise FileNotFoundError(f"The input dataset file {args_cli.input_file} does not exist.")
+    output_dir = os.path.dirname(os.path.abspath(args_cli.output_file))
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    exported_count = 0
+    total_samples = 0
+    with h5py.File(args_cli.input_file, "r") as src, h5py.File(args_cli.output_file, "w") as dst:
+        src_data = src["data"]
+        dst_data = dst.create_group("data")
+        for key, value in src_data.attrs.items():
+            dst_data.attrs[key] = value
+
+        episode_names = sorted(src_data.keys(), key=demo_sort_key)
+        for episode_name in episode_names:
+            demo = src_data[episode_name]
+            if not args_cli.keep_unsuccessful and not bool(demo.attrs.get("success", True)):
+                print(f"{episode_name}: skipped (not successful)")
+                continue
+            datagen_info, message = annotate_episode(demo)
+            if datagen_info is None:
+                print(f"{episode_name}: skipped ({message})")
+                continue
+
+            src.copy(demo, dst_data, name=episode_name)
+            dst_demo = dst_data[episode_name]
+            if "obs/datagen_info" in dst_demo:
+                del dst_demo["obs/datagen_info"]
+            write_group(dst_demo.require_group("obs/datagen_info"), datagen_info)
+            dst_demo.attrs["success"] = True
+            exported_count += 1
+            total_samples += int(demo["actions"].shape[0])
+            print(f"{episode_name}: annotated ({message})")
+
+        dst_data.attrs["total"] = total_samples
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"\nExported {exported_count} (out of {len(episode_names)}) annotated episodes to {args_cli.output_file}"
+        f" in {elapsed:.2f} s."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,65 @@ parser.add_argument(
     default=False,
     help="Enable Pinocchio.",
 )
+parser.add_argument(
+    "--disable_source_index",
+    action="store_true",
+    default=False,
+    help="Select the source segments with the upstream data generator instead of the prebuilt source segment index.",
+)
+parser.add_argument(
+    "--adaptive_selection",
+    action="store_true",
+    default=False,
+    help="Select the source segments of the nearest_neighbor_object subtasks with adaptive_nearest_neighbor_object.",
+)
+parser.add_argument(
+    "--segment_stats_file",
+    type=str,
+    default=None,
+    help=(
+        "JSON file the source segment success counts of the adaptive_nearest_neighbor_object selection are loaded"
+        " from and saved to. Defaults to None (the counts only live for the run)."
+    ),
+)
+parser.add_argument(
+    "--telemetry",
+    type=str,
+    default="jsonl",
+    choices=["jsonl", "tensorboard", "none"],
+    help="Write generation metrics to '<output>_telemetry.jsonl' or to the TensorBoard log dir '<output>_telemetry'.",
+)
+parser.add_argument("--telemetry_interval", type=float, default=10.0, help="Seconds between two telemetry records.")
+parser.add_argument(
+    "--disable_early_abort",
+    action="store_true",
+    default=False,
+    help="Run every trial to the end instead of aborting it at the first detected failure.",
+)
+parser.add_argument(
+    "--seed_offset",
+    type=int,
+    default=0,
+    help="Offset added to datagen_config.seed, so that parallel generation processes draw different scenes.",
+)
+parser.add_argument(
+    "--sync_export",
+    action="store_true",
+    default=False,
+    help="Write the generated episodes on the simulation thread instead of a background writer thread.",
+)
+parser.add_argument(
+    "--source_cache_dir",
+    type=str,
+    default=None,
+    help="Directory of the parsed source-demo cache. Defaults to '.source_cache' next to the input file.",
+)
+parser.add_argument(
+    "--disable_source_cache",
+    action="store_true",
+    default=False,
+    help="Load the source dataset through the dataset file handler instead of the parsed source-demo cache.",
+)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
@@ -65,17 +124,22 @@ import gymnasium as gym
 import inspect
 import numpy as np
 import random
+import time
 import torch
 
 import omni
 
 from isaaclab.envs import ManagerBasedRLMimicEnv
+from isaaclab.utils.datasets import EpisodeData
 
 import isaaclab_mimic.envs  # noqa: F401
 
 if args_cli.enable_pinocchio:
     import isaaclab_mimic.envs.pinocchio_envs  # noqa: F401
-from isaaclab_mimic.datagen.generation import env_loop, setup_async_generation, setup_env_config
+from isaaclab_mimic.datagen import generation
+from isaaclab_mimic.datagen.data_generator import DataGenerator
+from isaaclab_mimic.datagen.datagen_info_pool import DataGenInfoPool
+from isaaclab_mimic.datagen.generation import env_loop, run_data_generator, setup_env_config
 from isaaclab_mimic.datagen.utils import get_env_name_from_dataset, setup_output_paths
 
 import isaaclab_tasks  # noqa: F401
@@ -84,6 +148,266 @@ import isaaclab_tasks  # noqa: F401
 # ============ CRITICAL: Import external package environments ============
 import desktop_organizer  # noqa: F401
 # ========================================================================
+from desktop_organizer.envs.async_dataset_writer import AsyncHDF5DatasetFileHandler
+from desktop_organizer.envs.generation_telemetry import GenerationTelemetry
+from desktop_organizer.envs.segment_stats import SourceSegmentStats
+from desktop_organizer.envs.selection_strategy import AdaptiveNearestNeighborObjectStrategy
+from desktop_organizer.envs.source_cache import load_source_episodes
+from desktop_organizer.envs.source_index import SourceSegmentIndex
+from desktop_organizer.envs.trial_monitor import MonitoredActionQueue, TrialAborted, TrialMonitor
+
+
+class CachedDataGenInfoPool(DataGenInfoPool):
+    """Datagen info pool loading the source episodes from the parsed source-demo cache.
+
+    Only ``obs/datagen_info`` and the actions are read from the dataset, once per dataset content and subtask
+    configuration (see :mod:`desktop_organizer.envs.source_cache`); later runs memory-map them. The episodes are
+    then added with the upstream parsing of the subtask segments.
+    """
+
+    def load_from_dataset_file(self, file_path, select_demo_keys: str | None = None):
+        start = time.perf_counter()
+        episodes, cache_dir = load_source_episodes(
+            file_path, self.env.cfg.subtask_configs, cache_root=args_cli.source_cache_dir
+        )
+        for episode_name, data in episodes.items():
+            if select_demo_keys is not None and episode_name not in select_demo_keys:
+                continue
+            episode = EpisodeData()
+            episode.data = _to_tensors(data, self.env.device)
+            self._add_episode(episode)
+        print(f"Loaded the parsed source demos from {cache_dir} in {time.perf_counter() - start:.2f} s")
+
+
+def _to_tensors(data: dict, device: str) -> dict:
+    """Convert a nested dictionary of arrays into torch tensors on a device."""
+    return {
+        key: _to_tensors(value, device) if isinstance(value, dict) else torch.from_numpy(value).to(device)
+        for key, value in data.items()
+    }
+
+
+ADAPTIVE_SELECTION_STRATEGY = AdaptiveNearestNeighborObjectStrategy.NAME
+
+
+class IndexedDataGenerator(DataGenerator):
+    """Data generator answering ``nearest_neighbor_object`` selections from prebuilt source segment indices.
+
+    The upstream selection rebuilds the source segments of all demonstrations on every call. Here, the object
+    poses of the source pool are stacked once per object (see :class:`SourceSegmentIndex`) and a selection
+    only gathers the segment starts of the current subtask boundaries.
+
+    The generator also answers the ``adaptive_nearest_neighbor_object`` strategy (see
+    :class:`AdaptiveNearestNeighborObjectStrategy`) from the indices, with the end-effector of the selection and
+    its own :class:`SourceSegmentStats`. Other strategies use the upstream path.
+    """
+
+    def __init__(self, *args, segment_stats: SourceSegmentStats | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.segment_stats = segment_stats if segment_stats is not None else SourceSegmentStats()
+        self.source_indices: dict[str, SourceSegmentIndex] = {}
+        for subtask_configs in self.env_cfg.subtask_configs.values():
+            for subtask_config in subtask_configs:
+                if subtask_config.selection_strategy in ("nearest_neighbor_object", ADAPTIVE_SELECTION_STRATEGY):
+                    self.get_source_index(subtask_config.object_ref)
+
+    def get_source_index(self, object_name: str) -> SourceSegmentIndex:
+        """Index of an object, rebuilt if demonstrations were added to the source pool."""
+        datagen_infos = self.src_demo_datagen_info_pool.datagen_infos
+        index = self.source_indices.get(object_name)
+        if index is None or index.num_sources != len(datagen_infos):
+            index = SourceSegmentIndex.from_datagen_infos(datagen_infos, object_name, device=self.env.device)
+            self.source_indices[object_name] = index
+        return index
+
+    def select_source_demo(
+        self,
+        eef_name,
+        eef_pose,
+        object_pose,
+        src_demo_current_subtask_boundaries,
+        subtask_object_name,
+        selection_strategy_name,
+        selection_strategy_kwargs=None,
+    ):
+        if selection_strategy_name == ADAPTIVE_SELECTION_STRATEGY and subtask_object_name is not None:
+            kwargs = dict(selection_strategy_kwargs or {})
+            prior = {name: kwargs.pop(name) for name in ("prior_successes", "prior_failures") if name in kwargs}
+            nn_k = kwargs.pop("nn_k", 3)
+            index = self.get_source_index(subtask_object_name)
+            start_indices = torch.as_tensor(src_demo_current_subtask_boundaries, device=index.device)[:, 0]
+            neighbors = index.query(object_pose.unsqueeze(0), start_indices, k=nn_k, **kwargs)
+            return self.segment_stats.select(eef_name, neighbors[0].tolist(), **prior)
+        if selection_strategy_name != "nearest_neighbor_object" or subtask_object_name is None:
+            return super().select_source_demo(
+                eef_name=eef_name,
+                eef_pose=eef_pose,
+                object_pose=object_pose,
+                src_demo_current_subtask_boundaries=src_demo_current_subtask_boundaries,
+                subtask_object_name=subtask_object_name,
+                selection_strategy_name=selection_strategy_name,
+                selection_strategy_kwargs=selection_strategy_kwargs,
+            )
+        index = self.get_source_index(subtask_object_name)
+        start_indices = torch.as_tensor(src_demo_current_subtask_boundaries, device=index.device)[:, 0]
+        selected = index.select(object_pose.unsqueeze(0), start_indices, **(selection_strategy_kwargs or {}))
+        return int(selected[0].item())
+
+
+async def run_tracked_data_generator(
+    env,
+    env_id,
+    env_reset_queue,
+    env_action_queue,
+    data_generator,
+    success_term,
+    monitor=None,
+    segment_stats=None,
+    telemetry=None,
+    pause_subtask=False,
+):
+    """Same as the upstream ``run_data_generator``, with the early abort of doomed trials, the source segment
+    success counts and the generation telemetry.
+
+    With a monitor, the data generator queues its actions through a :class:`MonitoredActionQueue`. When a detector
+    of the :class:`TrialMonitor` fires, the trial ends before its next action, its partial episode is exported as
+    failed and a new trial starts right away in the same env. With segment statistics, the outcome of every trial
+    is credited to the source segments it selected. With telemetry, every trial is counted with its completed
+    subtasks and failure reason.
+    """
+    if monitor is not None:
+        env_action_queue = MonitoredActionQueue(env_action_queue, monitor)
+    while True:
+        if monitor is not None:
+            monitor.start_trial(env_id)
+        if segment_stats is not None:
+            segment_stats.begin_trial()
+        if telemetry is not None:
+            telemetry.begin_trial(env_id)
+        reason = None
+        try:
+            results = await data_generator.generate(
+                env_id=env_id,
+                success_term=success_term,
+                env_reset_queue=env_reset_queue,
+                env_action_queue=env_action_queue,
+                pause_subtask=pause_subtask,
+            )
+            success = bool(results["success"])
+        except TrialAborted as abort:
+            monitor.abort_trial(env_id, abort.reason)
+            success = False
+            reason = abort.reason
+        if segment_stats is not None:
+            segment_stats.end_trial(success)
+        if telemetry is not None:
+            telemetry.end_trial(env_id, success, reason)
+        # the counters read by the upstream env_loop
+        if success:
+            generation.num_success += 1
+        else:
+            generation.num_failures += 1
+        generation.num_attempts += 1
+
+
+def setup_async_generation(env, num_envs, input_file, success_term, pause_subtask=False):
+    """Same as the upstream ``setup_async_generation``, with the source-demo cache, the source segment indices,
+    the adaptive source selection, the early abort of doomed trials and the generation telemetry.
+
+    The source dataset is loaded through :class:`CachedDataGenInfoPool` unless ``--disable_source_cache`` is set,
+    all envs share one :class:`IndexedDataGenerator` unless ``--disable_source_index`` is set, and the trials are
+    monitored by a :class:`TrialMonitor` if the env config has ``trial_failures`` and ``--disable_early_abort`` is
+    not set. With ``--adaptive_selection``, the ``nearest_neighbor_object`` subtasks use the
+    ``adaptive_nearest_neighbor_object`` strategy. The source segment success counts of the adaptive subtasks are
+    loaded from and saved to ``--segment_stats_file`` if set; with ``--disable_source_index``, the upstream
+    generator draws with them through the registered strategy. Unless
+    ``--telemetry none`` is set, a :class:`GenerationTelemetry` writes metrics next to the output file.
+    """
+    asyncio_event_loop = asyncio.get_event_loop()
+    env_reset_queue = asyncio.Queue()
+    env_action_queue = asyncio.Queue()
+    shared_datagen_info_pool_lock = asyncio.Lock()
+    pool_class = DataGenInfoPool if args_cli.disable_source_cache else CachedDataGenInfoPool
+    shared_datagen_info_pool = pool_class(env, env.cfg, env.device, asyncio_lock=shared_datagen_info_pool_lock)
+    shared_datagen_info_pool.load_from_dataset_file(input_file)
+    print(f"Loaded {shared_datagen_info_pool.num_datagen_infos} to datagen info pool")
+
+    subtask_configs = [config for configs in env.cfg.subtask_configs.values() for config in configs]
+    if args_cli.adaptive_selection:
+        for config in subtask_configs:
+            if config.selection_strategy == "nearest_neighbor_object":
+                config.selection_strategy = ADAPTIVE_SELECTION_STRATEGY
+    segment_stats = None
+    if any(config.selection_strategy == ADAPTIVE_SELECTION_STRATEGY for config in subtask_configs):
+        # the selections depend on the counts: with a file, on the trials of earlier runs as well
+        segment_stats = SourceSegmentStats(args_cli.segment_stats_file)
+        print(f"Source segment statistics: {args_cli.segment_stats_file or 'not persisted'}")
+    # the source segment indices are built here, once for the whole generation
+    if args_cli.disable_source_index:
+        # the registered strategy is not told the end-effector: it only records the counts of single-arm tasks
+        if segment_stats is not None and len(env.cfg.subtask_configs) == 1:
+            AdaptiveNearestNeighborObjectStrategy.segment_stats = segment_stats
+            AdaptiveNearestNeighborObjectStrategy.eef_name = next(iter(env.cfg.subtask_configs))
+        else:
+            segment_stats = None
+        data_generator = DataGenerator(env=env, src_demo_datagen_info_pool=shared_datagen_info_pool)
+    else:
+        data_generator = IndexedDataGenerator(
+            env=env, src_demo_datagen_info_pool=shared_datagen_info_pool, segment_stats=segment_stats
+        )
+        print(f"Built source segment indices for objects: {sorted(data_generator.source_indices)}")
+
+    monitor = None
+    trial_failures_cfg = getattr(env.cfg, "trial_failures", None)
+    if not args_cli.disable_early_abort and trial_failures_cfg is not None:
+        monitor = TrialMonitor(env, trial_failures_cfg)
+
+    # the generators queue through wrappers recording the queue depths, env_loop reads the queues directly
+    telemetry = None
+    generator_reset_queue, generator_action_queue = env_reset_queue, env_action_queue
+    if args_cli.telemetry != "none":
+        output_stem, _ = os.path.splitext(os.path.abspath(args_cli.output_file))
+        if args_cli.telemetry == "jsonl":
+            telemetry_kwargs = {"file_path": f"{output_stem}_telemetry.jsonl"}
+        else:
+            telemetry_kwargs = {"log_dir": f"{output_stem}_telemetry"}
+        telemetry = GenerationTelemetry(env, interval=args_cli.telemetry_interval, **telemetry_kwargs)
+        print(f"Writing generation telemetry to {next(iter(telemetry_kwargs.values()))}")
+        generator_reset_queue = telemetry.watch_queue("reset_queue", env_reset_queue)
+        generator_action_queue = telemetry.watch_queue("action_queue", env_action_queue)
+
+    data_generator_asyncio_tasks = []
+    for i in range(num_envs):
+        if monitor is None and segment_stats is None and telemetry is None:
+            generator = run_data_generator(
+                env, i, env_reset_queue, env_action_queue, data_generator, success_term, pause_subtask=pause_subtask
+            )
+        else:
+            generator = run_tracked_data_generator(
+                env,
+                i,
+                generator_reset_queue,
+                generator_action_queue,
+                data_generator,
+                success_term,
+                monitor=monitor,
+                segment_stats=segment_stats,
+                telemetry=telemetry,
+                pause_subtask=pause_subtask,
+            )
+        task = asyncio_event_loop.create_task(generator)
+        data_generator_asyncio_tasks.append(task)
+
+    return {
+        "tasks": data_generator_asyncio_tasks,
+        "event_loop": asyncio_event_loop,
+        "reset_queue": env_reset_queue,
+        "action_queue": env_action_queue,
+        "info_pool": shared_datagen_info_pool,
+        "monitor": monitor,
+        "segment_stats": segment_stats,
+        "telemetry": telemetry,
+    }
 
 
 def main():
@@ -105,6 +429,10 @@ def main():
         device=args_cli.device,
         generation_num_trials=args_cli.generation_num_trials,
     )
+    env_cfg.datagen_config.seed += args_cli.seed_offset
+    if not args_cli.sync_export:
+        # the episodes exported by env_loop are written from a background thread
+        env_cfg.recorders.dataset_file_handler_class_type = AsyncHDF5DatasetFileHandler
 
     # create environment
     env = gym.make(env_name, cfg=env_cfg).unwrapped
@@ -157,6 +485,20 @@ def main():
             print("Remaining async tasks cancelled and cleaned up.")
         except Exception as e:
             print(f"Error cancelling remaining async tasks: {e}")
+        # wait for the episodes still queued for writing, closing the app ends the process
+        AsyncHDF5DatasetFileHandler.close_all()
+        segment_stats = async_components["segment_stats"]
+        if segment_stats is not None and segment_stats.file_path is not None:
+            segment_stats.save()
+            print(f"Saved the source segment statistics of {segment_stats.num_trials} trials")
+        telemetry = async_components["telemetry"]
+        if telemetry is not None:
+            telemetry.close()
+
+    monitor = async_components["monitor"]
+    if monitor is not None:
+        aborted = ", ".join(f"{reason}: {count}" for reason, count in monitor.counts.items())
+        print(f"Trials aborted early ({aborted})")
 
 
 if __name__ == "__main__":
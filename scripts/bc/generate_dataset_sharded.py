@@ -0,0 +1,162 @@
+"""Run Mimic data generation in several processes and merge their shards.
+
+``generate_dataset.py`` drives all environments from one Python interpreter, which caps the generation
+throughput even when CPU cores are free. This launcher starts ``--num_processes`` generation processes, each
+with its own ``--num_envs`` environments, its own output shard and its own seed (``datagen_config.seed`` plus
+the shard index, through ``--seed_offset``). ``--generation_num_trials`` is split evenly between the
+processes. Once all processes have exited, the shards are merged with ``merge_datasets.py`` into
+``--output_file`` with contiguous ``demo_i`` names (failed episodes kept by the generator are merged into
+``<output>_failed.hdf5``). By default the merged file links to the episodes of the shards, which are then
+kept next to it; with ``--materialize`` the episodes are copied and the shards are removed.
+
+Arguments that the launcher does not know (``--headless``, ``--enable_pinocchio``, ...) are passed to every
+generation process. With ``--devices``, the processes are assigned to the given devices in turn.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/bc/generate_dataset_sharded.py \
+        --task Isaac-Desktop-Organizer-Franka-Mimic-IK-Rel-v0 \
+        --input_file ./datasets/annotated.hdf5 --output_file ./datasets/generated.hdf5 \
+        --generation_num_trials 1000 --num_processes 4 --num_envs 25 --headless
+"""
+
+import argparse
+import os
+
+# Calculate project directory for dataset paths
+_project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_default_output_path = os.path.join(_project_dir, "datasets", "output_dataset.hdf5")
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Generate demonstrations in several processes and merge them.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument("--input_file", type=str, required=True, help="File path to the source dataset file.")
+parser.add_argument(
+    "--output_file", type=str, default=_default_output_path, help="File path of the merged generated dataset."
+)
+parser.add_argument("--generation_num_trials", type=int, default=None, help="Total number of demos to generate.")
+parser.add_argument("--num_processes", type=int, default=2, help="Number of generation processes.")
+parser.add_argument("--num_envs", type=int, default=1, help="Number of environments of each process.")
+parser.add_argument("--devices", type=str, nargs="+", default=None, help="Devices assigned to the processes in turn.")
+parser.add_argument(
+    "--shard_dir", type=str, default=None, help="Directory of the shards. Defaults to '<output>_shards'."
+)
+parser.add_argument(
+    "--materialize",
+    action="store_true",
+    default=False,
+    help="Copy the episodes into the merged file instead of linking to the shards.",
+)
+parser.add_argument(
+    "--keep_shards", action="store_true", default=False, help="Keep the shards after a materialized merge."
+)
+# parse the arguments, the unknown ones are forwarded to the generation processes
+args_cli, generation_args = parser.parse_known_args()
+
+"""Rest everything follows."""
+
+import subprocess
+import sys
+import time
+
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def split_trials(num_trials: int | None, num_processes: int) -> list[int | None]:
+    """Split the number of demos to generate between the processes (None keeps the config default)."""
+    if num_trials is None:
+        return [None] * num_processes
+    return [num_trials // num_processes + int(index < num_trials % num_processes) for index in range(num_processes)]
+
+
+def shard_command(shard_index: int, shard_file: str, num_trials: int | None) -> list[str]:
+    """Command line of one generation process."""
+    command = [
+        sys.executable,
+        os.path.join(_script_dir, "generate_dataset.py"),
+        "--input_file",
+        args_cli.input_file,
+        "--output_file",
+        shard_file,
+        "--num_envs",
+        str(args_cli.num_envs),
+        "--seed_offset",
+        str(shard_index),
+    ]
+    if args_cli.task is not None:
+        command += ["--task", args_cli.task]
+    if num_trials is not None:
+        command += ["--generation_num_trials", str(num_trials)]
+    if args_cli.devices:
+        command += ["--device", args_cli.devices[shard_index % len(args_cli.devices)]]
+    return command + generation_args
+
+
+def merge(shard_files: list[str], output_file: str) -> bool:
+    """Merge the existing shards with ``merge_datasets.py``. Returns False if the merge failed."""
+    shard_files = [shard_file for shard_file in shard_files if os.path.exists(shard_file)]
+    if not shard_files:
+        print(f"No shard to merge into {output_file}.")
+        return True
+    command = [sys.executable, os.path.join(_script_dir, "merge_datasets.py"), "--input_files", *shard_files]
+    command += ["--output_file", output_file]
+    if args_cli.materialize:
+        command.append("--materialize")
+    return subprocess.run(command).returncode == 0
+
+
+def main():
+    """Run the generation processes and merge their shards."""
+    if args_cli.num_processes < 1:
+        raise ValueError("The number of processes must be positive.")
+    output_stem, _ = os.path.splitext(os.path.abspath(args_cli.output_file))
+    shard_dir = args_cli.shard_dir or f"{output_stem}_shards"
+    os.makedirs(shard_dir, exist_ok=True)
+
+    # the source-demo cache is written by the first process that needs it and shared by the others
+    start = time.perf_counter()
+    processes = []
+    shard_files = []
+    for shard_index, num_trials in enumerate(split_trials(args_cli.generation_num_trials, args_cli.num_processes)):
+        shard_file = os.path.join(shard_dir, f"shard_{shard_index}.hdf5")
+        log_path = os.path.join(shard_dir, f"shard_{shard_index}.log")
+        with open(log_path, "w") as log_file:
+            process = subprocess.Popen(
+                shard_command(shard_index, shard_file, num_trials), stdout=log_file, stderr=subprocess.STDOUT
+            )
+        processes.append(process)
+        shard_files.append(shard_file)
+        print(f"Started shard {shard_index} (pid {process.pid}, {num_trials or 'default'} demos), log: {log_path}")
+
+    failed_shards = []
+    try:
+        for shard_index, process in enumerate(processes):
+            return_code = process.wait()
+            print(f"Shard {shard_index} exited with code {return_code} after {time.perf_counter() - start:.0f} s")
+            if return_code != 0:
+                failed_shards.append(shard_index)
+    except KeyboardInterrupt:
+        print("\nInterrupted, stopping the generation processes...")
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+        raise
+
+    # merge whatever the shards contain, so that a crashed process does not discard the others
+    merged = merge(shard_files, args_cli.output_file)
+    failed_files = [f"{os.path.splitext(shard_file)[0]}_failed.hdf5" for shard_file in shard_files]
+    merged &= merge(failed_files, f"{output_stem}_failed.hdf5")
+    # the linked merge reads the episodes from the shards
+    if merged and args_cli.materialize and not args_cli.keep_shards and not failed_shards:
+        for shard_file in shard_files + failed_files:
+            if os.path.exists(shard_file):
+                os.remove(shard_file)
+
+    print(f"\nGeneration with {args_cli.num_processes} processes took {time.perf_counter() - start:.0f} s.")
+    if failed_shards or not merged:
+        print(f"Failed shards: {failed_shards}. The shards and logs are kept in {shard_dir}.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Merge HDF5 demonstration datasets into one dataset with contiguous episode names.
+
+The episodes of all input files are exposed in order (input files in the given order, episodes of each file
+by their index) as ``data/demo_0``, ``data/demo_1``, ... of the output file. The ``data`` attributes of the
+first input file (such as ``env_args``) are kept and ``total`` is recomputed from the merged episodes.
+Typical inputs are the shards written by ``generate_dataset_sharded.py`` or datasets recorded on several
+machines.
+
+By default, no episode data is copied: every ``data/demo_i`` of the output is an HDF5 external link to the
+episode group in its input file, stored with a path relative to the output file. The merge takes
+milliseconds whatever the size of the inputs, and readers (robomimic ``SequenceDataset``,
+``HDF5DatasetFileHandler``, h5py) resolve the links transparently. The input files must stay next to the
+output file (same relative paths); writes into the episodes, such as the per-episode masks of
+``add_mask.py``, go to the input files.
+
+With ``--materialize``, the episodes are copied into a self-contained file instead. Every dataset is rewritten
+with chunks of whole rows of about ``--chunk_kb`` (``0`` for a contiguous layout) and the ``--compression``
+filter, whatever the layout of the inputs.
+
+Only ``h5py`` is required.
+
+Usage:
+    python scripts/bc/merge_datasets.py \
+        --input_files ./datasets/shard_0.hdf5 ./datasets/shard_1.hdf5 --output_file ./datasets/generated.hdf5
+    python scripts/bc/merge_datasets.py --materialize --chunk_kb 1024 \
+        --input_files ./datasets/shard_*.hdf5 --output_file ./datasets/generated.hdf5
+"""
+
+import argparse
+import os
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Merge HDF5 demonstration datasets.")
+parser.add_argument("--input_files", type=str, nargs="+", required=True, help="Datasets to merge, in order.")
+parser.add_argument("--output_file", type=str, required=True, help="File name of the merged dataset.")
+parser.add_argument(
+    "--materialize",
+    action="store_true",
+    default=False,
+    help="Copy the episodes into a self-contained file instead of linking to the input files.",
+)
+parser.add_argument(
+    "--chunk_kb",
+    type=int,
+    default=1024,
+    help="Target chunk size (KiB) of the materialized datasets, 0 for a contiguous layout.",
+)
+parser.add_argument(
+    "--compression",
+    type=str,
+    default=None,
+    choices=["gzip", "lzf"],
+    help="Compression filter of the materialized datasets (none by default, for the fastest reads).",
+)
+# parse the arguments
+args_cli = parser.parse_args()
+
+"""Rest everything follows."""
+
+import re
+import time
+
+import h5py
+
+
+def demo_sort_key(name: str) -> tuple:
+    """Sort ``demo_<i>`` names by their index."""
+    match = re.search(r"(\d+)$", name)
+    return (int(match.group(1)) if match else -1, name)
+
+
+def chunk_shape(shape: tuple[int, ...], itemsize: int, chunk_bytes: int) -> tuple[int, ...] | None:
+    """Chunks spanning whole rows, with about ``chunk_bytes`` per chunk (None for a contiguous layout)."""
+    if chunk_bytes <= 0 or len(shape) == 0 or shape[0] == 0:
+        return None
+    row_bytes = itemsize
+    for size in shape[1:]:
+        row_bytes *= max(size, 1)
+    rows = max(1, min(shape[0], chunk_bytes // row_bytes))
+    return (rows, *shape[1:])
+
+
+def materialize_group(src: h5py.Group, dst: h5py.Group, chunk_bytes: int, compression: str | None):
+    """Copy a group recursively, rewriting every dataset with the given chunks and filter."""
+    for key, value in src.attrs.items():
+        dst.attrs[key] = value
+    for name, item in src.items():
+        if isinstance(item, h5py.Group):
+            materialize_group(item, dst.create_group(name), chunk_bytes, compression)
+            continue
+        chunks = chunk_shape(item.shape, item.dtype.itemsize, chunk_bytes)
+        dataset = dst.create_dataset(
+            name,
+            data=item[()],
+            chunks=chunks,
+            compression=compression if chunks is not None else None,
+        )
+        for key, value in item.attrs.items():
+            dataset.attrs[key] = value
+
+
+def merge_datasets(
+    input_files: list[str],
+    output_file: str,
+    materialize: bool = False,
+    chunk_bytes: int = 1 << 20,
+    compression: str | None = None,
+) -> tuple[int, int]:
+    """Expose the episodes of several datasets under one ``data`` group.
+
+    Args:
+        input_files: The datasets to merge, in order.
+        output_file: The merged dataset. It is overwritten if it exists.
+        materialize: Whether to copy the episodes instead of linking to them.
+        chunk_bytes: Target chunk size (bytes) of the materialized datasets.
+        compression: Compression filter of the materialized datasets.
+
+    Returns:
+        A tuple of the number of merged episodes and their total number of samples.
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    os.makedirs(output_dir, exist_ok=True)
+    if os.path.exists(output_file) and any(os.path.samefile(input_file, output_file) for input_file in input_files):
+        raise ValueError(f"The output file {output_file} is also an input file.")
+
+    num_episodes = 0
+    total_samples = 0
+    with h5py.File(output_file, "w") as dst:
+        dst_data = dst.create_group("data")
+        for file_index, input_file in enumerate(input_files):
+            # links are resolved relative to the directory of the output file
+            link_path = os.path.relpath(os.path.abspath(input_file), output_dir)
+            with h5py.File(input_file, "r") as src:
+                src_data = src["data"]
+                if file_index == 0:
+                    for key, value in src_data.attrs.items():
+                        dst_data.attrs[key] = value
+                elif src_data.attrs.get("env_args") != dst_data.attrs.get("env_args"):
+                    print(f"Warning: the 'env_args' of {input_file} differ from those of {input_files[0]}.")
+
+                episode_names = sorted(src_data.keys(), key=demo_sort_key)
+                for episode_name in episode_names:
+                    demo = src_data[episode_name]
+                    name = f"demo_{num_episodes}"
+                    if materialize:
+                        materialize_group(demo, dst_data.create_group(name), chunk_bytes, compression)
+                    else:
+                        # the path in the input file, which may itself be a link to another file
+                        dst_data[name] = h5py.ExternalLink(link_path, f"{src_data.name}/{episode_name}")
+                    num_episodes += 1
+                    total_samples += int(demo.attrs.get("num_samples", demo["actions"].shape[0]))
+                print(f"{input_file}: {len(episode_names)} episodes")
+        dst_data.attrs["total"] = total_samples
+    return num_episodes, total_samples
+
+
+def main():
+    """Merge the input datasets."""
+    for input_file in args_cli.input_files:
+        if not os.path.exists(input_file):
+            raise FileNotFoundError(f"The input dataset file {input_file} does not exist.")
+    start = time.perf_counter()
+    num_episodes, total_samples = merge_datasets(
+        args_cli.input_files,
+        args_cli.output_file,
+        materialize=args_cli.materialize,
+        chunk_bytes=args_cli.chunk_kb * 1024,
+        compression=args_cli.compression,
+    )
+    mode = "copied" if args_cli.materialize else "linked"
+    print(
+        f"\nMerged ({mode}) {num_episodes} episodes ({total_samples} samples) from"
+        f" {len(args_cli.input_files)} files into {args_cli.output_file} in {time.perf_counter() - start:.2f} s."
+    )
+
+
+if __name__ == "__main__":
+    main()
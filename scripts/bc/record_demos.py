@@ -58,6 +58,12 @@ parser.add_argument(
     default=False,
     help="Enable Pinocchio.",
 )
+parser.add_argument(
+    "--sync_export",
+    action="store_true",
+    default=False,
+    help="Write the saved demos on the simulation thread instead of a background writer thread.",
+)
 
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
@@ -116,8 +122,9 @@ from isaaclab_tasks.utils.parse_cfg import parse_env_cfg
 # Import external package environments (for custom tasks)
 try:
     import desktop_organizer  # noqa: F401
+    from desktop_organizer.envs.async_dataset_writer import AsyncHDF5DatasetFileHandler
 except ImportError:
-    pass  # External package not installed
+    AsyncHDF5DatasetFileHandler = None  # External package not installed
 
 
 class RateLimiter:
@@ -230,6 +237,9 @@ def create_environment_config(
     env_cfg.recorders.dataset_export_dir_path = output_dir
     env_cfg.recorders.dataset_filename = output_file_name
     env_cfg.recorders.dataset_export_mode = DatasetExportMode.EXPORT_SUCCEEDED_ONLY
+    if AsyncHDF5DatasetFileHandler is not None and not args_cli.sync_export:
+        # saving a demo must not hitch teleoperation: write it from a background thread
+        env_cfg.recorders.dataset_file_handler_class_type = AsyncHDF5DatasetFileHandler
 
     return env_cfg, success_term
 
@@ -532,7 +542,9 @@ def main() -> None:
     # Run simulation loop
     current_recorded_demo_count = run_simulation_loop(env, None, success_term, rate_limiter)
 
-    # Clean up
+    # Clean up (wait for the demos still queued for writing)
+    if AsyncHDF5DatasetFileHandler is not None:
+        AsyncHDF5DatasetFileHandler.close_all()
     env.close()
     print(f"Recording session completed with {current_recorded_demo_count} successful demonstrations")
     print(f"Demonstrations saved to: {args_cli.dataset_file}")
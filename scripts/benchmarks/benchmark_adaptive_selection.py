@@ -0,0 +1,123 @@
+"""Compare the uniform and the failure-aware selection of Mimic source segments on simulated trials.
+
+Every simulated source segment (``--num_sources`` source demonstrations times ``--num_subtasks`` subtasks) has
+a hidden success probability: a fraction ``--bad_fraction`` of the segments succeeds with probability
+``--bad_rate``, the others with ``--good_rate``. A trial selects one segment per subtask among ``--nn_k``
+random candidates (the nearest neighbors of a random scene) and stops at the first failing segment, like a
+trial aborted by the generation-time failure detectors.
+
+The script runs ``--num_trials`` trials with the uniform draw of ``nearest_neighbor_object`` and with the
+Thompson sampling of :class:`desktop_organizer.envs.segment_stats.SourceSegmentStats`, and reports the
+success rates. It then checks the persistence: two instances sharing one statistics file (two generation
+processes) save their trials, and the file must hold the sum of their counts.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_adaptive_selection.py --num_trials 2000
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the failure-aware selection of Mimic source segments.")
+parser.add_argument("--num_trials", type=int, default=2000, help="Number of simulated trials per strategy.")
+parser.add_argument("--num_sources", type=int, default=10, help="Number of source demonstrations.")
+parser.add_argument("--num_subtasks", type=int, default=4, help="Number of subtasks.")
+parser.add_argument("--nn_k", type=int, default=3, help="Number of candidate segments per selection.")
+parser.add_argument("--bad_fraction", type=float, default=0.3, help="Fraction of unreliable segments.")
+parser.add_argument("--good_rate", type=float, default=0.95, help="Success probability of a reliable segment.")
+parser.add_argument("--bad_rate", type=float, default=0.3, help="Success probability of an unreliable segment.")
+parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import numpy as np
+import os
+import tempfile
+
+from desktop_organizer.envs.segment_stats import SourceSegmentStats
+
+
+def run_trials(success_rates: np.ndarray, stats: SourceSegmentStats | None, num_trials: int) -> tuple[float, int]:
+    """Simulate trials with the adaptive selection, or the uniform one without statistics.
+
+    Returns:
+        A tuple of the success rate and the number of selected segments.
+    """
+    num_subtasks, num_sources = success_rates.shape
+    num_successes = 0
+    num_selections = 0
+    for _ in range(num_trials):
+        if stats is not None:
+            stats.begin_trial()
+        success = True
+        for subtask in range(num_subtasks):
+            candidates = np.random.choice(num_sources, size=args_cli.nn_k, replace=False)
+            if stats is None:
+                source = int(candidates[np.random.randint(len(candidates))])
+            else:
+                source = stats.select("franka", candidates.tolist())
+            num_selections += 1
+            if np.random.rand() >= success_rates[subtask, source]:
+                success = False
+                break
+        if stats is not None:
+            stats.end_trial(success)
+        num_successes += int(success)
+    return num_successes / num_trials, num_selections
+
+
+def check_persistence(success_rates: np.ndarray) -> bool:
+    """Two instances sharing one file save their counts. Returns whether the file holds their sum."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "segment_stats.json")
+        # both instances save now and then while the other one runs
+        first = SourceSegmentStats(file_path, autosave_interval=7)
+        second = SourceSegmentStats(file_path, autosave_interval=11)
+        _, first_selections = run_trials(success_rates, first, 100)
+        _, second_selections = run_trials(success_rates, second, 100)
+        first.save()
+        second.save()
+        reloaded = SourceSegmentStats(file_path)
+        counts = (*reloaded.successes.values(), *reloaded.failures.values())
+        return sum(int(array.sum()) for array in counts) == first_selections + second_selections
+
+
+def main():
+    """Compare both strategies and check the persistence."""
+    np.random.seed(args_cli.seed)
+    shape = (args_cli.num_subtasks, args_cli.num_sources)
+    bad = np.random.rand(*shape) < args_cli.bad_fraction
+    success_rates = np.where(bad, args_cli.bad_rate, args_cli.good_rate)
+
+    uniform, _ = run_trials(success_rates, None, args_cli.num_trials)
+    stats = SourceSegmentStats()
+    adaptive, _ = run_trials(success_rates, stats, args_cli.num_trials)
+    print(f"{args_cli.num_trials} trials, {int(bad.sum())} of {bad.size} segments unreliable")
+    print(f"  uniform selection:  {uniform:.1%} successful trials")
+    print(f"  adaptive selection: {adaptive:.1%} successful trials (x{adaptive / max(uniform, 1e-9):.2f})")
+    for subtask in range(args_cli.num_subtasks):
+        posterior = stats.success_rates(f"franka/{subtask}")
+        print(f"  subtask {subtask}: posterior success rates {np.round(posterior, 2).tolist()}")
+
+    passed = check_persistence(success_rates)
+    print(f"Persisted statistics: {'PASSED' if passed else 'FAILED'}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
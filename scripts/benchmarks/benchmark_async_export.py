@@ -0,0 +1,109 @@
+"""Compare the simulation-thread stall of the synchronous and asynchronous episode export.
+
+The recorder manager calls ``write_episode`` and ``flush`` of its dataset file handler for every finished
+episode. The script exports synthetic episodes (actions, observations and states of ``--num_steps`` steps on
+``--device``) every ``--interval`` seconds with ``HDF5DatasetFileHandler`` and with
+:class:`desktop_organizer.envs.async_dataset_writer.AsyncHDF5DatasetFileHandler`, reports the time spent in
+the export calls on the calling thread, and checks that both files contain the same episodes.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_async_export.py --num_episodes 20 --device cuda:0
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the asynchronous episode export.")
+parser.add_argument("--num_episodes", type=int, default=20, help="Number of exported episodes.")
+parser.add_argument("--num_steps", type=int, default=400, help="Number of steps per episode.")
+parser.add_argument("--interval", type=float, default=0.2, help="Simulated time (s) between two exports.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import h5py
+import numpy as np
+import os
+import tempfile
+import time
+import torch
+
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+
+from desktop_organizer.envs.async_dataset_writer import AsyncHDF5DatasetFileHandler
+
+
+def make_episode(index: int, device: str) -> EpisodeData:
+    """Synthetic episode with the layout of the Mimic recorder."""
+    generator = torch.Generator(device=device).manual_seed(index)
+    num_steps = args_cli.num_steps
+    episode = EpisodeData()
+    episode.success = True
+    episode.data = {
+        "actions": torch.rand(num_steps, 7, generator=generator, device=device),
+        "obs": {name: torch.rand(num_steps, 32, generator=generator, device=device) for name in ("a", "b", "c")},
+        "states": {
+            "articulation": {"robot": {"joint_position": torch.rand(num_steps, 9, generator=generator, device=device)}}
+        },
+    }
+    return episode
+
+
+def export(handler_class: type, file_path: str) -> list[float]:
+    """Export the episodes like the recorder manager. Returns the time spent in each export."""
+    handler = handler_class()
+    handler.create(file_path, env_name="benchmark")
+    stalls = []
+    for index in range(args_cli.num_episodes):
+        episode = make_episode(index, args_cli.device)
+        start = time.perf_counter()
+        handler.write_episode(episode)
+        handler.flush()
+        stalls.append(time.perf_counter() - start)
+        # the simulation keeps stepping meanwhile
+        time.sleep(args_cli.interval)
+    start = time.perf_counter()
+    handler.close()
+    print(f"  close (waits for the queued episodes): {(time.perf_counter() - start) * 1000.0:.1f} ms")
+    return stalls
+
+
+def same_episodes(file_a: str, file_b: str) -> bool:
+    """Compare the actions of all episodes of two files."""
+    with h5py.File(file_a, "r") as a, h5py.File(file_b, "r") as b:
+        if sorted(a["data"].keys()) != sorted(b["data"].keys()):
+            return False
+        return all(np.array_equal(a[f"data/{name}/actions"][()], b[f"data/{name}/actions"][()]) for name in a["data"])
+
+
+def main():
+    """Export with both handlers and compare the stalls."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = {}
+        for handler_class in (HDF5DatasetFileHandler, AsyncHDF5DatasetFileHandler):
+            print(f"{handler_class.__name__}:")
+            file_path = os.path.join(tmp_dir, f"{handler_class.__name__}.hdf5")
+            stalls = np.array(export(handler_class, file_path)) * 1000.0
+            results[handler_class] = file_path
+            print(f"  export stall: mean {stalls.mean():.2f} ms | max {stalls.max():.2f} ms")
+        passed = same_episodes(*results.values())
+    print(f"Exported episodes: {'PASSED' if passed else 'FAILED'}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
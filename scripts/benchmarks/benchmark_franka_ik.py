@@ -0,0 +1,150 @@
+"""Benchmark the batched DLS inverse kinematics and check the reachability of recorded trajectories offline.
+
+Without a dataset, the script samples target poses from random joint states around the default joint
+positions of the task, solves them from the default joint positions with
+:func:`desktop_organizer.envs.franka_kinematics.solve_ik`, and reports the share of reached targets and the
+solve time. It also checks that one :func:`dls_ik_step` follows small relative actions.
+
+With ``--dataset``, every end-effector target of every episode (``obs/datagen_info/target_eef_pose`` if the
+dataset is annotated or generated, the recorded ``obs/eef_pos``/``obs/eef_quat`` otherwise) is expressed in
+the robot base frame and solved starting from the recorded joint positions, to flag unreachable segments.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_franka_ik.py --num_targets 4096
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_franka_ik.py --dataset ./datasets/generated.hdf5
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the batched DLS inverse kinematics of the Franka arm.")
+parser.add_argument("--num_targets", type=int, default=4096, help="Number of random target poses.")
+parser.add_argument("--joint_noise", type=float, default=0.6, help="Range (rad) of the random joint offsets.")
+parser.add_argument("--num_iterations", type=int, default=100, help="Maximum number of DLS updates.")
+parser.add_argument("--dataset", type=str, default=None, help="Dataset whose end-effector targets are checked.")
+parser.add_argument("--seed", type=int, default=0, help="Random seed for the targets.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import h5py
+import time
+import torch
+
+import isaaclab.utils.math as math_utils
+
+from desktop_organizer.envs.franka_kinematics import (
+    EE_FRAME_OFFSET,
+    IK_EE_OFFSET,
+    PANDA_JOINT_LIMITS,
+    dls_ik_step,
+    franka_forward_kinematics,
+    pose_error,
+    relative_action_to_target_pose,
+    solve_ik,
+)
+
+# local imports
+from dataset_utils import pre_step  # isort: skip
+
+# default arm joint positions of the task robot (DesktopOrganizerRLSceneCfg.robot)
+DEFAULT_JOINT_POS = (0.0, -0.79, 0.0, -2.356, 0.0, 1.57, 0.785)
+
+
+def benchmark_random_targets(device: str):
+    """Solve random reachable targets from the default joint positions."""
+    generator = torch.Generator(device=device).manual_seed(args_cli.seed)
+    limits = torch.tensor(PANDA_JOINT_LIMITS, device=device)
+    default_joint_pos = torch.tensor(DEFAULT_JOINT_POS, device=device)
+    noise = torch.rand(args_cli.num_targets, 7, generator=generator, device=device) - 0.5
+    target_joint_pos = torch.clamp(default_joint_pos + args_cli.joint_noise * noise, limits[:, 0], limits[:, 1])
+    target_pose = franka_forward_kinematics(target_joint_pos, ee_offset=IK_EE_OFFSET)
+
+    with torch.inference_mode():
+        solve_ik(target_pose[:16], default_joint_pos, num_iterations=args_cli.num_iterations)
+        start = time.perf_counter()
+        _, reached, error = solve_ik(target_pose, default_joint_pos, num_iterations=args_cli.num_iterations)
+        elapsed = time.perf_counter() - start
+
+    pos_error = torch.linalg.vector_norm(error[:, :3], dim=-1)
+    rot_error = torch.linalg.vector_norm(error[:, 3:], dim=-1)
+    print(f"Random targets: {args_cli.num_targets} | joint offsets: +-{args_cli.joint_noise / 2:.2f} rad")
+    print(f"  reached: {reached.float().mean().item():.2%} | solve time: {elapsed * 1000.0:.1f} ms")
+    print(
+        f"  max pos error: {pos_error.max().item() * 1000.0:.3f} mm | max rot error: {rot_error.max().item():.2e} rad"
+    )
+
+    # one controller update per relative action, as the action term does within a step
+    joint_pos = default_joint_pos.expand(args_cli.num_targets, -1)
+    ee_pose = franka_forward_kinematics(joint_pos, ee_offset=IK_EE_OFFSET)
+    actions = 0.04 * (torch.rand(args_cli.num_targets, 7, generator=generator, device=device) - 0.5)
+    step_target = relative_action_to_target_pose(ee_pose, actions)
+    with torch.inference_mode():
+        start = time.perf_counter()
+        next_joint_pos = dls_ik_step(joint_pos, step_target)
+        elapsed = time.perf_counter() - start
+    step_error = pose_error(franka_forward_kinematics(next_joint_pos, ee_offset=IK_EE_OFFSET), step_target)
+    print(
+        f"  single DLS step: {elapsed * 1000.0:.1f} ms | max residual after one step:"
+        f" {step_error.abs().max().item():.2e}"
+    )
+
+
+def check_dataset(dataset_path: str, device: str):
+    """Check that every end-effector target of the dataset is reachable from the recorded joint positions."""
+    total_targets = 0
+    total_reached = 0
+    with h5py.File(dataset_path, "r") as file:
+        for episode_name, demo in file["data"].items():
+            root_state = pre_step(demo, "articulation/robot/root_pose").to(device)
+            root_pose = math_utils.make_pose(root_state[:, :3], math_utils.matrix_from_quat(root_state[:, 3:7]))
+            joint_pos = pre_step(demo, "articulation/robot/joint_position").to(device)
+            if "datagen_info" in demo["obs"]:
+                source = "target_eef_pose"
+                (target_pose,) = demo["obs/datagen_info/target_eef_pose"].values()
+                target_pose = torch.from_numpy(target_pose[()]).to(device)
+            else:
+                source = "eef_pose"
+                eef_pos = torch.from_numpy(demo["obs/eef_pos"][()]).to(device)
+                eef_quat = torch.from_numpy(demo["obs/eef_quat"][()]).to(device)
+                target_pose = math_utils.make_pose(eef_pos, math_utils.matrix_from_quat(eef_quat))
+            # targets are relative to the environment origin, the solver works in the robot base frame
+            target_pose_b = math_utils.pose_inv(root_pose) @ target_pose
+
+            with torch.inference_mode():
+                _, reached, _ = solve_ik(
+                    target_pose_b, joint_pos, ee_offset=EE_FRAME_OFFSET, num_iterations=args_cli.num_iterations
+                )
+            total_targets += reached.numel()
+            total_reached += int(reached.sum().item())
+            unreached = torch.nonzero(~reached).flatten().tolist()
+            summary = f"first unreachable steps: {unreached[:5]}" if unreached else "all reachable"
+            print(f"{episode_name}: {reached.float().mean().item():.2%} of {reached.numel()} {source} ({summary})")
+    print(f"\nReachable targets: {total_reached} / {total_targets}")
+
+
+def main():
+    """Run the random-target benchmark and the optional dataset check."""
+    benchmark_random_targets(args_cli.device)
+    if args_cli.dataset is not None:
+        print()
+        check_dataset(args_cli.dataset, args_cli.device)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,175 @@
+"""Benchmark the fused reward engine against the per-term reward path.
+
+The script evaluates the task-specific reward terms of :class:`RewardsCfg` (per-term path) and
+:class:`FusedRewardsCfg` (fused path) on synthetic scene states, checks that both paths produce the same
+weighted rewards, and reports the time spent per environment step. The action penalty terms are the same
+in both configurations and are not part of the comparison.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_rewards.py --num_envs 4096 --device cpu
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark fused vs. per-term reward computation.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments to benchmark.")
+parser.add_argument("--num_steps", type=int, default=200, help="Number of timed steps per reward path.")
+parser.add_argument("--num_warmup", type=int, default=20, help="Number of untimed warm-up steps per reward path.")
+parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic scene states.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import inspect
+import time
+import torch
+from types import SimpleNamespace
+
+from isaaclab.utils.string import resolve_matching_names
+
+from desktop_organizer.envs.rl_env_cfg import DesktopOrganizerRLEnvCfg, FusedRewardsCfg, RewardsCfg
+from desktop_organizer.mdp import fused_reward
+
+# Action penalties are shared by both reward configurations and need the action manager
+SKIPPED_TERMS = ("action_rate", "joint_vel")
+
+FRANKA_JOINT_NAMES = [f"panda_joint{i}" for i in range(1, 8)] + ["panda_finger_joint1", "panda_finger_joint2"]
+
+
+class BenchmarkArticulation:
+    """Minimal articulation exposing the data buffers read by the reward terms."""
+
+    def __init__(self, data: SimpleNamespace, joint_names: list[str]):
+        self.data = data
+        self.joint_names = joint_names
+
+    def find_joints(self, name_keys: str | list[str], preserve_order: bool = False) -> tuple[list[int], list[str]]:
+        return resolve_matching_names(name_keys, self.joint_names, preserve_order)
+
+
+class BenchmarkEnv:
+    """Environment stand-in holding synthetic scene states for the reward terms."""
+
+    def __init__(self, num_envs: int, device: str, seed: int):
+        generator = torch.Generator(device=device).manual_seed(seed)
+
+        def uniform(low, high, *shape):
+            return low + (high - low) * torch.rand(*shape, generator=generator, device=device)
+
+        self.num_envs = num_envs
+        self.device = device
+        self.common_step_counter = 0
+
+        env_cfg = DesktopOrganizerRLEnvCfg()
+        self.cfg = SimpleNamespace(
+            gripper_joint_names=env_cfg.gripper_joint_names,
+            gripper_open_val=env_cfg.gripper_open_val,
+            gripper_threshold=env_cfg.gripper_threshold,
+        )
+
+        # robot at its default base pose with random finger openings
+        joint_pos = uniform(-1.0, 1.0, num_envs, len(FRANKA_JOINT_NAMES))
+        joint_pos[:, -2:] = uniform(0.0, 0.04, num_envs, 2)
+        joint_pos[: num_envs // 4, -2:] = 0.04
+        robot_data = SimpleNamespace(
+            root_pos_w=torch.tensor([[1.53773, 1.88609, 0.42492]], device=device).repeat(num_envs, 1),
+            root_quat_w=torch.tensor([[0.70710678, 0.0, 0.0, -0.70710678]], device=device).repeat(num_envs, 1),
+            joint_pos=joint_pos,
+        )
+
+        # objects spread over the table, some of them lifted or inside the basket
+        basket_pos = torch.tensor([[1.76, 1.48, 0.48]], device=device) + uniform(-0.03, 0.03, num_envs, 3)
+        ketchup_pos = torch.stack(
+            [uniform(1.2, 1.85, num_envs), uniform(1.3, 1.7, num_envs), uniform(0.45, 0.9, num_envs)], dim=1
+        )
+        ketchup_pos[: num_envs // 8] = basket_pos[: num_envs // 8] + uniform(-0.05, 0.05, num_envs // 8, 3)
+        ee_pos = ketchup_pos + uniform(-0.2, 0.2, num_envs, 3)
+
+        self.scene = {
+            "robot": BenchmarkArticulation(robot_data, FRANKA_JOINT_NAMES),
+            "ketchup": SimpleNamespace(data=SimpleNamespace(root_pos_w=ketchup_pos)),
+            "basket": SimpleNamespace(data=SimpleNamespace(root_pos_w=basket_pos)),
+            "ee_frame": SimpleNamespace(data=SimpleNamespace(target_pos_w=ee_pos.unsqueeze(1))),
+        }
+
+        # fixed goal above the basket in the robot root frame
+        command = torch.tensor([[0.406, 0.222, 0.375, 1.0, 0.0, 0.0, 0.0]], device=device).repeat(num_envs, 1)
+        command_term = SimpleNamespace(command=command)
+        self.command_manager = SimpleNamespace(get_command=lambda name: command, get_term=lambda name: command_term)
+
+
+def reward_terms(rewards_cfg) -> dict:
+    """Collect the reward term configurations that take part in the comparison."""
+    return {
+        name: term_cfg
+        for name, term_cfg in rewards_cfg.__dict__.items()
+        if term_cfg is not None and name not in SKIPPED_TERMS
+    }
+
+
+def run_step(env: BenchmarkEnv, terms: dict) -> dict[str, torch.Tensor]:
+    """Advance the step counter and evaluate all weighted reward terms."""
+    env.common_step_counter += 1
+    return {name: func(env, **term_cfg.params) * term_cfg.weight for name, (func, term_cfg) in terms.items()}
+
+
+def time_path(env: BenchmarkEnv, terms: dict) -> float:
+    """Return the mean wall-clock time per step in milliseconds."""
+    for _ in range(args_cli.num_warmup):
+        run_step(env, terms)
+    if env.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        run_step(env, terms)
+    if env.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) * 1000.0 / args_cli.num_steps
+
+
+def main():
+    """Compare the fused reward engine against the per-term reward path."""
+    env = BenchmarkEnv(args_cli.num_envs, args_cli.device, args_cli.seed)
+
+    per_term = {
+        name: (term_cfg.func(term_cfg, env) if inspect.isclass(term_cfg.func) else term_cfg.func, term_cfg)
+        for name, term_cfg in reward_terms(RewardsCfg()).items()
+    }
+    fused = {name: (fused_reward(term_cfg, env), term_cfg) for name, term_cfg in reward_terms(FusedRewardsCfg()).items()}
+
+    # check that both paths produce the same rewards
+    per_term_rewards = run_step(env, per_term)
+    fused_rewards = run_step(env, fused)
+    for name, value in per_term_rewards.items():
+        max_error = torch.max(torch.abs(value.float() - fused_rewards[name])).item()
+        status = "OK" if torch.allclose(value.float(), fused_rewards[name], atol=1e-4) else "MISMATCH"
+        print(f"[{status}] {name:<36s} max abs error: {max_error:.3e}")
+
+    with torch.inference_mode():
+        per_term_ms = time_path(env, per_term)
+        fused_ms = time_path(env, fused)
+
+    print(f"\nReward terms compared: {len(per_term)} | num_envs: {env.num_envs} | device: {env.device}")
+    print(f"Per-term path: {per_term_ms:8.3f} ms/step")
+    print(f"Fused engine:  {fused_ms:8.3f} ms/step")
+    print(f"Speedup:       {per_term_ms / fused_ms:8.2f}x")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,169 @@
+"""Benchmark the SO(3) maps of the Mimic env against the quaternion path of ``isaaclab.utils.math``.
+
+The script checks the accuracy of :func:`so3_exp` and :func:`so3_log` against the quaternion round trips
+previously used by the Mimic env (``matrix_from_quat(quat_from_angle_axis(...))`` and
+``axis_angle_from_quat(quat_from_matrix(...))``) on random rotations, including angles close to 0 and pi,
+and reports the time per call of both paths.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_so3.py --batch_size 64 --device cpu
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark Rodrigues SO(3) maps vs. the quaternion path.")
+parser.add_argument("--batch_size", type=int, default=64, help="Number of rotations per call.")
+parser.add_argument("--num_steps", type=int, default=2000, help="Number of timed calls per path.")
+parser.add_argument("--num_warmup", type=int, default=100, help="Number of untimed warm-up calls per path.")
+parser.add_argument("--seed", type=int, default=0, help="Random seed for the rotations.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import math
+import time
+import torch
+
+import isaaclab.utils.math as math_utils
+
+from desktop_organizer.envs.so3 import so3_exp, so3_log
+
+# rotation angles of the accuracy test cases
+TEST_ANGLES = {
+    "zero": 0.0,
+    "tiny (1e-6)": 1.0e-6,
+    "small (1e-3)": 1.0e-3,
+    "uniform": None,
+    "near pi (pi - 1e-3)": math.pi - 1.0e-3,
+    "pi": math.pi,
+}
+
+# maximum absolute errors accepted in float32
+EXP_TOLERANCE = 1.0e-5
+LOG_TOLERANCE = 1.0e-4
+
+
+def random_axis_angles(num: int, angle: float | None, generator: torch.Generator) -> torch.Tensor:
+    """Random rotation vectors with the given angle, or uniform angles in [0, pi) if None."""
+    axis = torch.nn.functional.normalize(torch.randn(num, 3, generator=generator, dtype=torch.float64), dim=-1)
+    if angle is None:
+        angles = math.pi * torch.rand(num, 1, generator=generator, dtype=torch.float64)
+    else:
+        angles = torch.full((num, 1), angle, dtype=torch.float64)
+    return axis * angles
+
+
+def reference_exp(axis_angle: torch.Tensor) -> torch.Tensor:
+    """Quaternion path of the Mimic env, evaluated in float64 as ground truth."""
+    angle = torch.linalg.vector_norm(axis_angle, dim=-1)
+    axis = axis_angle / angle.clamp_min(1.0e-300).unsqueeze(-1)
+    return math_utils.matrix_from_quat(math_utils.quat_from_angle_axis(angle, axis))
+
+
+def quat_path_exp(axis_angle: torch.Tensor) -> torch.Tensor:
+    """Previous ``action_to_target_eef_pose`` conversion (with its zero-angle masking)."""
+    angle = torch.linalg.norm(axis_angle, dim=-1, keepdim=True)
+    axis = axis_angle / angle
+    is_close_to_zero_angle = torch.isclose(angle, torch.zeros_like(angle)).squeeze(1)
+    axis[is_close_to_zero_angle] = torch.zeros_like(axis)[is_close_to_zero_angle]
+    return math_utils.matrix_from_quat(math_utils.quat_from_angle_axis(angle.squeeze(1), axis))
+
+
+def quat_path_log(rot: torch.Tensor) -> torch.Tensor:
+    """Previous ``target_eef_pose_to_action`` conversion."""
+    return math_utils.axis_angle_from_quat(math_utils.quat_from_matrix(rot))
+
+
+def log_error(estimate: torch.Tensor, expected: torch.Tensor) -> float:
+    """Maximum error of rotation vectors; at an angle of pi both axis signs are equivalent."""
+    error = torch.minimum(
+        torch.linalg.vector_norm(estimate - expected, dim=-1), torch.linalg.vector_norm(estimate + expected, dim=-1)
+    )
+    near_pi = torch.linalg.vector_norm(expected, dim=-1) > math.pi - 1.0e-6
+    error = torch.where(near_pi, error, torch.linalg.vector_norm(estimate - expected, dim=-1))
+    return error.max().item()
+
+
+def check_accuracy(device: str, generator: torch.Generator) -> bool:
+    """Compare both paths against the float64 reference and return whether the SO(3) maps pass."""
+    passed = True
+    print(
+        f"{'case':<22s} {'exp err':>10s} {'quat exp err':>13s} {'log err':>10s} {'quat log err':>13s}"
+        f" {'round trip':>11s}"
+    )
+    for name, angle in TEST_ANGLES.items():
+        axis_angle = random_axis_angles(1024, angle, generator)
+        rot = reference_exp(axis_angle)
+        axis_angle_32 = axis_angle.float().to(device)
+        rot_32 = rot.float().to(device)
+
+        exp_error = (so3_exp(axis_angle_32).double().cpu() - rot).abs().max().item()
+        quat_exp_error = (quat_path_exp(axis_angle_32.clone()).double().cpu() - rot).abs().max().item()
+        log_err = log_error(so3_log(rot_32).double().cpu(), axis_angle)
+        quat_log_err = log_error(quat_path_log(rot_32).double().cpu(), axis_angle)
+        round_trip = (so3_exp(so3_log(rot_32)).double().cpu() - rot).abs().max().item()
+
+        ok = exp_error < EXP_TOLERANCE and log_err < LOG_TOLERANCE and round_trip < EXP_TOLERANCE
+        passed &= ok
+        print(
+            f"{name:<22s} {exp_error:>10.2e} {quat_exp_error:>13.2e} {log_err:>10.2e} {quat_log_err:>13.2e}"
+            f" {round_trip:>11.2e} [{'OK' if ok else 'FAIL'}]"
+        )
+    return passed
+
+
+def time_call(func, *args) -> float:
+    """Return the mean wall-clock time per call in microseconds."""
+    for _ in range(args_cli.num_warmup):
+        func(*args)
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        func(*args)
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) * 1.0e6 / args_cli.num_steps
+
+
+def main():
+    """Check the accuracy of the SO(3) maps and time them against the quaternion path."""
+    generator = torch.Generator().manual_seed(args_cli.seed)
+    passed = check_accuracy(args_cli.device, generator)
+
+    axis_angle = random_axis_angles(args_cli.batch_size, None, generator).float().to(args_cli.device)
+    rot = so3_exp(axis_angle)
+    with torch.inference_mode():
+        timings = {
+            "exp (Rodrigues)": time_call(so3_exp, axis_angle),
+            "exp (quaternion)": time_call(quat_path_exp, axis_angle),
+            "log (Rodrigues)": time_call(so3_log, rot),
+            "log (quaternion)": time_call(quat_path_log, rot),
+        }
+
+    print(f"\nbatch size: {args_cli.batch_size} | device: {args_cli.device}")
+    for name, micros in timings.items():
+        print(f"{name:<18s} {micros:8.1f} us/call")
+    print(f"exp speedup: {timings['exp (quaternion)'] / timings['exp (Rodrigues)']:.2f}x")
+    print(f"log speedup: {timings['log (quaternion)'] / timings['log (Rodrigues)']:.2f}x")
+    print(f"\nAccuracy checks: {'PASSED' if passed else 'FAILED'}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
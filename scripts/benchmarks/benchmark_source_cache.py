@@ -0,0 +1,109 @@
+"""Check and time the parsed source-demo cache of the Mimic data generation.
+
+For an annotated dataset, the script compares the startup paths of ``generate_dataset.py``:
+
+- full read: every dataset of every episode, as the dataset file handler loads them,
+- cold cache: read ``obs/datagen_info`` and the actions and write the cache entry,
+- warm cache: memory-map the cache entry.
+
+Both cache runs reuse the file hash recorded by a first, untimed call.
+
+It then checks that the cached arrays equal the datasets of the file. The cache entry is written to a
+temporary directory unless ``--cache_dir`` is given.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_source_cache.py --dataset ./datasets/annotated.hdf5
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the parsed source-demo cache of the Mimic generation.")
+parser.add_argument("--dataset", type=str, required=True, help="Annotated source dataset.")
+parser.add_argument("--cache_dir", type=str, default=None, help="Directory of the cache entries.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import h5py
+import numpy as np
+import shutil
+import tempfile
+import time
+
+from desktop_organizer.envs.mimic_env_cfg import FrankaDesktopOrganizerIKRelMimicEnvCfg
+from desktop_organizer.envs.source_cache import load_source_episodes
+
+
+def read_everything(group: h5py.Group) -> int:
+    """Read all datasets of a group, as the dataset file handler does. Returns the number of bytes read."""
+    num_bytes = 0
+    for value in group.values():
+        num_bytes += read_everything(value) if isinstance(value, h5py.Group) else value[()].nbytes
+    return num_bytes
+
+
+def check_episodes(dataset_path: str, episodes: dict) -> bool:
+    """Compare the cached arrays with the datasets of the file."""
+    passed = True
+    with h5py.File(dataset_path, "r") as file:
+        for episode_name, data in episodes.items():
+            demo = file["data"][episode_name]
+            passed &= np.array_equal(data["actions"], demo["actions"][()])
+            for key, entries in data["obs"]["datagen_info"].items():
+                for name, value in entries.items():
+                    passed &= np.array_equal(value, demo[f"obs/datagen_info/{key}/{name}"][()])
+    return passed
+
+
+def main():
+    """Time the startup paths and check the cache entry."""
+    subtask_configs = FrankaDesktopOrganizerIKRelMimicEnvCfg().subtask_configs
+    cache_root = args_cli.cache_dir or tempfile.mkdtemp(prefix="source_cache_")
+
+    start = time.perf_counter()
+    with h5py.File(args_cli.dataset, "r") as file:
+        num_bytes = read_everything(file["data"])
+    full_time = time.perf_counter() - start
+
+    try:
+        # drop the entry of this dataset and configuration, if any, before the cold run
+        _, cache_dir = load_source_episodes(args_cli.dataset, subtask_configs, cache_root=cache_root)
+        shutil.rmtree(cache_dir)
+        start = time.perf_counter()
+        load_source_episodes(args_cli.dataset, subtask_configs, cache_root=cache_root)
+        cold_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        episodes, cache_dir = load_source_episodes(args_cli.dataset, subtask_configs, cache_root=cache_root)
+        warm_time = time.perf_counter() - start
+
+        passed = check_episodes(args_cli.dataset, episodes)
+    finally:
+        if args_cli.cache_dir is None:
+            shutil.rmtree(cache_root, ignore_errors=True)
+
+    print(f"{args_cli.dataset}: {len(episodes)} episodes, {num_bytes / 1.0e6:.1f} MB of datasets")
+    print(f"  full read:  {full_time * 1000.0:8.1f} ms")
+    print(f"  cold cache: {cold_time * 1000.0:8.1f} ms (entry: {cache_dir})")
+    print(f"  warm cache: {warm_time * 1000.0:8.1f} ms")
+    print(f"Cached arrays: {'PASSED' if passed else 'FAILED'}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,174 @@
+"""Check and time the source segment index of the Mimic ``nearest_neighbor_object`` selection.
+
+For growing source pools of synthetic object pose trajectories (positions and yaw angles in the reset ranges
+of the Mimic task), the script compares :class:`desktop_organizer.envs.source_index.SourceSegmentIndex`
+with a per-selection reference that follows the upstream strategy: slice the subtask segment of every source
+demonstration, stack the segment start poses and sort the weighted distances. It checks that both return the
+same nearest neighbors and reports the time per selection of the reference, of the index queried once per
+environment, and of one batched query for all environments.
+
+With ``--dataset``, the index is also built from the ``obs/datagen_info/object_pose`` of an annotated dataset.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_source_index.py --num_envs 64
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_source_index.py --dataset ./datasets/annotated.hdf5
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the source segment index of the Mimic selection.")
+parser.add_argument(
+    "--num_sources", type=int, nargs="+", default=[10, 100, 500], help="Sizes of the synthetic source pools."
+)
+parser.add_argument("--num_envs", type=int, default=64, help="Number of selections (one per environment).")
+parser.add_argument("--nn_k", type=int, default=3, help="Number of nearest neighbors.")
+parser.add_argument("--dataset", type=str, default=None, help="Annotated dataset to build an index from.")
+parser.add_argument("--object_name", type=str, default="ketchup", help="Object of the dataset index.")
+parser.add_argument("--seed", type=int, default=0, help="Random seed of the synthetic data.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import h5py
+import time
+import torch
+
+import isaaclab.utils.math as math_utils
+
+from desktop_organizer.envs.source_index import SourceSegmentIndex
+
+
+def random_object_poses(num_poses: int, generator: torch.Generator, device: str) -> torch.Tensor:
+    """Object poses in the ketchup reset ranges of the Mimic task. Shape is (num_poses, 4, 4)."""
+    low = torch.tensor([1.315, 1.475, 0.50771, -0.15], device=device)
+    high = torch.tensor([1.345, 1.515, 0.50771, 0.15], device=device)
+    sample = low + (high - low) * torch.rand(num_poses, 4, generator=generator, device=device)
+    zeros = torch.zeros_like(sample[:, 3])
+    rot = math_utils.matrix_from_euler(torch.stack([zeros + 1.5708, zeros, sample[:, 3]], dim=-1), "XYZ")
+    return math_utils.make_pose(sample[:, :3], rot)
+
+
+def synthetic_pool(num_sources: int, generator: torch.Generator, device: str) -> list[torch.Tensor]:
+    """Object pose trajectories of random lengths: at rest, then lifted along z."""
+    trajectories = []
+    for _ in range(num_sources):
+        length = int(torch.randint(200, 400, (1,), generator=generator, device=device).item())
+        pose = random_object_poses(1, generator, device).repeat(length, 1, 1)
+        pose[length // 2 :, 2, 3] += torch.linspace(0.0, 0.2, length - length // 2, device=device)
+        trajectories.append(pose)
+    return trajectories
+
+
+def reference_neighbors(
+    trajectories: list[torch.Tensor], start_indices: list[int], object_pose: torch.Tensor, nn_k: int
+) -> torch.Tensor:
+    """Nearest neighbors of one selection as computed by the upstream strategy."""
+    # the generator slices the segment of every source demonstration before each selection
+    segments = [trajectory[start:] for trajectory, start in zip(trajectories, start_indices)]
+    src_object_poses = torch.stack([segment[0] for segment in segments])
+    src_pos, src_rot = math_utils.unmake_pose(src_object_poses)
+    obj_pos, obj_rot = math_utils.unmake_pose(object_pose)
+    pos_dists = torch.linalg.vector_norm(src_pos - obj_pos, dim=-1)
+    delta_rot = torch.matmul(src_rot, obj_rot.T)
+    trace = delta_rot.diagonal(dim1=-2, dim2=-1).sum(-1)
+    rot_dists = torch.arccos(torch.clamp((trace - 1.0) / 2.0, -1.0, 1.0))
+    return torch.argsort(pos_dists + rot_dists)[: min(nn_k, len(trajectories))]
+
+
+def benchmark_pool(num_sources: int, generator: torch.Generator, device: str) -> bool:
+    """Compare the index with the reference on one synthetic source pool and time both."""
+    trajectories = synthetic_pool(num_sources, generator, device)
+    lengths = torch.tensor([trajectory.shape[0] for trajectory in trajectories], device=device)
+    # randomized segment starts, as for the subtask boundaries of one generation trial
+    start_indices = (torch.rand(num_sources, generator=generator, device=device) * (lengths - 1)).long()
+    start_list = start_indices.tolist()
+    object_pose = random_object_poses(args_cli.num_envs, generator, device)
+
+    start = time.perf_counter()
+    index = SourceSegmentIndex(trajectories, device=device)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = torch.stack(
+        [reference_neighbors(trajectories, start_list, pose, args_cli.nn_k) for pose in object_pose]
+    )
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pose in object_pose:
+        index.select(pose.unsqueeze(0), start_indices, nn_k=args_cli.nn_k)
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    neighbors = index.query(object_pose, start_indices, k=args_cli.nn_k)
+    index.select(object_pose, start_indices, nn_k=args_cli.nn_k)
+    batched_time = time.perf_counter() - start
+
+    # compare the neighbor sets: ties between equal distances may be ordered differently
+    match = torch.equal(neighbors.sort(dim=1).values, expected.sort(dim=1).values)
+    per_selection = 1.0e6 / args_cli.num_envs
+    print(
+        f"{num_sources:5d} sources | build: {build_time * 1000.0:7.1f} ms"
+        f" | reference: {reference_time * per_selection:7.1f} us"
+        f" | index: {single_time * per_selection:6.1f} us"
+        f" | batched: {batched_time * per_selection:5.1f} us per selection [{'OK' if match else 'MISMATCH'}]"
+    )
+    return match
+
+
+def benchmark_dataset(dataset_path: str, device: str):
+    """Build the index of one object from an annotated dataset and time a batched selection."""
+    with h5py.File(dataset_path, "r") as file:
+        trajectories = [
+            torch.from_numpy(demo[f"obs/datagen_info/object_pose/{args_cli.object_name}"][()]).to(device)
+            for demo in file["data"].values()
+            if f"obs/datagen_info/object_pose/{args_cli.object_name}" in demo
+        ]
+    start = time.perf_counter()
+    index = SourceSegmentIndex(trajectories, device=device)
+    build_time = time.perf_counter() - start
+
+    start_indices = torch.zeros(index.num_sources, dtype=torch.long, device=device)
+    object_pose = index.positions.new_zeros(args_cli.num_envs, 4, 4)
+    object_pose[:] = torch.eye(4, device=device)
+    object_pose[:, :3, :3] = index.rotations[0, 0]
+    object_pose[:, :3, 3] = index.positions[:, 0].mean(dim=0)
+    start = time.perf_counter()
+    selected = index.select(object_pose, start_indices, nn_k=args_cli.nn_k)
+    select_time = time.perf_counter() - start
+    print(
+        f"{dataset_path}: {index.num_sources} sources of up to {index.positions.shape[1]} steps"
+        f" | build: {build_time * 1000.0:.1f} ms | {args_cli.num_envs} selections: {select_time * 1000.0:.2f} ms"
+        f" | selected demos: {sorted(set(selected.tolist()))}"
+    )
+
+
+def main():
+    """Run the synthetic comparison and the optional dataset check."""
+    generator = torch.Generator(device=args_cli.device).manual_seed(args_cli.seed)
+    print(f"{args_cli.num_envs} selections with nn_k={args_cli.nn_k} on {args_cli.device}")
+    passed = all([benchmark_pool(num_sources, generator, args_cli.device) for num_sources in args_cli.num_sources])
+    print(f"Nearest neighbors: {'PASSED' if passed else 'FAILED'}")
+    if args_cli.dataset is not None:
+        print()
+        benchmark_dataset(args_cli.dataset, args_cli.device)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
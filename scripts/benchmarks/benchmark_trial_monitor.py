@@ -0,0 +1,133 @@
+"""Check the trial failure detectors of the Mimic generation on synthetic trials and estimate the steps saved.
+
+Every synthetic trial follows the timeline of the Desktop Organizer task: the gripper closes at
+``--grasp_step``, the object is carried from ``--grasp_step`` to ``--release_step``, where the gripper opens
+over the basket, and the trial ends after ``--num_steps`` steps. The IK-relative action noise of the
+generation (``--action_noise`` per axis) is added to the target error of all trials. A fraction ``--failure_rate``
+of the trials fails at a random step, in one of three ways: the object drops below the table, the object slips out
+of the closed gripper, or the end-effector stops following its targets.
+
+The script advances :func:`desktop_organizer.envs.trial_monitor.detect_trial_failures` for all trials at once
+and checks that:
+
+- sound trials never fire (including the release of the place subtask),
+- every failed trial is detected with its own reason, within the patience of its detector.
+
+It then reports the steps executed with and without the early abort, and the resulting gain in successful
+demos per simulated hour.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/benchmark_trial_monitor.py --num_trials 4096
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Check the trial failure detectors of the Mimic generation.")
+parser.add_argument("--num_trials", type=int, default=4096, help="Number of synthetic trials.")
+parser.add_argument("--num_steps", type=int, default=600, help="Number of steps of a complete trial.")
+parser.add_argument("--grasp_step", type=int, default=150, help="Step at which the object is grasped.")
+parser.add_argument("--release_step", type=int, default=480, help="Step at which the object is released.")
+parser.add_argument("--failure_rate", type=float, default=0.4, help="Fraction of failed trials.")
+parser.add_argument("--action_noise", type=float, default=0.03, help="Action noise (m) per axis.")
+parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic trials.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+import torch
+
+from desktop_organizer.envs.mimic_env_cfg import FrankaDesktopOrganizerIKRelMimicEnvCfg
+from desktop_organizer.envs.trial_monitor import FAILURE_REASONS, detect_trial_failures
+
+
+def main():
+    """Run the detectors on synthetic trials."""
+    cfg = FrankaDesktopOrganizerIKRelMimicEnvCfg().trial_failures
+    num_trials, num_steps, device = args_cli.num_trials, args_cli.num_steps, args_cli.device
+    generator = torch.Generator(device=device).manual_seed(args_cli.seed)
+
+    # failure kind (-1: sound trial) and first violating step of every trial
+    failed = torch.rand(num_trials, generator=generator, device=device) < args_cli.failure_rate
+    kinds = torch.randint(len(FAILURE_REASONS), (num_trials,), generator=generator, device=device)
+    kinds = torch.where(failed, kinds, -1)
+    # objects drop and slip while carried, the end-effector can get stuck at any time, early enough to be detected
+    carried = torch.randint(
+        args_cli.grasp_step + 10,
+        args_cli.release_step - cfg.grasp_lost_steps,
+        (num_trials,),
+        generator=generator,
+        device=device,
+    )
+    anytime = torch.randint(1, num_steps - cfg.target_error_steps, (num_trials,), generator=generator, device=device)
+    dropped, slipped, diverged = (kinds == FAILURE_REASONS.index(reason) for reason in FAILURE_REASONS)
+    failure_steps = torch.where(diverged, anytime, carried)
+
+    grasped = torch.zeros(num_trials, dtype=torch.bool, device=device)
+    grasp_lost_steps = torch.zeros(num_trials, dtype=torch.long, device=device)
+    target_error_steps = torch.zeros(num_trials, dtype=torch.long, device=device)
+    detected_steps = torch.full((num_trials,), num_steps, device=device)
+    detected_reasons = torch.full((num_trials,), -1, device=device)
+
+    start = time.perf_counter()
+    for step in range(num_steps):
+        violated = (kinds >= 0) & (step >= failure_steps)
+        carrying = (step >= args_cli.grasp_step) & (step < args_cli.release_step)
+        noise = args_cli.action_noise * torch.randn(num_trials, 3, generator=generator, device=device)
+        target_error = torch.linalg.vector_norm(noise + 0.005, dim=1)
+        target_error = torch.where(violated & diverged, target_error + 0.2, target_error)
+        reasons = detect_trial_failures(
+            object_height=torch.where(violated & dropped, 0.2, 0.55),
+            grasping=torch.full((num_trials,), carrying, device=device) & ~(violated & (dropped | slipped)),
+            gripper_closing=torch.full((num_trials,), step < args_cli.release_step, device=device),
+            target_error=target_error,
+            grasped=grasped,
+            grasp_lost_steps=grasp_lost_steps,
+            target_error_steps=target_error_steps,
+            cfg=cfg,
+        )
+        first = (reasons >= 0) & (detected_reasons < 0)
+        detected_steps = torch.where(first, step, detected_steps)
+        detected_reasons = torch.where(first, reasons, detected_reasons)
+    elapsed = time.perf_counter() - start
+
+    sound = kinds < 0
+    false_positives = int((sound & (detected_reasons >= 0)).sum())
+    patience = torch.tensor([1, cfg.grasp_lost_steps, cfg.target_error_steps], device=device)
+    latency = detected_steps - failure_steps
+    on_time = (detected_reasons == kinds) & (latency < patience[kinds.clamp(min=0)])
+    missed = int((~sound & ~on_time).sum())
+    print(f"{num_trials} trials, {int((~sound).sum())} failed, detectors: {elapsed / num_steps * 1.0e6:.1f} us/step")
+    for code, reason in enumerate(FAILURE_REASONS):
+        selected = kinds == code
+        if selected.any():
+            mean_latency = latency[selected].float().mean()
+            print(f"  {reason:16s} {int(selected.sum()):5d} trials | mean latency {mean_latency:.1f} steps")
+
+    # aborted trials stop at their detection step, the others run to the end
+    steps_full = num_trials * num_steps
+    steps_aborted = int(torch.where(sound, num_steps, detected_steps + 1).sum())
+    print(f"Steps executed: {steps_full} -> {steps_aborted} ({1.0 - steps_aborted / steps_full:.1%} saved)")
+    print(f"Successful demos per sim-hour: x{steps_full / steps_aborted:.2f}")
+    print(f"Detectors: {'PASSED' if false_positives == 0 and missed == 0 else 'FAILED'}")
+    print(f"  false positives: {false_positives}, missed or late: {missed}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
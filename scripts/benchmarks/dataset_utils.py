@@ -0,0 +1,13 @@
+"""Helpers shared by the benchmark scripts that read recorded datasets."""
+
+from __future__ import annotations
+
+import h5py
+import torch
+
+
+def pre_step(demo: h5py.Group, key: str) -> torch.Tensor:
+    """Recorded state before each action: the initial state followed by all but the last post-step state."""
+    initial = torch.from_numpy(demo[f"initial_state/{key}"][()])
+    states = torch.from_numpy(demo[f"states/{key}"][()])
+    return torch.cat([initial[:1], states[:-1]], dim=0)
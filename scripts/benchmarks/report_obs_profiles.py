@@ -0,0 +1,96 @@
+"""Report observation dimensions and rollout memory of the observation profiles.
+
+The script builds the environment of every profile in :data:`OBSERVATION_PROFILES` with a single
+environment, reads the observation and action dimensions from the managers and extrapolates the PPO
+rollout storage and the actor first-layer cost to the training setup (``--num_envs`` environments and
+``num_steps_per_env`` steps of :class:`DesktopOrganizerPPORunnerCfg`).
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/report_obs_profiles.py --num_envs 4096
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Report obs dimension and rollout memory per observation profile.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of training environments to extrapolate to.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+from isaaclab.envs import ManagerBasedRLEnv
+
+from desktop_organizer.config.ppo_cfg import DesktopOrganizerPPORunnerCfg
+from desktop_organizer.envs.rl_env_cfg import OBSERVATION_PROFILES, FrankaDesktopOrganizerIKRelEnvCfg
+
+# bytes per float32 element of the rollout storage
+FLOAT_BYTES = 4
+
+
+def group_width(group_obs_dim: dict, group_name: str) -> int:
+    """Flattened width of an observation group (concatenated or not)."""
+    dims = group_obs_dim[group_name]
+    if isinstance(dims, tuple):
+        return dims[-1]
+    return sum(dim[-1] for dim in dims)
+
+
+def rollout_bytes(policy_dim: int, critic_dim: int, action_dim: int, num_envs: int, num_steps: int) -> int:
+    """Memory of the PPO rollout storage in bytes.
+
+    Per transition the storage keeps the policy and critic observations, the action, its mean and standard
+    deviation, the log-probability, reward, done flag, value, return and advantage.
+    """
+    per_transition = policy_dim + critic_dim + 3 * action_dim + 6
+    return per_transition * num_envs * num_steps * FLOAT_BYTES
+
+
+def main():
+    """Build every observation profile and print its dimensions and rollout memory."""
+    runner_cfg = DesktopOrganizerPPORunnerCfg()
+    num_steps = runner_cfg.num_steps_per_env
+    actor_first_layer = runner_cfg.policy.actor_hidden_dims[0]
+
+    rows = []
+    for name, observations_cfg in OBSERVATION_PROFILES.items():
+        env_cfg = FrankaDesktopOrganizerIKRelEnvCfg()
+        env_cfg.observations = observations_cfg()
+        env_cfg.scene.num_envs = 1
+        env_cfg.sim.device = args_cli.device
+        env = ManagerBasedRLEnv(cfg=env_cfg)
+
+        group_obs_dim = env.observation_manager.group_obs_dim
+        policy_dim = group_width(group_obs_dim, "policy")
+        # without a critic group the critic consumes the policy observations
+        critic_dim = group_width(group_obs_dim, "critic") if "critic" in group_obs_dim else policy_dim
+        action_dim = env.action_manager.total_action_dim
+        env.close()
+
+        memory_mib = rollout_bytes(policy_dim, critic_dim, action_dim, args_cli.num_envs, num_steps) / 2**20
+        # multiply-accumulates of the actor input layer for one batched inference over all environments
+        actor_mflops = 2 * policy_dim * actor_first_layer * args_cli.num_envs / 1e6
+        rows.append((name, policy_dim, critic_dim, memory_mib, actor_mflops))
+
+    print(f"\nnum_envs: {args_cli.num_envs} | num_steps_per_env: {num_steps} | actor first layer: {actor_first_layer}")
+    print(f"{'profile':<20s} {'policy dim':>10s} {'critic dim':>10s} {'rollout MiB':>12s} {'actor L1 MFLOP':>15s}")
+    for name, policy_dim, critic_dim, memory_mib, actor_mflops in rows:
+        print(f"{name:<20s} {policy_dim:>10d} {critic_dim:>10d} {memory_mib:>12.1f} {actor_mflops:>15.1f}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
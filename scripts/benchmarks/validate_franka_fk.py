@@ -0,0 +1,120 @@
+"""Validate and time the batched Franka forward kinematics against recorded end-effector observations.
+
+For every episode of a dataset recorded with the Mimic task (``record_demos.py``), the end-effector poses are
+recomputed from the recorded joint states and robot root poses with
+:func:`desktop_organizer.envs.franka_kinematics.franka_forward_kinematics` and compared to the recorded
+``obs/eef_pos`` and ``obs/eef_quat`` (the ``ee_frame`` sensor). Observations are recorded before each step,
+so they are compared to the initial state followed by the post-step states of all but the last step.
+
+The script then times the kinematics on a batch of random joint states.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/benchmarks/validate_franka_fk.py \
+        --dataset ./datasets/raw.hdf5 --num_samples 1000000
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Validate the batched Franka forward kinematics.")
+parser.add_argument("--dataset", type=str, default=None, help="Recorded dataset to validate against.")
+parser.add_argument("--num_samples", type=int, default=1_000_000, help="Number of joint states for the timing.")
+parser.add_argument("--num_trials", type=int, default=5, help="Number of timed calls.")
+parser.add_argument("--pos_tolerance", type=float, default=1.0e-3, help="Maximum position error (m).")
+parser.add_argument("--rot_tolerance", type=float, default=1.0e-3, help="Maximum rotation error (rad).")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(device="cpu", headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import h5py
+import time
+import torch
+
+import isaaclab.utils.math as math_utils
+
+from desktop_organizer.envs.franka_kinematics import PANDA_JOINT_LIMITS, franka_forward_kinematics
+
+# local imports
+from dataset_utils import pre_step  # isort: skip
+
+
+def validate(dataset_path: str, device: str) -> bool:
+    """Compare the forward kinematics with the recorded end-effector observations of every episode."""
+    passed = True
+    max_pos_error = 0.0
+    max_rot_error = 0.0
+    num_steps = 0
+    with h5py.File(dataset_path, "r") as file:
+        for episode_name, demo in file["data"].items():
+            if "eef_pos" not in demo["obs"] or "eef_quat" not in demo["obs"]:
+                print(f"{episode_name}: skipped (no 'obs/eef_pos' or 'obs/eef_quat')")
+                continue
+            joint_pos = pre_step(demo, "articulation/robot/joint_position").to(device)
+            root_state = pre_step(demo, "articulation/robot/root_pose").to(device)
+            root_pose = math_utils.make_pose(root_state[:, :3], math_utils.matrix_from_quat(root_state[:, 3:7]))
+
+            eef_pose = franka_forward_kinematics(joint_pos, root_pose=root_pose)
+            eef_pos, eef_rot = math_utils.unmake_pose(eef_pose)
+            recorded_pos = torch.from_numpy(demo["obs/eef_pos"][()]).to(device)
+            recorded_quat = torch.from_numpy(demo["obs/eef_quat"][()]).to(device)
+
+            pos_error = torch.linalg.vector_norm(eef_pos - recorded_pos, dim=-1).max().item()
+            eef_quat = math_utils.quat_from_matrix(eef_rot)
+            rot_error = math_utils.quat_error_magnitude(eef_quat, recorded_quat).max().item()
+            ok = pos_error < args_cli.pos_tolerance and rot_error < args_cli.rot_tolerance
+            passed &= ok
+            max_pos_error = max(max_pos_error, pos_error)
+            max_rot_error = max(max_rot_error, rot_error)
+            num_steps += joint_pos.shape[0]
+            print(
+                f"{episode_name}: {joint_pos.shape[0]} steps | max pos error: {pos_error * 1000.0:.3f} mm"
+                f" | max rot error: {rot_error:.2e} rad [{'OK' if ok else 'MISMATCH'}]"
+            )
+
+    print(
+        f"\n{num_steps} steps | max pos error: {max_pos_error * 1000.0:.3f} mm | max rot error: {max_rot_error:.2e} rad"
+    )
+    return passed
+
+
+def main():
+    """Validate the forward kinematics on the dataset and time it on random joint states."""
+    if args_cli.dataset is not None:
+        passed = validate(args_cli.dataset, args_cli.device)
+        print(f"Validation: {'PASSED' if passed else 'FAILED'}\n")
+
+    low, high = torch.tensor(PANDA_JOINT_LIMITS, device=args_cli.device).unbind(-1)
+    joint_pos = low + (high - low) * torch.rand(args_cli.num_samples, 7, device=args_cli.device)
+    with torch.inference_mode():
+        franka_forward_kinematics(joint_pos[:1000])
+        timings = []
+        for _ in range(args_cli.num_trials):
+            if args_cli.device.startswith("cuda"):
+                torch.cuda.synchronize()
+            start = time.perf_counter()
+            franka_forward_kinematics(joint_pos)
+            if args_cli.device.startswith("cuda"):
+                torch.cuda.synchronize()
+            timings.append(time.perf_counter() - start)
+    best = min(timings)
+    print(f"Forward kinematics of {args_cli.num_samples} joint states on {args_cli.device}: {best * 1000.0:.1f} ms")
+    print(f"Throughput: {args_cli.num_samples / best / 1.0e6:.2f} M states/s")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
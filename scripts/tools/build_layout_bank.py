@@ -0,0 +1,90 @@
+"""Precompute a bank of collision-free reset layouts for the desktop organizer task.
+
+The pose ranges are read from the ``randomize_object_poses`` reset event of the RL or Mimic environment
+configuration. Every stored layout keeps all assets farther than ``--min_separation`` apart and places
+the reachable assets within ``--max_reach`` of the robot base. Use the bank with the
+``mdp.reset_from_layout_bank`` reset event.
+
+Usage:
+    /path/to/IsaacLab/isaaclab.sh -p scripts/tools/build_layout_bank.py \
+        --profile rl --num_layouts 100000 --output datasets/layout_bank_rl.pt
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Precompute a bank of collision-free reset layouts.")
+parser.add_argument(
+    "--profile", type=str, default="rl", choices=["rl", "mimic"], help="Environment config to read pose ranges from."
+)
+parser.add_argument("--num_layouts", type=int, default=100000, help="Number of layouts in the bank.")
+parser.add_argument("--min_separation", type=float, default=0.10, help="Minimum distance between any two assets.")
+parser.add_argument(
+    "--reachable_assets",
+    type=str,
+    nargs="+",
+    default=["ketchup", "basket"],
+    help="Assets that must be within reach of the robot base.",
+)
+parser.add_argument("--max_reach", type=float, default=0.80, help="Maximum horizontal reach from the robot base.")
+parser.add_argument("--seed", type=int, default=0, help="Seed of the layout sampler.")
+parser.add_argument("--output", type=str, required=True, help="Path of the layout bank file (.pt).")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+parser.set_defaults(headless=True)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import os
+import torch
+
+from desktop_organizer.envs.mimic_env_cfg import FrankaDesktopOrganizerIKRelMimicEnvCfg
+from desktop_organizer.envs.rl_env_cfg import FrankaDesktopOrganizerIKRelEnvCfg
+from desktop_organizer.mdp.layout_bank import build_layout_bank
+
+
+def main():
+    """Build the layout bank and save it."""
+    if args_cli.profile == "mimic":
+        env_cfg = FrankaDesktopOrganizerIKRelMimicEnvCfg()
+    else:
+        env_cfg = FrankaDesktopOrganizerIKRelEnvCfg()
+    randomize_params = env_cfg.events.randomize_object_poses.params
+    asset_names = [asset_cfg.name for asset_cfg in randomize_params["asset_cfgs"]]
+
+    bank = build_layout_bank(
+        asset_names=asset_names,
+        per_object_pose_ranges=randomize_params["per_object_pose_ranges"],
+        num_layouts=args_cli.num_layouts,
+        min_separation=args_cli.min_separation,
+        robot_base_pos=env_cfg.scene.robot.init_state.pos,
+        reachable_assets=args_cli.reachable_assets,
+        max_reach=args_cli.max_reach,
+        seed=args_cli.seed,
+    )
+    bank["profile"] = args_cli.profile
+
+    output_dir = os.path.dirname(os.path.abspath(args_cli.output))
+    os.makedirs(output_dir, exist_ok=True)
+    torch.save(bank, args_cli.output)
+
+    size_mib = os.path.getsize(args_cli.output) / 2**20
+    print(f"[INFO] Saved {args_cli.num_layouts} layouts of {asset_names} to '{args_cli.output}' ({size_mib:.1f} MiB)")
+    print(f"[INFO] Acceptance rate: {bank['acceptance_rate']:.3f}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,305 @@
+"""Flatten the desktop scene USD into one file with deduplicated, instanceable sub-assets.
+
+The collected scene (``table_clean.usd``) references one ``SubUSDs`` file per sub-asset and still carries
+inactive Panda copies (``franka``, ``panda_instanceable``) whose link files are near-identical variants of
+each other. The robot of the task is spawned separately from ``FRANKA_PANDA_HIGH_PD_CFG``, so none of
+these prims are used. The tool:
+
+1. flattens the root layer stack (drops unresolvable Omniverse metrics sublayers),
+2. strips inactive prims, prims matching ``--strip_patterns`` and root prims outside the default prim,
+3. content-hashes the referenced sub-layers (ignoring layer metadata such as viewport settings, and
+   hashing dependencies recursively) so that duplicate sub-assets collapse into one prototype,
+4. bakes every referenced sub-asset together with its scene overrides into a ``/Prototypes`` class prim of
+   the output and replaces the external reference by an internal one,
+5. marks prototypes without rigid bodies instanceable, so every environment clone shares their prototype,
+6. writes a single USD whose only external assets are textures and materials.
+
+Prims referencing a sub-asset that does not exist (the collected scene references ``SubUSDs/basket.usd``,
+which is not shipped) keep their external references and overrides, and a warning is printed.
+
+Only ``pxr`` is required (``pip install usd-core`` or the Isaac Sim Python environment).
+
+Usage:
+    python scripts/tools/optimize_scene_usd.py \
+        --output assets/scenes/Collected_table_clean/table_clean_flat.usd
+
+To use the result, point ``USD_SCENE_PATH`` in ``desktop_organizer/envs/rl_env_cfg.py`` to the output file.
+"""
+
+import argparse
+import os
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_INPUT = os.path.join(REPO_DIR, "assets", "scenes", "Collected_table_clean", "table_clean.usd")
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Flatten the scene USD and deduplicate its sub-assets.")
+parser.add_argument("--input", type=str, default=DEFAULT_INPUT, help="Path to the collected scene USD.")
+parser.add_argument("--output", type=str, required=True, help="Path of the flattened scene USD.")
+parser.add_argument(
+    "--strip_patterns",
+    type=str,
+    nargs="*",
+    default=["franka*", "panda*"],
+    help="Prim name patterns to remove (the task robot is spawned from FRANKA_PANDA_HIGH_PD_CFG).",
+)
+parser.add_argument(
+    "--keep_inactive", action="store_true", default=False, help="Keep inactive prims instead of removing them."
+)
+parser.add_argument(
+    "--keep_all_root_prims",
+    action="store_true",
+    default=False,
+    help="Keep root prims outside the default prim (they are not composed when the scene is referenced).",
+)
+parser.add_argument(
+    "--num_load_trials", type=int, default=3, help="Number of stage loads used to compare the load times."
+)
+# parse the arguments
+args_cli = parser.parse_args()
+
+"""Rest everything follows."""
+
+import fnmatch
+import hashlib
+import time
+
+from pxr import Sdf, Tf, Usd, UsdPhysics, UsdUtils
+
+PROTOTYPES_ROOT = Sdf.Path("/Prototypes")
+
+
+def make_absolute(asset_path: str, anchor_dir: str) -> str:
+    """Anchor a relative file asset path to a directory. Search paths (e.g. ``OmniPBR.mdl``) are kept."""
+    if asset_path.startswith("./") or asset_path.startswith("../"):
+        return os.path.normpath(os.path.join(anchor_dir, asset_path))
+    return asset_path
+
+
+def make_relative(asset_path: str, anchor_dir: str) -> str:
+    """Express an absolute file asset path relative to a directory."""
+    if os.path.isabs(asset_path):
+        return "./" + os.path.relpath(asset_path, anchor_dir).replace(os.sep, "/")
+    return asset_path
+
+
+def layer_content_hash(path: str, memo: dict[str, str], active: tuple[str, ...] = ()) -> str:
+    """Hash of the scene description of a layer.
+
+    Layer metadata (viewport cameras, render settings, authoring layer) is ignored and the layer's own
+    composition dependencies are replaced by their hashes, so copies of the same asset hash equally even
+    if they reference different copies of the same material file.
+    """
+    if path in memo:
+        return memo[path]
+    layer = Sdf.Layer.FindOrOpen(path)
+    if layer is None or path in active:
+        # unresolvable or cyclic dependency: identify it by its path
+        return hashlib.sha256(path.encode()).hexdigest()
+
+    dependency_hashes = {}
+    for dependency in layer.GetCompositionAssetDependencies():
+        dependency_path = layer.ComputeAbsolutePath(dependency)
+        dependency_hashes[dependency] = "hash:" + layer_content_hash(dependency_path, memo, active + (path,))
+
+    content = Sdf.Layer.CreateAnonymous(os.path.splitext(path)[1])
+    content.TransferContent(layer)
+    content.customLayerData = {}
+    UsdUtils.ModifyAssetPaths(content, lambda asset_path: dependency_hashes.get(asset_path, asset_path))
+    memo[path] = hashlib.sha256(content.ExportToString().encode()).hexdigest()
+    return memo[path]
+
+
+def remove_prim_spec(layer: Sdf.Layer, path: Sdf.Path):
+    """Remove a prim spec and its descendants from a layer."""
+    edit = Sdf.BatchNamespaceEdit()
+    edit.Add(path, Sdf.Path.emptyPath)
+    if not layer.Apply(edit):
+        raise RuntimeError(f"Failed to remove prim '{path}'.")
+
+
+def strip_prims(layer: Sdf.Layer) -> list[str]:
+    """Remove unused prims from the layer and return their paths."""
+    removed = []
+    default_prim = layer.defaultPrim
+
+    def visit(spec: Sdf.PrimSpec):
+        for child in list(spec.nameChildren):
+            inactive = child.HasInfo("active") and not child.active
+            is_outside_default = spec == layer.pseudoRoot and child.name != default_prim
+            if (
+                (inactive and not args_cli.keep_inactive)
+                or (is_outside_default and not args_cli.keep_all_root_prims)
+                or any(fnmatch.fnmatch(child.name, pattern) for pattern in args_cli.strip_patterns)
+            ):
+                removed.append(str(child.path))
+                remove_prim_spec(layer, child.path)
+            else:
+                visit(child)
+
+    visit(layer.pseudoRoot)
+    return removed
+
+
+def external_arcs(spec: Sdf.PrimSpec) -> list[Sdf.Reference | Sdf.Payload]:
+    """References and payloads of a prim spec that point to another file."""
+    arcs = []
+    for arc_list in (spec.referenceList, spec.payloadList):
+        arcs += [arc for arc in arc_list.GetAddedOrExplicitItems() if arc.assetPath]
+        arcs += [arc for arc in arc_list.prependedItems if arc.assetPath]
+        arcs += [arc for arc in arc_list.appendedItems if arc.assetPath]
+    return arcs
+
+
+def collect_arc_prims(layer: Sdf.Layer) -> list[Sdf.PrimSpec]:
+    """Prim specs that reference or payload other files, outermost first."""
+    found = []
+
+    def visit(spec: Sdf.PrimSpec):
+        for child in spec.nameChildren:
+            if external_arcs(child):
+                found.append(child)
+            else:
+                visit(child)
+
+    visit(layer.pseudoRoot)
+    return found
+
+
+def overrides_hash(layer: Sdf.Layer, spec: Sdf.PrimSpec) -> str:
+    """Hash of the overrides authored below a prim in the scene layer."""
+    overrides = Sdf.Layer.CreateAnonymous(".usda")
+    Sdf.CreatePrimInLayer(overrides, "/O")
+    for child in spec.nameChildren:
+        Sdf.CopySpec(layer, child.path, overrides, Sdf.Path("/O").AppendChild(child.name))
+    return hashlib.sha256(overrides.ExportToString().encode()).hexdigest()
+
+
+def build_prototype(layer: Sdf.Layer, spec: Sdf.PrimSpec) -> tuple[Sdf.Layer, bool]:
+    """Compose a sub-asset with its scene overrides and flatten it.
+
+    Returns:
+        The flattened layer holding the prototype at ``/P`` and whether the prototype can be instanced
+        (it contains no rigid bodies or articulations, which must stay editable for physics).
+    """
+    source = Sdf.Layer.CreateAnonymous(".usda")
+    prototype = Sdf.CreatePrimInLayer(source, "/P")
+    prototype.specifier = Sdf.SpecifierDef
+    for arc in external_arcs(spec):
+        if isinstance(arc, Sdf.Payload):
+            prototype.payloadList.Append(arc)
+        else:
+            prototype.referenceList.Append(arc)
+    for child in spec.nameChildren:
+        Sdf.CopySpec(layer, child.path, source, Sdf.Path("/P").AppendChild(child.name))
+
+    stage = Usd.Stage.Open(source, load=Usd.Stage.LoadAll)
+    instanceable = not any(
+        prim.HasAPI(UsdPhysics.RigidBodyAPI) or prim.HasAPI(UsdPhysics.ArticulationRootAPI)
+        for prim in Usd.PrimRange(stage.GetPrimAtPath("/P"), Usd.TraverseInstanceProxies())
+    )
+    return stage.Flatten(), instanceable
+
+
+def dependency_footprint(path: str) -> tuple[int, int]:
+    """Number of files and total size in bytes of a USD file and all its dependencies."""
+    layers, assets, _ = UsdUtils.ComputeAllDependencies(path)
+    files = {layer.realPath for layer in layers if layer.realPath} | {asset for asset in assets if asset}
+    files = {f for f in files if os.path.isfile(f)}
+    return len(files), sum(os.path.getsize(f) for f in files)
+
+
+def load_time(path: str) -> float:
+    """Best wall-clock time in seconds to open and fully load a stage."""
+    best = float("inf")
+    for _ in range(args_cli.num_load_trials):
+        start = time.perf_counter()
+        stage = Usd.Stage.Open(path, load=Usd.Stage.LoadAll)
+        sum(1 for _ in stage.Traverse())
+        best = min(best, time.perf_counter() - start)
+        del stage
+    return best
+
+
+def main():
+    """Flatten, strip and deduplicate the scene USD."""
+    input_path = os.path.abspath(args_cli.input)
+    output_path = os.path.abspath(args_cli.output)
+    input_dir = os.path.dirname(input_path)
+
+    # flatten the root layer stack, keep references and payloads
+    stage = Usd.Stage.Open(input_path, load=Usd.Stage.LoadNone)
+    layer = UsdUtils.FlattenLayerStack(stage)
+    UsdUtils.ModifyAssetPaths(layer, lambda asset_path: make_absolute(asset_path, input_dir))
+
+    removed = strip_prims(layer)
+    print(f"[INFO] Removed {len(removed)} unused prims:")
+    for path in removed:
+        print(f"\t{path}")
+
+    # group the referenced sub-assets by content and scene overrides
+    memo = {}
+    prototypes: dict[tuple, tuple[Sdf.Path, bool]] = {}
+    unresolved = []
+    prototypes_root = Sdf.CreatePrimInLayer(layer, PROTOTYPES_ROOT)
+    prototypes_root.specifier = Sdf.SpecifierClass
+    for spec in collect_arc_prims(layer):
+        if spec.path.HasPrefix(PROTOTYPES_ROOT):
+            continue
+        arcs = external_arcs(spec)
+        missing = sorted({arc.assetPath for arc in arcs if not os.path.exists(arc.assetPath)})
+        if missing:
+            # nothing to hash or bake: the prim keeps its external arcs and composes as in the input scene
+            print(f"[WARNING] '{spec.path}' keeps its external references, missing sub-assets: {missing}")
+            unresolved.append(str(spec.path))
+            continue
+        key = (
+            tuple((layer_content_hash(arc.assetPath, memo), str(arc.primPath)) for arc in arcs),
+            overrides_hash(layer, spec),
+        )
+        if key not in prototypes:
+            flattened, instanceable = build_prototype(layer, spec)
+            name = os.path.splitext(os.path.basename(arcs[0].assetPath))[0]
+            prototype_path = PROTOTYPES_ROOT.AppendChild(Tf.MakeValidIdentifier(name))
+            while layer.GetPrimAtPath(prototype_path):
+                prototype_path = PROTOTYPES_ROOT.AppendChild(prototype_path.name + "_")
+            Sdf.CopySpec(flattened, "/P", layer, prototype_path)
+            prototypes[key] = (prototype_path, instanceable)
+        else:
+            print(f"[INFO] '{spec.path}' is a duplicate of '{prototypes[key][0]}'")
+        prototype_path, instanceable = prototypes[key]
+
+        # replace the external arcs and the baked overrides by an internal reference
+        spec.referenceList.ClearEdits()
+        spec.payloadList.ClearEdits()
+        for child in list(spec.nameChildren):
+            remove_prim_spec(layer, child.path)
+        spec.referenceList.Prepend(Sdf.Reference(primPath=prototype_path))
+        spec.instanceable = instanceable
+        print(f"[INFO] {spec.path} -> {prototype_path} (instanceable: {instanceable})")
+
+    # report duplicate sub-layers of the input
+    groups: dict[str, list[str]] = {}
+    for path, digest in memo.items():
+        groups.setdefault(digest, []).append(os.path.relpath(path, input_dir))
+    for paths in groups.values():
+        if len(paths) > 1:
+            print(f"[INFO] Identical sub-layers collapsed: {sorted(paths)}")
+
+    output_dir = os.path.dirname(output_path)
+    os.makedirs(output_dir, exist_ok=True)
+    UsdUtils.ModifyAssetPaths(layer, lambda asset_path: make_relative(asset_path, output_dir))
+    layer.Export(output_path)
+
+    input_files, input_bytes = dependency_footprint(input_path)
+    output_files, output_bytes = dependency_footprint(output_path)
+    print(f"\n[INFO] Wrote '{output_path}' with {len(prototypes)} prototypes.")
+    if unresolved:
+        print(f"[WARNING] Prims left with unresolved external references: {unresolved}")
+    print(f"Input:  {input_files:4d} files, {input_bytes / 2**20:8.1f} MiB, load {load_time(input_path):.3f} s")
+    print(f"Output: {output_files:4d} files, {output_bytes / 2**20:8.1f} MiB, load {load_time(output_path):.3f} s")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
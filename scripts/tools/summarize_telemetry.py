@@ -0,0 +1,74 @@
+"""Summarize the telemetry records written by ``generate_dataset.py --telemetry jsonl``.
+
+The script prints one line per record (or per ``--every`` records) with the throughput and the time split of
+the generation, then the per-subtask success rates, the failure reasons and the queue depths of the last
+record. With several files, such as the ``shard_<i>_telemetry.jsonl`` files of ``generate_dataset_sharded.py``,
+the files are summarized one after the other.
+
+Only the standard library is required.
+
+Usage:
+    python scripts/tools/summarize_telemetry.py ./datasets/generated_dataset_telemetry.jsonl
+    python scripts/tools/summarize_telemetry.py ./datasets/generated_dataset_shards/*_telemetry.jsonl --every 6
+"""
+
+import argparse
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Summarize Mimic generation telemetry records.")
+parser.add_argument("files", type=str, nargs="+", help="Telemetry files (JSON Lines).")
+parser.add_argument("--every", type=int, default=1, help="Print every n-th record.")
+# parse the arguments
+args_cli = parser.parse_args()
+
+"""Rest everything follows."""
+
+import json
+
+
+def read_records(file_path: str) -> list[dict]:
+    """Records of a telemetry file, in order. A run appending to an existing file restarts the time at 0."""
+    with open(file_path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def summarize(file_path: str):
+    """Print the records of one telemetry file."""
+    records = read_records(file_path)
+    print(f"{file_path}: {len(records)} records")
+    if not records:
+        return
+    print(
+        f"{'time (s)':>9} {'demos/min':>10} {'env steps/s':>12} {'trials':>7} {'success':>8}"
+        f" {'step':>6} {'reset':>6} {'generators':>11}"
+    )
+    for index, record in enumerate(records):
+        if index % args_cli.every != 0 and index != len(records) - 1:
+            continue
+        split = record["time_split"]
+        print(
+            f"{record['time']:9.0f} {record['demos_per_min']:10.1f} {record['env_steps_per_s']:12.0f}"
+            f" {record['trials']:7d} {record['success_rate']:8.1%}"
+            f" {split['env_step']:6.1%} {split['env_reset']:6.1%} {split['generators']:11.1%}"
+        )
+
+    last = records[-1]
+    rates = ", ".join(f"{name}: {rate:.1%}" for name, rate in last["subtask_success_rates"].items())
+    print(f"  subtask success rates: {rates}")
+    reasons = ", ".join(f"{reason}: {count}" for reason, count in last["failure_reasons"].items())
+    print(f"  failure reasons: {reasons or 'none'}")
+    depths = ", ".join(
+        f"{name}: mean {depth['mean']:.1f}, max {depth['max']}" for name, depth in last["queue_depths"].items()
+    )
+    print(f"  queue depths (last interval): {depths}")
+
+
+def main():
+    """Summarize every file."""
+    for file_path in args_cli.files:
+        summarize(file_path)
+        print()
+
+
+if __name__ == "__main__":
+    main()